@@ -2,13 +2,39 @@
 Delete articles that were fetched today but published outside current calendar day
 """
 
+import heapq
 import os
-import psycopg2
+import sys
+from collections import Counter
+from psycopg2.pool import ThreadedConnectionPool
 from urllib.parse import urlparse
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from django.db.models import Count
+from django.db.models.functions import TruncDate
 from api.models import NewsArticle
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
+
+# Railway connections are pooled per process so repeated invocations
+# (e.g. via call_command from a scheduler) skip the TCP+TLS+auth handshake
+_railway_pool = None
+
+
+def get_railway_pool(railway_db_url):
+    """Return the process-wide Railway connection pool, creating it on first use"""
+    global _railway_pool
+    if _railway_pool is None:
+        parsed = urlparse(railway_db_url)
+        _railway_pool = ThreadedConnectionPool(
+            minconn=1,
+            maxconn=2,
+            database=parsed.path[1:],
+            user=parsed.username,
+            password=parsed.password,
+            host=parsed.hostname,
+            port=parsed.port
+        )
+    return _railway_pool
 
 
 class Command(BaseCommand):
@@ -26,6 +52,16 @@ class Command(BaseCommand):
             default='railway',
             help='Database: "railway" or "local" (default: railway)'
         )
+        parser.add_argument(
+            '--verbose',
+            action='store_true',
+            help='Show sample articles and per-date breakdown when deleting'
+        )
+        parser.add_argument(
+            '--yes',
+            action='store_true',
+            help='Delete without the interactive confirmation prompt (for cron/scripts)'
+        )
 
     def connect_to_railway(self):
         """Connect to Railway PostgreSQL database"""
@@ -38,26 +74,140 @@ class Command(BaseCommand):
             return None
         
         try:
-            parsed = urlparse(railway_db_url)
-            conn = psycopg2.connect(
-                database=parsed.path[1:],
-                user=parsed.username,
-                password=parsed.password,
-                host=parsed.hostname,
-                port=parsed.port
-            )
+            conn = get_railway_pool(railway_db_url).getconn()
             self.stdout.write(self.style.SUCCESS('✓ Connected to Railway database'))
             return conn
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'❌ Failed to connect to Railway: {e}'))
             return None
 
+    def confirm_deletion(self, count, assume_yes):
+        """Confirm deletion via --yes or an interactive "DELETE" prompt"""
+        self.stdout.write(self.style.ERROR(f'\n⚠️  About to DELETE {count} articles'))
+        
+        if assume_yes:
+            return True
+        
+        if not sys.stdin.isatty():
+            self.stdout.write(self.style.ERROR('❌ No terminal for confirmation - pass --yes to delete non-interactively'))
+            return False
+        
+        return input('Type "DELETE" to confirm: ') == 'DELETE'
+
+    def cleanup_railway(self, conn, range_params, dry_run, verbose, assume_yes):
+        """Delete mismatched articles on Railway via a raw psycopg2 connection"""
+        cursor = conn.cursor()
+        
+        where = """
+            FROM api_newsarticle
+            WHERE fetched_at >= %s AND fetched_at < %s
+            AND (published_at < %s OR published_at >= %s)
+        """
+        columns = "id, headline, published_at, fetched_at, ticker_id, DATE(published_at)"
+        # Rows are only fetched when someone will read the preview
+        show_preview = dry_run or verbose
+        # Waiting on the "DELETE" prompt must not hold row locks on api_newsarticle,
+        # so the interactive path previews with a SELECT and deletes after confirming
+        interactive = not (dry_run or assume_yes)
+        
+        if interactive:
+            if show_preview:
+                # Bounded preview: 10 sample rows plus one row per published date
+                cursor.execute(
+                    f"SELECT {columns} {where} ORDER BY fetched_at DESC LIMIT 10", range_params
+                )
+                sample_rows = cursor.fetchall()
+                cursor.execute(
+                    f"SELECT DATE(published_at), COUNT(*) {where} GROUP BY 1 ORDER BY 1",
+                    range_params
+                )
+                breakdown = cursor.fetchall()
+                count = sum(article_count for _, article_count in breakdown)
+            else:
+                cursor.execute(f"SELECT COUNT(*) {where}", range_params)
+                count = cursor.fetchone()[0]
+        else:
+            # --dry-run / --yes: delete inside an open transaction and build the
+            # preview from the RETURNING rows (one scan of the predicate). A dry
+            # run is rolled back; --yes commits without waiting on anyone
+            returning = f"RETURNING {columns}" if show_preview else ''
+            cursor.execute(f"DELETE {where} {returning}", range_params)
+            
+            if show_preview:
+                matched_rows = cursor.fetchall()
+                count = len(matched_rows)
+                sample_rows = heapq.nlargest(10, matched_rows, key=lambda r: r[3])
+                breakdown = sorted(Counter(row[5] for row in matched_rows).items())
+            else:
+                count = cursor.rowcount
+        
+        if count == 0:
+            self.stdout.write(self.style.SUCCESS('✅ No mismatched articles found!'))
+            conn.rollback()
+            return
+        
+        self.stdout.write(self.style.WARNING(f'Found {count} articles to delete:\n'))
+        
+        if show_preview:
+            # Show sample articles (buffered into a single write)
+            lines = []
+            # Resolve ticker symbols for the sample only, instead of joining
+            # api_ticker against every deleted row
+            cursor.execute(
+                "SELECT id, symbol FROM api_ticker WHERE id = ANY(%s)",
+                [list({row[4] for row in sample_rows})]
+            )
+            symbols = dict(cursor.fetchall())
+            for article_id, headline, published_at, fetched_at, ticker_id, _ in sample_rows:
+                symbol = symbols.get(ticker_id)
+                headline_short = (headline[:60] + '...') if headline and len(headline) > 60 else (headline or 'N/A')
+                lines.append(
+                    f"  • [{symbol or 'N/A'}] {headline_short}\n"
+                    f"    Published: {published_at.date() if published_at else 'N/A'} | "
+                    f"Fetched: {fetched_at.date() if fetched_at else 'N/A'} | "
+                    f"ID: {article_id}"
+                )
+            
+            if count > 10:
+                lines.append(f"\n  ... and {count - 10} more articles")
+            
+            lines.append(f"\n📊 Breakdown by published date:")
+            for pub_date, article_count in breakdown:
+                lines.append(f"  {pub_date}: {article_count} articles")
+            self.stdout.write('\n'.join(lines))
+        
+        if dry_run:
+            conn.rollback()
+            self.stdout.write(self.style.WARNING(f'\n⚠️  DRY RUN: Would delete {count} articles'))
+            self.stdout.write(self.style.WARNING('Run without --dry-run to actually delete'))
+        elif interactive:
+            # End the read transaction before blocking on input()
+            conn.rollback()
+            if self.confirm_deletion(count, assume_yes):
+                cursor.execute(f"DELETE {where}", range_params)
+                deleted_count = cursor.rowcount
+                conn.commit()
+                self.stdout.write(self.style.SUCCESS(f'\n✅ Deleted {deleted_count} articles'))
+            else:
+                self.stdout.write(self.style.ERROR('\n❌ Deletion cancelled'))
+        else:
+            # --yes: confirm_deletion only prints the warning; the DELETE already ran
+            self.confirm_deletion(count, assume_yes)
+            conn.commit()
+            self.stdout.write(self.style.SUCCESS(f'\n✅ Deleted {count} articles'))
+
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         database = options['database']
+        verbose = options['verbose']
+        assume_yes = options['yes']
         
-        # Get current date
+        # Get current date as a half-open [day_start, day_end) range so the
+        # fetched_at/published_at predicates can use their B-tree indexes
         today = timezone.now().date()
+        day_start = timezone.make_aware(datetime.combine(today, time.min))
+        day_end = day_start + timedelta(days=1)
+        range_params = [day_start, day_end, day_start, day_end]
         
         self.stdout.write(self.style.SUCCESS(f'\n🧹 Cleaning up mismatched articles'))
         self.stdout.write(self.style.SUCCESS(f'Today: {today}'))
@@ -69,89 +219,23 @@ class Command(BaseCommand):
             conn = self.connect_to_railway()
             if not conn:
                 return
-            cursor = conn.cursor()
-            
-            # Query Railway database directly
-            cursor.execute("""
-                SELECT na.id, na.headline, na.published_at, na.fetched_at, t.symbol
-                FROM api_newsarticle na
-                LEFT JOIN api_ticker t ON na.ticker_id = t.id
-                WHERE DATE(na.fetched_at) = %s
-                AND DATE(na.published_at) != %s
-                ORDER BY na.fetched_at DESC
-            """, [today, today])
-            
-            rows = cursor.fetchall()
-            count = len(rows)
-            
-            if count == 0:
-                self.stdout.write(self.style.SUCCESS('✅ No mismatched articles found!'))
-                conn.close()
-                return
-            
-            self.stdout.write(self.style.WARNING(f'Found {count} articles to delete:\n'))
-            
-            # Show sample articles
-            for i, (article_id, headline, published_at, fetched_at, symbol) in enumerate(rows[:10]):
-                headline_short = (headline[:60] + '...') if headline and len(headline) > 60 else (headline or 'N/A')
-                self.stdout.write(
-                    f"  • [{symbol or 'N/A'}] {headline_short}\n"
-                    f"    Published: {published_at.date() if published_at else 'N/A'} | "
-                    f"Fetched: {fetched_at.date() if fetched_at else 'N/A'} | "
-                    f"ID: {article_id}"
-                )
-            
-            if count > 10:
-                self.stdout.write(f"\n  ... and {count - 10} more articles")
-            
-            # Get breakdown by published date
-            cursor.execute("""
-                SELECT DATE(published_at) as pub_date, COUNT(*) as cnt
-                FROM api_newsarticle
-                WHERE DATE(fetched_at) = %s
-                AND DATE(published_at) != %s
-                GROUP BY DATE(published_at)
-                ORDER BY pub_date
-            """, [today, today])
-            
-            breakdown = cursor.fetchall()
-            self.stdout.write(f"\n📊 Breakdown by published date:")
-            for pub_date, article_count in breakdown:
-                self.stdout.write(f"  {pub_date}: {article_count} articles")
-            
-            if dry_run:
-                self.stdout.write(self.style.WARNING(f'\n⚠️  DRY RUN: Would delete {count} articles'))
-                self.stdout.write(self.style.WARNING('Run without --dry-run to actually delete'))
-            else:
-                # Confirm deletion
-                self.stdout.write(self.style.ERROR(f'\n⚠️  About to DELETE {count} articles'))
-                response = input('Type "DELETE" to confirm: ')
-                
-                if response == 'DELETE':
-                    # Delete articles
-                    cursor.execute("""
-                        DELETE FROM api_newsarticle
-                        WHERE DATE(fetched_at) = %s
-                        AND DATE(published_at) != %s
-                    """, [today, today])
-                    
-                    deleted_count = cursor.rowcount
-                    conn.commit()
-                    
-                    self.stdout.write(self.style.SUCCESS(f'\n✅ Deleted {deleted_count} articles'))
-                else:
-                    self.stdout.write(self.style.ERROR('\n❌ Deletion cancelled'))
-            
-            conn.close()
+            try:
+                self.cleanup_railway(conn, range_params, dry_run, verbose, assume_yes)
+            finally:
+                # Returns the connection to the pool (rolling back anything uncommitted)
+                _railway_pool.putconn(conn)
         else:
-            # Use local Django ORM
-            mismatched_articles = NewsArticle.objects.filter(
-                fetched_at__date=today,  # Fetched today
+            # Use local Django ORM: the breakdown and delete use the filtered
+            # queryset as a subquery (no large bound pk lists, which SQLite caps);
+            # the IDs are only materialised for the count and the sample
+            mismatched = NewsArticle.objects.filter(
+                fetched_at__gte=day_start, fetched_at__lt=day_end,  # Fetched today
             ).exclude(
-                published_at__date=today  # But NOT published today
-            ).select_related('ticker')
+                published_at__gte=day_start, published_at__lt=day_end  # But NOT published today
+            )
+            article_ids = list(mismatched.order_by('-published_at').values_list('pk', flat=True))
             
-            count = mismatched_articles.count()
+            count = len(article_ids)
             
             if count == 0:
                 self.stdout.write(self.style.SUCCESS('✅ No mismatched articles found!'))
@@ -159,44 +243,45 @@ class Command(BaseCommand):
             
             self.stdout.write(self.style.WARNING(f'Found {count} articles to delete:\n'))
             
-            # Show sample articles
-            sample_articles = mismatched_articles[:10]
-            for article in sample_articles:
-                self.stdout.write(
-                    f"  • [{article.ticker.symbol if article.ticker else 'N/A'}] "
-                    f"{article.headline[:60]}...\n"
-                    f"    Published: {article.published_at.date()} | "
-                    f"Fetched: {article.fetched_at.date()}"
+            # Sample and breakdown queries only run when someone will read them
+            if dry_run or verbose:
+                # Show sample articles (buffered into a single write)
+                lines = []
+                sample_articles = NewsArticle.objects.filter(
+                    pk__in=article_ids[:10]
+                ).select_related('ticker').order_by('-published_at')
+                for article in sample_articles:
+                    lines.append(
+                        f"  • [{article.ticker.symbol if article.ticker else 'N/A'}] "
+                        f"{article.headline[:60]}...\n"
+                        f"    Published: {article.published_at.date()} | "
+                        f"Fetched: {article.fetched_at.date()}"
+                    )
+                
+                if count > 10:
+                    lines.append(f"\n  ... and {count - 10} more articles")
+                
+                # Group by published date for summary (aggregated in the database)
+                by_published_date = (
+                    mismatched
+                    .annotate(pub_date=TruncDate('published_at'))
+                    .values('pub_date')
+                    .annotate(article_count=Count('id'))
+                    .order_by('pub_date')
                 )
-            
-            if count > 10:
-                self.stdout.write(f"\n  ... and {count - 10} more articles")
-            
-            # Group by published date for summary
-            from collections import defaultdict
-            by_published_date = defaultdict(int)
-            for article in mismatched_articles:
-                pub_date = article.published_at.date()
-                by_published_date[pub_date] += 1
-            
-            self.stdout.write(f"\n📊 Breakdown by published date:")
-            for pub_date, article_count in sorted(by_published_date.items()):
-                self.stdout.write(f"  {pub_date}: {article_count} articles")
+                
+                lines.append(f"\n📊 Breakdown by published date:")
+                for row in by_published_date:
+                    lines.append(f"  {row['pub_date']}: {row['article_count']} articles")
+                self.stdout.write('\n'.join(lines))
             
             if dry_run:
                 self.stdout.write(self.style.WARNING(f'\n⚠️  DRY RUN: Would delete {count} articles'))
                 self.stdout.write(self.style.WARNING('Run without --dry-run to actually delete'))
             else:
-                # Confirm deletion
-                self.stdout.write(self.style.ERROR(f'\n⚠️  About to DELETE {count} articles'))
-                response = input('Type "DELETE" to confirm: ')
-                
-                if response == 'DELETE':
-                    # Delete articles
-                    deleted_count = 0
-                    for article in mismatched_articles:
-                        article.delete()
-                        deleted_count += 1
+                if self.confirm_deletion(count, assume_yes):
+                    # Delete by the same predicate (no bound pk list, no per-row round trips)
+                    deleted_count, _ = mismatched.delete()
                     
                     self.stdout.write(self.style.SUCCESS(f'\n✅ Deleted {deleted_count} articles'))
                 else:
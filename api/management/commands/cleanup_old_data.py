@@ -10,10 +10,14 @@ Automatically removes old data based on retention policies:
 Run with: python manage.py cleanup_old_data
 Options:
   --dry-run: Show what would be deleted without actually deleting
-  --verbose: Show detailed deletion information
+  --verbose: Show the cutoff used for each deletion
+  --batch-size: Rows deleted per statement (default: 10000)
+  --workers: Independent tables cleaned concurrently (default: 4)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from django.core.management.base import BaseCommand
+from django.db import connection, connections, transaction
 from django.utils import timezone
 from datetime import timedelta
 from api.models import (
@@ -29,6 +33,122 @@ from api.models import (
     TickerContribution
 )
 
+DEFAULT_DELETE_BATCH_SIZE = 10_000
+DEFAULT_WORKERS = 4
+
+# Retention policies: (model, timestamp field, max age, age label, description, raw)
+# raw=True marks high-churn tables with no dependants: they may be truncated
+# outright and are deleted without Django's cascade collector.
+# Policies in the same group touch related tables (CASCADE / SET_NULL between
+# AnalysisRun, NewsArticle, TickerContribution and Reddit data), so a group runs
+# sequentially on one worker; separate groups run concurrently.
+RETENTION_GROUPS = [
+    [(OHLCVTick, 'timestamp', timedelta(hours=1), '1 hour', 'OHLCVTick (raw ticks)', True)],
+    [(SecondSnapshot, 'timestamp', timedelta(hours=48), '48 hours', 'SecondSnapshot (1-second candles)', True)],
+    [(TickCandle100, 'completed_at', timedelta(hours=48), '48 hours', 'TickCandle100 (100-tick candles)', True)],
+    [
+        (AnalysisRun, 'timestamp', timedelta(days=7), '7 days', 'AnalysisRun', False),
+        (NewsArticle, 'published_at', timedelta(days=7), '7 days', 'NewsArticle', False),
+        (RedditPost, 'created_utc', timedelta(days=7), '7 days', 'RedditPost', False),
+        # Cascade deletes with RedditPost, but clean orphans
+        (RedditComment, 'created_utc', timedelta(days=7), '7 days', 'RedditComment', False),
+        (RedditAnalysisRun, 'timestamp', timedelta(days=7), '7 days', 'RedditAnalysisRun', False),
+        # Linked to AnalysisRun, will cascade, but clean orphans
+        (TickerContribution, 'created_at', timedelta(days=7), '7 days', 'TickerContribution', False),
+    ],
+    # SentimentHistory - Keep longer for historical trending (30 days)
+    [(SentimentHistory, 'date', timedelta(days=30), '30 days', 'SentimentHistory', False)],
+]
+
+
+def batched_delete(queryset, batch_size=DEFAULT_DELETE_BATCH_SIZE, raw=False):
+    """
+    Delete rows matching queryset in bounded batches.
+
+    Each batch runs as its own short transaction, keeping lock footprint
+    and WAL volume bounded on large time-series tables.
+    With raw=True each batch is a plain DELETE that skips Django's
+    collector (no cascade lookups, no signals) - only safe for tables
+    that nothing references and that have no delete signal receivers.
+    Returns the total number of rows deleted (including cascades).
+    """
+    model = queryset.model
+    pk_query = queryset.order_by().values_list('pk', flat=True)
+    total = 0
+    while True:
+        ids = list(pk_query[:batch_size])
+        if not ids:
+            break
+        batch = model.objects.filter(pk__in=ids)
+        if raw:
+            total += batch._raw_delete(batch.db)
+        else:
+            deleted, _ = batch.delete()
+            total += deleted
+    return total
+
+
+def truncate_if_fully_expired(model, field, cutoff):
+    """
+    TRUNCATE a time-series table when every row in it is older than cutoff.
+
+    Only used for the high-churn tick/candle tables, which nothing references
+    by foreign key. Outside market hours these expire completely, and a
+    TRUNCATE reclaims the space immediately instead of leaving dead tuples
+    for autovacuum. PostgreSQL only.
+    Returns the number of rows removed, or None if the table still holds
+    live rows (caller should fall back to batched_delete).
+    """
+    if connection.vendor != 'postgresql':
+        return None
+
+    live_rows = model.objects.filter(**{f'{field}__gte': cutoff})
+    if live_rows.exists():
+        return None
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            # Re-check under lock so ticks written by the collector meanwhile are kept
+            cursor.execute(f'LOCK TABLE ONLY {table} IN ACCESS EXCLUSIVE MODE')
+            if live_rows.exists():
+                return None
+            expired = model.objects.count()
+            if expired:
+                cursor.execute(f'TRUNCATE ONLY {table}')
+    return expired
+
+
+def delete_reddit_posts_and_comments(cutoff):
+    """
+    Delete expired RedditPosts and RedditComments in one statement (PostgreSQL only).
+
+    Comments are removed if they are old themselves, belong to a deleted post,
+    or reply (transitively) to a removed comment - the same set Django's
+    CASCADE collector would produce, but without scanning comments twice.
+    Returns (posts deleted, comments deleted).
+    """
+    posts = connection.ops.quote_name(RedditPost._meta.db_table)
+    comments = connection.ops.quote_name(RedditComment._meta.db_table)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                WITH RECURSIVE del_posts AS (
+                    DELETE FROM {posts} WHERE created_utc < %s RETURNING id
+                ),
+                doomed(id) AS (
+                    SELECT id FROM {comments}
+                    WHERE created_utc < %s OR post_id IN (SELECT id FROM del_posts)
+                    UNION
+                    SELECT c.id FROM {comments} c JOIN doomed d ON c.parent_comment_id = d.id
+                ),
+                del_comments AS (
+                    DELETE FROM {comments} WHERE id IN (SELECT id FROM doomed) RETURNING id
+                )
+                SELECT (SELECT COUNT(*) FROM del_posts), (SELECT COUNT(*) FROM del_comments)
+            """, [cutoff, cutoff])
+            return cursor.fetchone()
+
 
 class Command(BaseCommand):
     help = 'Clean up old data based on retention policies'
@@ -42,188 +162,108 @@ class Command(BaseCommand):
         parser.add_argument(
             '--verbose',
             action='store_true',
-            help='Show detailed deletion information'
+            help='Show the cutoff used for each deletion'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_DELETE_BATCH_SIZE,
+            help=f'Rows deleted per statement (default: {DEFAULT_DELETE_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help=f'Independent tables cleaned concurrently (default: {DEFAULT_WORKERS})'
         )
 
+    def apply_retention_group(self, group, now, dry_run, batch_size):
+        """
+        Apply each policy in group sequentially on the calling thread.
+        Returns a list of (policy, cutoff, record count) tuples.
+        """
+        results = []
+        reddit_comments_deleted = None
+        for policy in group:
+            model, field, max_age, _, _, raw = policy
+            cutoff = now - max_age
+            if field == 'date':
+                cutoff = cutoff.date()
+            expired = model.objects.filter(**{f'{field}__lt': cutoff})
+
+            if dry_run:
+                count = expired.count()
+            elif model is RedditPost and connection.vendor == 'postgresql':
+                count, reddit_comments_deleted = delete_reddit_posts_and_comments(cutoff)
+            elif model is RedditComment and reddit_comments_deleted is not None:
+                count = reddit_comments_deleted
+            else:
+                count = truncate_if_fully_expired(model, field, cutoff) if raw else None
+                if count is None:
+                    count = batched_delete(expired, batch_size, raw=raw)
+            results.append((policy, cutoff, count))
+        return results
+
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         verbose = options['verbose']
+        batch_size = options['batch_size']
+        # SQLite serialises writers anyway, so only fan out on PostgreSQL
+        workers = options['workers'] if connection.vendor == 'postgresql' else 1
 
         self.stdout.write(self.style.SUCCESS(
             '\n' + '='*70 + '\n'
-            '🧹 Data Cleanup - Starting\n'
-            '='*70
+            + '🧹 Data Cleanup - Starting\n'
+            + '='*70
         ))
 
         if dry_run:
             self.stdout.write(self.style.WARNING('🔍 DRY RUN MODE - No data will be deleted\n'))
 
         total_deleted = 0
-
-        # ====================================================================
-        # 1. OHLCVTick - Keep only 1 hour
-        # ====================================================================
-        cutoff_1h = timezone.now() - timedelta(hours=1)
-
-        if verbose or dry_run:
-            count = OHLCVTick.objects.filter(timestamp__lt=cutoff_1h).count()
-            self.stdout.write(
-                f'📊 OHLCVTick (raw ticks): {count:,} records older than 1 hour'
-            )
-
-        if not dry_run:
-            deleted = OHLCVTick.objects.filter(timestamp__lt=cutoff_1h).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} OHLCVTick records'
-            ))
-
-        # ====================================================================
-        # 2. SecondSnapshot - Keep 48 hours
-        # ====================================================================
-        cutoff_48h = timezone.now() - timedelta(hours=48)
-
-        if verbose or dry_run:
-            count = SecondSnapshot.objects.filter(timestamp__lt=cutoff_48h).count()
-            self.stdout.write(
-                f'📊 SecondSnapshot (1-second candles): {count:,} records older than 48 hours'
-            )
-
-        if not dry_run:
-            deleted = SecondSnapshot.objects.filter(timestamp__lt=cutoff_48h).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} SecondSnapshot records'
-            ))
-
-        # ====================================================================
-        # 3. TickCandle100 - Keep 48 hours
-        # ====================================================================
-        if verbose or dry_run:
-            count = TickCandle100.objects.filter(completed_at__lt=cutoff_48h).count()
-            self.stdout.write(
-                f'📊 TickCandle100 (100-tick candles): {count:,} records older than 48 hours'
-            )
-
-        if not dry_run:
-            deleted = TickCandle100.objects.filter(completed_at__lt=cutoff_48h).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} TickCandle100 records'
-            ))
-
-        # ====================================================================
-        # 4. Everything else - Keep 7 days
-        # ====================================================================
-        cutoff_7d = timezone.now() - timedelta(days=7)
-
-        # AnalysisRun
-        if verbose or dry_run:
-            count = AnalysisRun.objects.filter(timestamp__lt=cutoff_7d).count()
-            self.stdout.write(
-                f'📊 AnalysisRun: {count:,} records older than 7 days'
-            )
-
-        if not dry_run:
-            deleted = AnalysisRun.objects.filter(timestamp__lt=cutoff_7d).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} AnalysisRun records'
-            ))
-
-        # NewsArticle
-        if verbose or dry_run:
-            count = NewsArticle.objects.filter(published_at__lt=cutoff_7d).count()
-            self.stdout.write(
-                f'📊 NewsArticle: {count:,} records older than 7 days'
-            )
-
-        if not dry_run:
-            deleted = NewsArticle.objects.filter(published_at__lt=cutoff_7d).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} NewsArticle records'
-            ))
-
-        # RedditPost
-        if verbose or dry_run:
-            count = RedditPost.objects.filter(created_utc__lt=cutoff_7d).count()
-            self.stdout.write(
-                f'📊 RedditPost: {count:,} records older than 7 days'
-            )
-
-        if not dry_run:
-            deleted = RedditPost.objects.filter(created_utc__lt=cutoff_7d).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} RedditPost records'
-            ))
-
-        # RedditComment (cascade deletes with RedditPost, but clean orphans)
-        if verbose or dry_run:
-            count = RedditComment.objects.filter(created_utc__lt=cutoff_7d).count()
-            self.stdout.write(
-                f'📊 RedditComment: {count:,} records older than 7 days'
-            )
-
-        if not dry_run:
-            deleted = RedditComment.objects.filter(created_utc__lt=cutoff_7d).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} RedditComment records'
-            ))
-
-        # RedditAnalysisRun
-        if verbose or dry_run:
-            count = RedditAnalysisRun.objects.filter(timestamp__lt=cutoff_7d).count()
-            self.stdout.write(
-                f'📊 RedditAnalysisRun: {count:,} records older than 7 days'
-            )
-
-        if not dry_run:
-            deleted = RedditAnalysisRun.objects.filter(timestamp__lt=cutoff_7d).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} RedditAnalysisRun records'
-            ))
-
-        # TickerContribution (linked to AnalysisRun, will cascade, but clean orphans)
-        if verbose or dry_run:
-            count = TickerContribution.objects.filter(created_at__lt=cutoff_7d).count()
-            self.stdout.write(
-                f'📊 TickerContribution: {count:,} records older than 7 days'
-            )
-
-        if not dry_run:
-            deleted = TickerContribution.objects.filter(created_at__lt=cutoff_7d).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} TickerContribution records'
-            ))
-
-        # SentimentHistory - Keep longer for historical trending (30 days)
-        cutoff_30d = timezone.now() - timedelta(days=30)
-
-        if verbose or dry_run:
-            count = SentimentHistory.objects.filter(date__lt=cutoff_30d.date()).count()
-            self.stdout.write(
-                f'📊 SentimentHistory: {count:,} records older than 30 days'
-            )
-
-        if not dry_run:
-            deleted = SentimentHistory.objects.filter(date__lt=cutoff_30d.date()).delete()
-            total_deleted += deleted[0]
-            self.stdout.write(self.style.SUCCESS(
-                f'   ✅ Deleted {deleted[0]:,} SentimentHistory records'
-            ))
+        # Single snapshot so every retention cutoff is measured from the same instant
+        now = timezone.now()
+
+        if workers > 1:
+            def run_group_in_worker(group):
+                try:
+                    return self.apply_retention_group(group, now, dry_run, batch_size)
+                finally:
+                    # Each worker thread opens its own DB connection; don't leak it
+                    connections.close_all()
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                group_results = list(executor.map(run_group_in_worker, RETENTION_GROUPS))
+        else:
+            group_results = [
+                self.apply_retention_group(group, now, dry_run, batch_size)
+                for group in RETENTION_GROUPS
+            ]
+
+        # Report in policy order regardless of which worker finished first,
+        # buffered into a single write
+        report = []
+        for results in group_results:
+            for (model, _, _, age_label, description, _), cutoff, count in results:
+                if dry_run:
+                    report.append(
+                        f'📊 {description}: {count:,} records older than {age_label}'
+                    )
+                else:
+                    total_deleted += count
+                    report.append(self.style.SUCCESS(
+                        f'   ✅ Deleted {count:,} {model.__name__} records'
+                        + (f' (cutoff {cutoff})' if verbose else '')
+                    ))
+        self.stdout.write('\n'.join(report))
 
         # ====================================================================
         # Summary
         # ====================================================================
         self.stdout.write(self.style.SUCCESS(
             '\n' + '='*70 + '\n'
-            f'🎉 Cleanup Complete\n'
-            '='*70
+            + '🎉 Cleanup Complete\n'
+            + '='*70
         ))
 
         if dry_run:
@@ -235,12 +275,13 @@ class Command(BaseCommand):
                 f'✅ Total records deleted: {total_deleted:,}'
             ))
 
-        self.stdout.write('\n📋 Retention Policy Applied:')
-        self.stdout.write('   • OHLCVTick: 1 hour')
-        self.stdout.write('   • SecondSnapshot: 48 hours')
-        self.stdout.write('   • TickCandle100: 48 hours')
-        self.stdout.write('   • AnalysisRun: 7 days')
-        self.stdout.write('   • NewsArticle: 7 days')
-        self.stdout.write('   • Reddit data: 7 days')
-        self.stdout.write('   • SentimentHistory: 30 days')
-        self.stdout.write('')
+        self.stdout.write(
+            '\n📋 Retention Policy Applied:\n'
+            '   • OHLCVTick: 1 hour\n'
+            '   • SecondSnapshot: 48 hours\n'
+            '   • TickCandle100: 48 hours\n'
+            '   • AnalysisRun: 7 days\n'
+            '   • NewsArticle: 7 days\n'
+            '   • Reddit data: 7 days\n'
+            '   • SentimentHistory: 30 days\n'
+        )
@@ -4,16 +4,130 @@ Exports to CSV and JSON for analysis and charting
 """
 
 import os
-import json
 import csv
+import orjson
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.db import connection
+from django.db.models import F, FloatField, Count, Min, Max, Avg, Sum
+from django.db.models.functions import Cast
 from api.models import SecondSnapshot, AnalysisRun, Ticker
 import psycopg2
 from urllib.parse import urlparse
 
+# Rows fetched per round trip when streaming exports
+STREAM_CHUNK_SIZE = 5000
+
+# Export file buffer size (large sequential writes instead of 8KB chunks)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Export column order, shared by the local ORM path and the Railway SQL below
+SECOND_SNAPSHOT_COLUMNS = (
+    'id', 'ticker_symbol', 'timestamp', 'ohlc_1sec_open', 'ohlc_1sec_high',
+    'ohlc_1sec_low', 'ohlc_1sec_close', 'ohlc_1sec_volume', 'ohlc_1sec_tick_count',
+    'composite_score', 'news_score_cached', 'technical_score_cached', 'source', 'created_at',
+)
+
+ANALYSIS_RUN_COLUMNS = (
+    'id', 'ticker_symbol', 'timestamp', 'composite_score', 'sentiment_label',
+    'avg_base_sentiment', 'avg_surprise_factor', 'avg_novelty', 'avg_source_credibility',
+    'avg_recency_weight', 'stock_price', 'price_open', 'price_high', 'price_low',
+    'price_change_percent', 'volume', 'articles_analyzed', 'cached_articles', 'new_articles',
+    'rsi_14', 'macd', 'macd_signal', 'macd_histogram', 'technical_composite_score',
+    'reddit_sentiment', 'reddit_posts_analyzed', 'analyst_recommendations_score',
+)
+
+# DecimalField columns exported as floats (cast in SQL on both paths)
+DECIMAL_COLUMNS = {
+    'ohlc_1sec_open', 'ohlc_1sec_high', 'ohlc_1sec_low', 'ohlc_1sec_close',
+    'stock_price', 'price_open', 'price_high', 'price_low',
+}
+
+# Raw SQL used on Railway, both for row streaming and COPY ... TO STDOUT
+SECOND_SNAPSHOT_QUERY = """
+    SELECT
+        ss.id,
+        t.symbol as ticker_symbol,
+        ss.timestamp,
+        ss.ohlc_1sec_open::double precision AS ohlc_1sec_open,
+        ss.ohlc_1sec_high::double precision AS ohlc_1sec_high,
+        ss.ohlc_1sec_low::double precision AS ohlc_1sec_low,
+        ss.ohlc_1sec_close::double precision AS ohlc_1sec_close,
+        ss.ohlc_1sec_volume,
+        ss.ohlc_1sec_tick_count,
+        ss.composite_score,
+        ss.news_score_cached,
+        ss.technical_score_cached,
+        ss.source,
+        ss.created_at
+    FROM api_second_snapshot ss
+    JOIN api_ticker t ON ss.ticker_id = t.id
+    WHERE ss.timestamp >= %s AND ss.timestamp < %s
+    ORDER BY ss.timestamp ASC
+"""
+
+ANALYSIS_RUN_QUERY = """
+    SELECT
+        ar.id,
+        t.symbol as ticker_symbol,
+        ar.timestamp,
+        ar.composite_score,
+        ar.sentiment_label,
+        ar.avg_base_sentiment,
+        ar.avg_surprise_factor,
+        ar.avg_novelty,
+        ar.avg_source_credibility,
+        ar.avg_recency_weight,
+        ar.stock_price::double precision AS stock_price,
+        ar.price_open::double precision AS price_open,
+        ar.price_high::double precision AS price_high,
+        ar.price_low::double precision AS price_low,
+        ar.price_change_percent,
+        ar.volume,
+        ar.articles_analyzed,
+        ar.cached_articles,
+        ar.new_articles,
+        ar.rsi_14,
+        ar.macd,
+        ar.macd_signal,
+        ar.macd_histogram,
+        ar.technical_composite_score,
+        ar.reddit_sentiment,
+        ar.reddit_posts_analyzed,
+        ar.analyst_recommendations_score
+    FROM api_analysisrun ar
+    JOIN api_ticker t ON ar.ticker_id = t.id
+    WHERE ar.timestamp >= %s AND ar.timestamp < %s
+    ORDER BY ar.timestamp ASC
+"""
+
+# Per-table aggregate backing the printed summary ({articles} is SUM(...) or 0)
+SUMMARY_QUERY = """
+    SELECT
+        COUNT(*),
+        array_agg(DISTINCT t.symbol),
+        MIN(x.timestamp),
+        MAX(x.timestamp),
+        MIN(x.composite_score),
+        MAX(x.composite_score),
+        AVG(x.composite_score),
+        {articles}
+    FROM {table} x
+    JOIN api_ticker t ON x.ticker_id = t.id
+    WHERE x.timestamp >= %s AND x.timestamp < %s
+"""
+
+
+def orm_columns(columns):
+    """Map export columns to values_list() arguments (ticker join, Decimal -> float)"""
+    return [
+        F('ticker__symbol') if column == 'ticker_symbol'
+        else Cast(column, FloatField()) if column in DECIMAL_COLUMNS
+        else column
+        for column in columns
+    ]
+
 
 class Command(BaseCommand):
     help = 'Extract today\'s SecondSnapshot and AnalysisRun data from Railway database'
@@ -40,7 +154,7 @@ class Command(BaseCommand):
             '--format',
             type=str,
             default='both',
-            help='Output format: "csv", "json", or "both" (default: both)'
+            help='Output format: "csv", "json", "both", or "none" for the summary only (default: both)'
         )
 
     def handle(self, *args, **options):
@@ -74,25 +188,49 @@ class Command(BaseCommand):
             conn = connection
 
         try:
-            # Extract SecondSnapshot data
-            self.stdout.write('Extracting SecondSnapshot data...')
-            second_snapshots = self.extract_second_snapshots(conn, target_date, database)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            date_str = target_date.strftime('%Y%m%d')
 
-            # Extract AnalysisRun data
-            self.stdout.write('Extracting AnalysisRun data...')
-            analysis_runs = self.extract_analysis_runs(conn, target_date, database)
+            # On Railway, CSV is produced server-side with COPY ... TO STDOUT, so
+            # the Python row stream only feeds JSON
+            copy_csv = database == 'railway' and output_format in ['csv', 'both']
+            row_format = output_format
+            if copy_csv:
+                row_format = 'json' if output_format == 'both' else 'none'
 
-            # Export data
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Summary stats come from one aggregate query per table, so rows are
+            # only pulled over the wire when a file actually needs them
+            snapshot_stats, run_stats = self.extract_summary(conn, target_date, database)
 
-            if output_format in ['csv', 'both']:
-                self.export_to_csv(second_snapshots, analysis_runs, output_dir, target_date, timestamp)
+            if database == 'railway' and row_format != 'none':
+                self.declare_railway_cursors(conn, target_date)
 
-            if output_format in ['json', 'both']:
-                self.export_to_json(second_snapshots, analysis_runs, output_dir, target_date, timestamp)
+            # Each dataset is streamed once: rows flow straight from the DB cursor
+            # into the CSV/JSON writers, never held in memory
+            self.stdout.write('Extracting SecondSnapshot data...')
+            snapshot_base = f'{output_dir}/second_snapshots_{date_str}_{timestamp}'
+            if snapshot_stats['count']:
+                if row_format != 'none':
+                    self.export_rows(
+                        self.extract_second_snapshots(conn, target_date, database),
+                        SECOND_SNAPSHOT_COLUMNS, 'SecondSnapshots', snapshot_base, row_format
+                    )
+                if copy_csv:
+                    self.copy_to_csv(conn, SECOND_SNAPSHOT_QUERY, target_date, 'SecondSnapshots', snapshot_base)
+
+            self.stdout.write('Extracting AnalysisRun data...')
+            run_base = f'{output_dir}/analysis_runs_{date_str}_{timestamp}'
+            if run_stats['count']:
+                if row_format != 'none':
+                    self.export_rows(
+                        self.extract_analysis_runs(conn, target_date, database),
+                        ANALYSIS_RUN_COLUMNS, 'AnalysisRuns', run_base, row_format
+                    )
+                if copy_csv:
+                    self.copy_to_csv(conn, ANALYSIS_RUN_QUERY, target_date, 'AnalysisRuns', run_base)
 
             # Print summary statistics
-            self.print_summary(second_snapshots, analysis_runs, target_date)
+            self.print_summary(snapshot_stats, run_stats, target_date)
 
         finally:
             if database == 'railway' and conn:
@@ -133,212 +271,183 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f'❌ Failed to connect to Railway: {str(e)}'))
             return None
 
-    def extract_second_snapshots(self, conn, target_date, database):
-        """Extract SecondSnapshot data for the target date"""
+    def get_day_range(self, target_date):
+        """Return the half-open [start, end) datetime range covering the target date"""
         start_datetime = timezone.make_aware(datetime.combine(target_date, datetime.min.time()))
-        end_datetime = timezone.make_aware(datetime.combine(target_date, datetime.max.time()))
+        end_datetime = start_datetime + timedelta(days=1)
+        return start_datetime, end_datetime
+
+    def extract_summary(self, conn, target_date, database):
+        """Return (snapshot_stats, run_stats) computed by the database"""
+        start_datetime, end_datetime = self.get_day_range(target_date)
+        keys = ('count', 'tickers', 'first_ts', 'last_ts', 'score_min', 'score_max', 'score_avg', 'articles')
 
         if database == 'railway':
-            # Raw SQL query for Railway
             cursor = conn.cursor()
-            query = """
-                SELECT
-                    ss.id,
-                    t.symbol as ticker_symbol,
-                    ss.timestamp,
-                    ss.ohlc_1sec_open,
-                    ss.ohlc_1sec_high,
-                    ss.ohlc_1sec_low,
-                    ss.ohlc_1sec_close,
-                    ss.ohlc_1sec_volume,
-                    ss.ohlc_1sec_tick_count,
-                    ss.composite_score,
-                    ss.news_score_cached,
-                    ss.technical_score_cached,
-                    ss.source,
-                    ss.created_at
-                FROM api_second_snapshot ss
-                JOIN api_ticker t ON ss.ticker_id = t.id
-                WHERE ss.timestamp >= %s AND ss.timestamp <= %s
-                ORDER BY ss.timestamp ASC
-            """
-            cursor.execute(query, [start_datetime, end_datetime])
-
-            columns = [desc[0] for desc in cursor.description]
-            data = []
-            for row in cursor.fetchall():
-                data.append(dict(zip(columns, row)))
+            try:
+                results = []
+                for table, articles in (
+                    ('api_second_snapshot', '0'),
+                    ('api_analysisrun', 'COALESCE(SUM(x.articles_analyzed), 0)'),
+                ):
+                    cursor.execute(
+                        SUMMARY_QUERY.format(table=table, articles=articles),
+                        [start_datetime, end_datetime]
+                    )
+                    stats = dict(zip(keys, cursor.fetchone()))
+                    stats['tickers'] = stats['tickers'] or []
+                    results.append(stats)
+            finally:
+                cursor.close()
+            return tuple(results)
+
+        # Django ORM for local
+        results = []
+        for model, articles in (
+            (SecondSnapshot, None),
+            (AnalysisRun, Sum('articles_analyzed')),
+        ):
+            queryset = model.objects.filter(
+                timestamp__gte=start_datetime,
+                timestamp__lt=end_datetime
+            )
+            aggregates = {
+                'count': Count('id'),
+                'first_ts': Min('timestamp'),
+                'last_ts': Max('timestamp'),
+                'score_min': Min('composite_score'),
+                'score_max': Max('composite_score'),
+                'score_avg': Avg('composite_score'),
+            }
+            if articles is not None:
+                aggregates['articles'] = articles
+            stats = queryset.aggregate(**aggregates)
+            stats['articles'] = stats.get('articles') or 0
+            stats['tickers'] = list(
+                queryset.order_by().values_list('ticker__symbol', flat=True).distinct()
+            )
+            results.append(stats)
+        return tuple(results)
+
+    def declare_railway_cursors(self, conn, target_date):
+        """
+        Declare the server-side cursors for both Railway exports in one round trip.
+        extract_second_snapshots/extract_analysis_runs then stream from them by name.
+        """
+        day_range = list(self.get_day_range(target_date))
+        cursor = conn.cursor()
+        cursor.execute(
+            # Timestamp B-tree indexes already serve the range scan and ORDER BY;
+            # extra work_mem keeps any residual sort for a full day in memory
+            "SET LOCAL work_mem = '256MB';"
+            f"DECLARE second_snapshot_export NO SCROLL CURSOR FOR {SECOND_SNAPSHOT_QUERY};"
+            f"DECLARE analysis_run_export NO SCROLL CURSOR FOR {ANALYSIS_RUN_QUERY};",
+            day_range + day_range
+        )
+        cursor.close()
 
-            cursor.close()
-            return data
+    def extract_second_snapshots(self, conn, target_date, database):
+        """Yield SecondSnapshot rows (tuples in SECOND_SNAPSHOT_COLUMNS order) for the target date"""
+        start_datetime, end_datetime = self.get_day_range(target_date)
+
+        if database == 'railway':
+            # Railway: consume the server-side cursor opened by declare_railway_cursors
+            cursor = conn.cursor(name='second_snapshot_export')
+            cursor.itersize = STREAM_CHUNK_SIZE
+            yield from self.stream_cursor(cursor)
         else:
-            # Django ORM for local
+            # Django ORM for local: plain tuples straight from the cursor, no model instances
             snapshots = SecondSnapshot.objects.filter(
                 timestamp__gte=start_datetime,
-                timestamp__lte=end_datetime
-            ).select_related('ticker').order_by('timestamp')
-
-            return [
-                {
-                    'id': snap.id,
-                    'ticker_symbol': snap.ticker.symbol,
-                    'timestamp': snap.timestamp,
-                    'ohlc_1sec_open': float(snap.ohlc_1sec_open),
-                    'ohlc_1sec_high': float(snap.ohlc_1sec_high),
-                    'ohlc_1sec_low': float(snap.ohlc_1sec_low),
-                    'ohlc_1sec_close': float(snap.ohlc_1sec_close),
-                    'ohlc_1sec_volume': snap.ohlc_1sec_volume,
-                    'ohlc_1sec_tick_count': snap.ohlc_1sec_tick_count,
-                    'composite_score': snap.composite_score,
-                    'news_score_cached': snap.news_score_cached,
-                    'technical_score_cached': snap.technical_score_cached,
-                    'source': snap.source,
-                    'created_at': snap.created_at,
-                }
-                for snap in snapshots
-            ]
+                timestamp__lt=end_datetime
+            ).order_by('timestamp').values_list(*orm_columns(SECOND_SNAPSHOT_COLUMNS))
+
+            yield from snapshots.iterator(chunk_size=STREAM_CHUNK_SIZE)
 
     def extract_analysis_runs(self, conn, target_date, database):
-        """Extract AnalysisRun data for the target date"""
-        start_datetime = timezone.make_aware(datetime.combine(target_date, datetime.min.time()))
-        end_datetime = timezone.make_aware(datetime.combine(target_date, datetime.max.time()))
+        """Yield AnalysisRun rows (tuples in ANALYSIS_RUN_COLUMNS order) for the target date"""
+        start_datetime, end_datetime = self.get_day_range(target_date)
 
         if database == 'railway':
-            # Raw SQL query for Railway
-            cursor = conn.cursor()
-            query = """
-                SELECT
-                    ar.id,
-                    t.symbol as ticker_symbol,
-                    ar.timestamp,
-                    ar.composite_score,
-                    ar.sentiment_label,
-                    ar.avg_base_sentiment,
-                    ar.avg_surprise_factor,
-                    ar.avg_novelty,
-                    ar.avg_source_credibility,
-                    ar.avg_recency_weight,
-                    ar.stock_price,
-                    ar.price_open,
-                    ar.price_high,
-                    ar.price_low,
-                    ar.price_change_percent,
-                    ar.volume,
-                    ar.articles_analyzed,
-                    ar.cached_articles,
-                    ar.new_articles,
-                    ar.rsi_14,
-                    ar.macd,
-                    ar.macd_signal,
-                    ar.macd_histogram,
-                    ar.technical_composite_score,
-                    ar.reddit_sentiment,
-                    ar.reddit_posts_analyzed,
-                    ar.analyst_recommendations_score
-                FROM api_analysisrun ar
-                JOIN api_ticker t ON ar.ticker_id = t.id
-                WHERE ar.timestamp >= %s AND ar.timestamp <= %s
-                ORDER BY ar.timestamp ASC
-            """
-            cursor.execute(query, [start_datetime, end_datetime])
-
-            columns = [desc[0] for desc in cursor.description]
-            data = []
-            for row in cursor.fetchall():
-                data.append(dict(zip(columns, row)))
-
-            cursor.close()
-            return data
+            # Railway: consume the server-side cursor opened by declare_railway_cursors
+            cursor = conn.cursor(name='analysis_run_export')
+            cursor.itersize = STREAM_CHUNK_SIZE
+            yield from self.stream_cursor(cursor)
         else:
-            # Django ORM for local
+            # Django ORM for local: plain tuples straight from the cursor, no model instances
             runs = AnalysisRun.objects.filter(
                 timestamp__gte=start_datetime,
-                timestamp__lte=end_datetime
-            ).select_related('ticker').order_by('timestamp')
-
-            return [
-                {
-                    'id': run.id,
-                    'ticker_symbol': run.ticker.symbol,
-                    'timestamp': run.timestamp,
-                    'composite_score': run.composite_score,
-                    'sentiment_label': run.sentiment_label,
-                    'avg_base_sentiment': run.avg_base_sentiment,
-                    'avg_surprise_factor': run.avg_surprise_factor,
-                    'avg_novelty': run.avg_novelty,
-                    'avg_source_credibility': run.avg_source_credibility,
-                    'avg_recency_weight': run.avg_recency_weight,
-                    'stock_price': float(run.stock_price),
-                    'price_open': float(run.price_open) if run.price_open else None,
-                    'price_high': float(run.price_high) if run.price_high else None,
-                    'price_low': float(run.price_low) if run.price_low else None,
-                    'price_change_percent': run.price_change_percent,
-                    'volume': run.volume,
-                    'articles_analyzed': run.articles_analyzed,
-                    'cached_articles': run.cached_articles,
-                    'new_articles': run.new_articles,
-                    'rsi_14': run.rsi_14,
-                    'macd': run.macd,
-                    'macd_signal': run.macd_signal,
-                    'macd_histogram': run.macd_histogram,
-                    'technical_composite_score': run.technical_composite_score,
-                    'reddit_sentiment': run.reddit_sentiment,
-                    'reddit_posts_analyzed': run.reddit_posts_analyzed,
-                    'analyst_recommendations_score': run.analyst_recommendations_score,
-                }
-                for run in runs
-            ]
-
-    def export_to_csv(self, second_snapshots, analysis_runs, output_dir, target_date, timestamp):
-        """Export data to CSV files"""
-        date_str = target_date.strftime('%Y%m%d')
-
-        # Export SecondSnapshots
-        if second_snapshots:
-            filename = f'{output_dir}/second_snapshots_{date_str}_{timestamp}.csv'
-            with open(filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=second_snapshots[0].keys())
-                writer.writeheader()
-                writer.writerows(second_snapshots)
-            self.stdout.write(self.style.SUCCESS(f'✓ Exported SecondSnapshots to {filename}'))
-
-        # Export AnalysisRuns
-        if analysis_runs:
-            filename = f'{output_dir}/analysis_runs_{date_str}_{timestamp}.csv'
-            with open(filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=analysis_runs[0].keys())
-                writer.writeheader()
-                writer.writerows(analysis_runs)
-            self.stdout.write(self.style.SUCCESS(f'✓ Exported AnalysisRuns to {filename}'))
-
-    def export_to_json(self, second_snapshots, analysis_runs, output_dir, target_date, timestamp):
-        """Export data to JSON files"""
-        date_str = target_date.strftime('%Y%m%d')
-
-        # Helper to serialize datetime and decimal objects
-        def json_serial(obj):
-            from decimal import Decimal
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            elif isinstance(obj, Decimal):
-                return float(obj)
-            raise TypeError(f'Type {type(obj)} not serializable')
-
-        # Export SecondSnapshots
-        if second_snapshots:
-            filename = f'{output_dir}/second_snapshots_{date_str}_{timestamp}.json'
-            with open(filename, 'w') as f:
-                json.dump(second_snapshots, f, indent=2, default=json_serial)
-            self.stdout.write(self.style.SUCCESS(f'✓ Exported SecondSnapshots to {filename}'))
-
-        # Export AnalysisRuns
-        if analysis_runs:
-            filename = f'{output_dir}/analysis_runs_{date_str}_{timestamp}.json'
-            with open(filename, 'w') as f:
-                json.dump(analysis_runs, f, indent=2, default=json_serial)
-            self.stdout.write(self.style.SUCCESS(f'✓ Exported AnalysisRuns to {filename}'))
-
-    def print_summary(self, second_snapshots, analysis_runs, target_date):
+                timestamp__lt=end_datetime
+            ).order_by('timestamp').values_list(*orm_columns(ANALYSIS_RUN_COLUMNS))
+
+            yield from runs.iterator(chunk_size=STREAM_CHUNK_SIZE)
+
+    def copy_to_csv(self, conn, query, target_date, label, base_filename):
+        """Export a Railway query straight to CSV with COPY ... TO STDOUT"""
+        cursor = conn.cursor()
+        try:
+            select = cursor.mogrify(query, list(self.get_day_range(target_date))).decode()
+            with open(f'{base_filename}.csv', 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                cursor.copy_expert(f'COPY ({select}) TO STDOUT WITH CSV HEADER', f)
+        finally:
+            cursor.close()
+        self.stdout.write(self.style.SUCCESS(f'✓ Exported {label} to {base_filename}.csv'))
+
+    def stream_cursor(self, cursor):
+        """Yield row tuples from a server-side cursor, then close it"""
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
+
+    def export_rows(self, rows, columns, label, base_filename, output_format):
+        """
+        Stream row tuples (in columns order) to CSV and/or JSON in a single pass.
+        Files are only created if there is at least one row. If reading rows fails
+        part-way, the partial files are removed and the error is re-raised.
+        """
+        csv_file = json_file = csv_writer = None
+        first = True
+        completed = False
+
+        try:
+            for row in rows:
+                if first:
+                    if output_format in ['csv', 'both']:
+                        csv_file = open(f'{base_filename}.csv', 'w', newline='', buffering=WRITE_BUFFER_SIZE)
+                        csv_writer = csv.writer(csv_file)
+                        csv_writer.writerow(columns)
+                    if output_format in ['json', 'both']:
+                        json_file = open(f'{base_filename}.json', 'wb', buffering=WRITE_BUFFER_SIZE)
+                        json_file.write(b'[\n')
+                    first = False
+                elif json_file:
+                    json_file.write(b',\n')
+
+                if csv_writer:
+                    csv_writer.writerow(row)
+                if json_file:
+                    json_file.write(orjson.dumps(dict(zip(columns, row))))
+
+            if json_file:
+                json_file.write(b'\n]\n')
+            completed = True
+        finally:
+            for export_file in (csv_file, json_file):
+                if export_file:
+                    export_file.close()
+                    if not completed:
+                        os.remove(export_file.name)
+
+            if completed:
+                if csv_file:
+                    self.stdout.write(self.style.SUCCESS(f'✓ Exported {label} to {base_filename}.csv'))
+                if json_file:
+                    self.stdout.write(self.style.SUCCESS(f'✓ Exported {label} to {base_filename}.json'))
+            elif csv_file or json_file:
+                self.stdout.write(self.style.ERROR(f'❌ Export of {label} failed, removed partial {base_filename} files'))
+
+    def print_summary(self, snapshot_stats, run_stats, target_date):
         """Print summary statistics"""
         self.stdout.write(self.style.SUCCESS(f'\n{"="*60}'))
         self.stdout.write(self.style.SUCCESS(f'📊 DATA EXTRACTION SUMMARY - {target_date}'))
@@ -346,43 +455,26 @@ class Command(BaseCommand):
 
         # SecondSnapshots summary
         self.stdout.write(self.style.SUCCESS('📈 SECOND SNAPSHOTS:'))
-        self.stdout.write(f'  Total records: {len(second_snapshots)}')
-
-        if second_snapshots:
-            tickers = set(s['ticker_symbol'] for s in second_snapshots)
-            self.stdout.write(f'  Tickers: {", ".join(sorted(tickers))}')
-
-            first_ts = second_snapshots[0]['timestamp']
-            last_ts = second_snapshots[-1]['timestamp']
-            self.stdout.write(f'  Time range: {first_ts} to {last_ts}')
-
-            # Composite scores
-            scores = [s['composite_score'] for s in second_snapshots if s['composite_score'] is not None]
-            if scores:
-                self.stdout.write(f'  Composite score range: {min(scores):.2f} to {max(scores):.2f}')
-                self.stdout.write(f'  Composite score avg: {sum(scores)/len(scores):.2f}')
-
+        self.print_dataset_summary(snapshot_stats)
         self.stdout.write('')
 
         # AnalysisRuns summary
         self.stdout.write(self.style.SUCCESS('📰 ANALYSIS RUNS:'))
-        self.stdout.write(f'  Total records: {len(analysis_runs)}')
-
-        if analysis_runs:
-            tickers = set(r['ticker_symbol'] for r in analysis_runs)
-            self.stdout.write(f'  Tickers: {", ".join(sorted(tickers))}')
+        self.print_dataset_summary(run_stats)
+        if run_stats['count']:
+            self.stdout.write(f'  Total articles analyzed: {run_stats["articles"]}')
 
-            first_ts = analysis_runs[0]['timestamp']
-            last_ts = analysis_runs[-1]['timestamp']
-            self.stdout.write(f'  Time range: {first_ts} to {last_ts}')
+        self.stdout.write(self.style.SUCCESS(f'\n{"="*60}\n'))
 
-            # Composite scores
-            scores = [r['composite_score'] for r in analysis_runs]
-            self.stdout.write(f'  Composite score range: {min(scores):.2f} to {max(scores):.2f}')
-            self.stdout.write(f'  Composite score avg: {sum(scores)/len(scores):.2f}')
+    def print_dataset_summary(self, stats):
+        """Print record count, tickers, time range and composite score stats"""
+        self.stdout.write(f'  Total records: {stats["count"]}')
 
-            # Articles
-            total_articles = sum(r['articles_analyzed'] for r in analysis_runs)
-            self.stdout.write(f'  Total articles analyzed: {total_articles}')
+        if stats['count']:
+            self.stdout.write(f'  Tickers: {", ".join(sorted(stats["tickers"]))}')
+            self.stdout.write(f'  Time range: {stats["first_ts"]} to {stats["last_ts"]}')
 
-        self.stdout.write(self.style.SUCCESS(f'\n{"="*60}\n'))
+            # Composite scores
+            if stats['score_avg'] is not None:
+                self.stdout.write(f'  Composite score range: {stats["score_min"]:.2f} to {stats["score_max"]:.2f}')
+                self.stdout.write(f'  Composite score avg: {stats["score_avg"]:.2f}')
@@ -13,15 +13,22 @@ import threading
 import queue
 import time
 import hashlib
-from datetime import datetime, timedelta, timezone as dt_timezone
+import math
+import re
+from collections import OrderedDict, deque
+from types import MappingProxyType
+import numpy as np
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from django.db import IntegrityError, OperationalError, DatabaseError, transaction
 from django.utils import timezone
-from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
 
 logger = logging.getLogger(__name__)
 
 # Try to import finnhub
 try:
     import finnhub
+    from requests.adapters import HTTPAdapter
     FINNHUB_AVAILABLE = True
 except ImportError:
     FINNHUB_AVAILABLE = False
@@ -44,6 +51,7 @@ WATCHLIST = [
     'ISRG', 'BKNG', 'ADP', 'GILD', 'ADI', 'VRTX', 'MDLZ', 'REGN',
     'LRCX', 'PANW', 'MU', 'PYPL', 'SNPS', 'KLAC', 'CDNS', 'MELI'
 ]
+WATCHLIST_SIZE = len(WATCHLIST)
 
 # Market cap weights (approximate % of NASDAQ-100)
 from api.management.commands.nasdaq_config import COMPANY_NAMES
@@ -54,6 +62,18 @@ MARKET_CAP_WEIGHTS.update({
     'NVDA': 0.06, 'META': 0.04, 'TSLA': 0.03, 'AVGO': 0.03
 })
 
+# Sentiment (-1..+1) -> impact multiplier: x100 score scale, x weight, x100 normalization
+IMPACT_SCALE = MappingProxyType(
+    {ticker: weight * 10000.0 for ticker, weight in MARKET_CAP_WEIGHTS.items()}
+)
+DEFAULT_IMPACT_SCALE = 0.01 * 10000.0
+
+# Impact caps by |sentiment|: <0.2 filtered (weak/neutral), <0.4 weak, <0.6 moderate,
+# <0.8 strong, otherwise critical
+IMPACT_TIER_BOUNDS = np.array([0.2, 0.4, 0.6, 0.8])
+IMPACT_TIER_CAPS = np.array([0.0, 2.0, 5.0, 15.0, 25.0])
+IMPACT_TIER_NAMES = ('filtered: weak', 'weak', 'moderate', 'strong', 'critical')
+
 # Query timing
 WORK_SECONDS = 50  # Query for first 50 seconds of each minute
 REST_SECONDS = 10  # Rest for last 10 seconds
@@ -63,27 +83,80 @@ REST_SECONDS = 10  # Rest for last 10 seconds
 MIN_SECONDS_BETWEEN_CALLS = 1.2  # Ensures we stay well under 60/minute (50 calls/minute)
 MAX_CALLS_PER_MINUTE = 50  # Conservative limit
 
+# Adaptive refill rate (AIMD, like TCP congestion control): halve it on a 429,
+# add REFILL_RATE_STEP back per successful call, within [MIN, MAX] calls/second
+MAX_REFILL_RATE = MAX_CALLS_PER_MINUTE / 60.0
+MIN_REFILL_RATE = 0.1
+REFILL_RATE_STEP = 0.05
+
 # Rotation state
-_current_index = 0
-_last_query_time = None
+_current_index = 0  # Position of the next symbol in WATCHLIST (wraps at WATCHLIST_SIZE)
+_current_symbol = None  # Symbol queried most recently
+_last_query_time = None  # time.monotonic() of the last API call
+_query_date = [None, None, '']  # [epoch day, date, 'YYYY-MM-DD'] cached by get_query_date()
 _finnhub_client = None
+_analyze_sentiment_batch = None
 
 # Rate limit tracking
-_api_calls_this_minute = []  # List of timestamps for calls in current minute
+_api_tokens = float(MAX_CALLS_PER_MINUTE)  # Token bucket (capacity MAX_CALLS_PER_MINUTE), refilled at _api_refill_rate
+_api_tokens_refilled = None  # time.monotonic() of the last refill
+_api_refill_rate = MAX_REFILL_RATE  # Tokens per second, cut on 429s and restored on success
 _consecutive_429_errors = 0  # Track consecutive rate limit errors
+_rate_limit_logged = False  # Per-minute limit warning already logged (cleared by the next call)
+
+# Ticker rows by symbol for article saves (also used by the Tiingo/RSS save workers;
+# single dict get/set calls are atomic, so sharing it needs no lock)
+_ticker_cache = {}
+
+# Placeholder for articles without a URL: symbol, unix timestamp
+PLACEHOLDER_URL_TEMPLATE = "https://finnhub.io/article/{}/{}"
+
+# Accepted range for numeric published timestamps (unix epoch .. 2100-01-01 UTC)
+PUBLISHED_TS_MIN = 0
+PUBLISHED_TS_MAX = 4102444800
 
-# Article cache (prevent re-processing)
-ARTICLE_CACHE_KEY = 'finnhub_articles_processed'
-ARTICLE_CACHE_DURATION = 3600  # 1 hour
+# Article cache (prevent re-processing) - in-process LRU keyed by 8-byte URL digest
+ARTICLE_CACHE_MAX_SIZE = 50_000
+_processed_articles = OrderedDict()  # digest -> time marked processed
+_processed_articles_lock = threading.Lock()
 
 # Queues for threading
 article_to_score_queue = queue.Queue(maxsize=50)  # Articles needing scoring (capped to prevent memory exhaustion)
-scored_article_queue = queue.Queue()  # Articles that have been scored
+SCORED_QUEUE_MAX = 1024  # Oldest impacts are dropped if get_scored_articles() stops draining
+scored_article_queue = deque(maxlen=SCORED_QUEUE_MAX)  # Impacts of scored articles (guarded by scored_article_lock)
+scored_article_lock = threading.Lock()
 database_save_queue = queue.Queue(maxsize=500)  # Articles to save to database (high limit)
 
-# Scoring thread
-_scoring_thread = None
+# Scoring queue pressure guard: above the throttle depth queue at most one new article
+# per query, and above the skip depth don't spend an API call on articles we can't queue
+SCORE_QUEUE_THROTTLE_DEPTH = int(article_to_score_queue.maxsize * 0.75)
+SCORE_QUEUE_SKIP_DEPTH = int(article_to_score_queue.maxsize * 0.9)
+
+# Scoring batches (sentiment APIs cost about the same for 1 or 16 texts)
+SCORING_BATCH_SIZE = 16
+SCORING_BATCH_WINDOW = 0.5  # seconds to wait for more articles after the first
+
+# save_article_to_db retries (transient errors only); the backoff doubles per retry
+SAVE_MAX_RETRIES = 3
+SAVE_RETRY_DELAY = 0.5  # seconds
+TRANSIENT_DB_ERRORS = ('DEADLOCK', 'TIMEOUT', 'CONNECTION')
+
+# Max articles per bulk INSERT in the database save worker
+SAVE_BATCH_SIZE = 50
+
+# Columns a bulk upsert overwrites when the article_hash already exists
+SAVE_UPDATE_FIELDS = [
+    'ticker', 'analysis_run', 'headline', 'summary', 'source', 'url', 'published_at',
+    'article_type', 'base_sentiment', 'surprise_factor', 'novelty_score',
+    'source_credibility', 'recency_weight', 'article_score', 'weighted_contribution',
+    'is_analyzed', 'sentiment_cached'
+]
+
+# Scoring threads (several, so one slow sentiment call doesn't hold up the queue)
+SCORING_WORKERS = int(os.getenv('FINNHUB_SCORING_WORKERS', '2'))
+_scoring_threads = []
 _scoring_thread_running = False
+STOP_SCORING = object()  # Queued by stop_scoring_thread() to wake idle workers (one each)
 
 # Database save worker thread (NEW)
 _save_worker_thread = None
@@ -108,39 +181,85 @@ def get_finnhub_client():
     
     if _finnhub_client is None:
         _finnhub_client = finnhub.Client(api_key=FINNHUB_API_KEY)
+        # The client reuses one requests.Session; keep its HTTPS connection alive
+        # between our 1/sec calls and leave retries to our own 429 backoff
+        session = getattr(_finnhub_client, '_session', None)
+        if session is not None:
+            session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0))
         logger.info("Finnhub client initialized")
     
     return _finnhub_client
 
 
+def get_sentiment_analyzer():
+    """
+    Get analyze_sentiment_batch from run_nasdaq_sentiment, importing it on first use.
+
+    Kept lazy so importing this module (e.g. for WATCHLIST) doesn't pull in the
+    full sentiment pipeline and its dependencies.
+    """
+    global _analyze_sentiment_batch
+
+    if _analyze_sentiment_batch is None:
+        from api.management.commands.run_nasdaq_sentiment import analyze_sentiment_batch
+        _analyze_sentiment_batch = analyze_sentiment_batch
+
+    return _analyze_sentiment_batch
+
+
 # ============================================================================
 # ARTICLE CACHING
 # ============================================================================
 
 def get_article_hash(article_url):
-    """Generate hash for article URL."""
-    return hashlib.md5(article_url.encode()).hexdigest()
+    """
+    Generate hash for article URL.
+
+    This is NewsArticle.article_hash (unique, 32 chars) and must stay MD5 hex so the
+    same URL dedups against existing rows and against the Tiingo/RSS feeds, which hash
+    the same way. In-memory dedup uses the cheaper get_processed_key() instead.
+    """
+    return hashlib.md5(article_url.encode(), usedforsecurity=False).hexdigest()
+
+
+def get_processed_key(article_url):
+    """Compact in-memory dedup key for article URL (not stored in the database)."""
+    return hashlib.blake2b(article_url.encode('utf-8', 'ignore'), digest_size=8).digest()
 
 
 def is_article_processed(article_url):
     """Check if article has been processed."""
-    article_hash = get_article_hash(article_url)
-    processed = cache.get(ARTICLE_CACHE_KEY, set())
-    return article_hash in processed
+    return get_processed_key(article_url) in _processed_articles
 
 
 def mark_article_processed(article_url):
     """Mark article as processed."""
-    article_hash = get_article_hash(article_url)
-    processed = cache.get(ARTICLE_CACHE_KEY, set())
-    processed.add(article_hash)
-    cache.set(ARTICLE_CACHE_KEY, processed, ARTICLE_CACHE_DURATION)
+    mark_processed_key(get_processed_key(article_url))
+
+
+def mark_processed_key(key):
+    """Mark a processed key, evicting the oldest entries past ARTICLE_CACHE_MAX_SIZE."""
+    with _processed_articles_lock:
+        _processed_articles[key] = time.time()
+        _processed_articles.move_to_end(key)
+        while len(_processed_articles) > ARTICLE_CACHE_MAX_SIZE:
+            _processed_articles.popitem(last=False)
 
 
 # ============================================================================
 # DATABASE SAVING
 # ============================================================================
 
+# str.translate tables: control characters (0x00-0x1F) except tab, newline, carriage return
+_TEXT_CONTROL_CHARS = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+# Anything sanitize_text would change: control chars, whitespace other than ' ', double spaces
+_NEEDS_SANITIZING = re.compile(r'[\x00-\x1f]|[^\S ]|  ')
+_WHITESPACE_RUN = re.compile(r'\s+')
+# For URLs: drop every control character (incl. newlines) and encode spaces
+_URL_CONTROL_CHARS = dict.fromkeys(range(32))
+_URL_CONTROL_CHARS[ord(' ')] = '%20'
+
+
 def sanitize_text(text, field_name="text", max_length=None):
     """
     Sanitize text for database storage - removes null bytes, control chars, normalizes whitespace.
@@ -156,6 +275,12 @@ def sanitize_text(text, field_name="text", max_length=None):
     if not text:
         return ""
     
+    # Fast path: clean text only needs its ends stripped
+    if not _NEEDS_SANITIZING.search(text):
+        stripped = text.strip()
+        if not max_length or len(stripped) <= max_length:
+            return stripped
+    
     original_length = len(text)
     issues_found = []
     
@@ -165,13 +290,13 @@ def sanitize_text(text, field_name="text", max_length=None):
         issues_found.append("null_bytes")
     
     # Remove other control characters (0x01-0x1F) except tab, newline, carriage return
-    text_clean = ''.join(char for char in text if ord(char) >= 32 or char in '\t\n\r')
+    text_clean = text.translate(_TEXT_CONTROL_CHARS)
     if len(text_clean) != len(text):
         issues_found.append("control_chars")
         text = text_clean
     
-    # Normalize whitespace (collapse multiple spaces)
-    text = ' '.join(text.split())
+    # Normalize whitespace (collapse runs to one space, trim the ends)
+    text = _WHITESPACE_RUN.sub(' ', text).strip()
     
     # Truncate if needed
     if max_length and len(text) > max_length:
@@ -181,8 +306,8 @@ def sanitize_text(text, field_name="text", max_length=None):
     # Log if sanitization occurred
     if issues_found:
         logger.info(
-            f"NEWSSAVING: 🧹 Sanitized {field_name}: "
-            f"issues={','.join(issues_found)} original_len={original_length} final_len={len(text)}"
+            "NEWSSAVING: 🧹 Sanitized %s: issues=%s original_len=%d final_len=%d",
+            field_name, ','.join(issues_found), original_length, len(text)
         )
     
     return text.strip()
@@ -202,8 +327,6 @@ def safe_float(value, field_name="float", default=0.0, min_val=-1e10, max_val=1e
     Returns:
         Safe float value
     """
-    import math
-    
     if value is None:
         return default
     
@@ -248,30 +371,276 @@ def safe_url(url, max_length=500):
     if not url:
         return ""
     
+    # Fast path: no whitespace or control chars to touch and within max_length
+    if len(url) <= max_length and ' ' not in url and url.isprintable():
+        return url
+    
     original = url
     
     # Strip whitespace
     url = url.strip()
     
-    # Remove control characters and newlines
-    url = ''.join(char for char in url if ord(char) >= 32)
-    
-    # Replace spaces with %20 (basic encoding)
-    url = url.replace(' ', '%20')
-    
-    # Remove null bytes
-    url = url.replace('\x00', '')
+    # Remove control characters, newlines and null bytes; replace spaces with %20
+    url = url.translate(_URL_CONTROL_CHARS)
     
     # Truncate if needed
     if len(url) > max_length:
         url = url[:max_length]
     
     if url != original:
-        logger.info(f"NEWSSAVING: 🔗 Cleaned URL: original_len={len(original)} final_len={len(url)}")
+        logger.info("NEWSSAVING: 🔗 Cleaned URL: original_len=%d final_len=%d", len(original), len(url))
     
     return url
 
 
+def get_cached_ticker(ticker_symbol):
+    """
+    Get the Ticker for a symbol, falling back to QLD (created if missing).
+
+    Results are cached per symbol so each save doesn't repeat the lookup.
+    """
+    from api.models import Ticker
+
+    ticker = _ticker_cache.get(ticker_symbol)
+    if ticker is not None:
+        return ticker
+
+    try:
+        ticker = Ticker.objects.get(symbol=ticker_symbol)
+        logger.debug("NEWSSAVING: ✓ Ticker found: %s", ticker_symbol)
+    except Ticker.DoesNotExist:
+        logger.warning(f"NEWSSAVING: ⚠️ Ticker {ticker_symbol} not found, trying QLD fallback")
+        try:
+            ticker = Ticker.objects.get(symbol='QLD')
+            logger.info("NEWSSAVING: ✓ Using QLD fallback for %s", ticker_symbol)
+        except Ticker.DoesNotExist:
+            # Last resort: create QLD ticker if it doesn't exist
+            logger.warning("NEWSSAVING: ⚠️ QLD ticker missing! Creating it now...")
+            ticker, created = Ticker.objects.get_or_create(
+                symbol='QLD',
+                defaults={'company_name': 'ProShares Ultra QQQ (2x Leveraged NASDAQ-100 ETF)'}
+            )
+            if created:
+                logger.info("NEWSSAVING: ✓ Created QLD ticker")
+
+    _ticker_cache[ticker_symbol] = ticker
+    return ticker
+
+
+def build_article_fields(article_data, impact, now=None):
+    """
+    Validate and clean a scored article into NewsArticle fields.
+
+    Args:
+        article_data: Dict with article info (headline, summary, url, symbol, published)
+        impact: Calculated sentiment impact
+        now: Aware datetime for placeholder URLs and missing/invalid dates, so a
+             batch can share one clock read (defaults to timezone.now() when needed)
+
+    Returns:
+        (article_hash, defaults) for update_or_create / NewsArticle(article_hash=..., **defaults)
+    """
+    # ============================================================
+    # 1. VALIDATE AND CLEAN ARTICLE DATA
+    # ============================================================
+    
+    # Get ticker symbol with fallback
+    ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper()
+    if not ticker_symbol:
+        ticker_symbol = 'QLD'
+        logger.info("NEWSSAVING: ⚠️ Empty symbol, using QLD")
+    
+    # Get headline with fallback and sanitization
+    headline = str(article_data.get('headline', '')).strip()
+    if not headline or headline.isspace():  # Check for whitespace-only
+        headline = f"[No headline] Article from {ticker_symbol}"
+        logger.warning(f"NEWSSAVING: ⚠️ Missing/empty headline, using fallback: {headline}")
+    
+    # Sanitize headline (remove null bytes, control chars)
+    headline = sanitize_text(headline, field_name="headline", max_length=500)
+    
+    if not headline:  # If sanitization resulted in empty string
+        headline = f"[Sanitized empty] Article from {ticker_symbol}"
+        logger.warning(f"NEWSSAVING: ⚠️ Headline became empty after sanitization")
+    
+    # Get summary with fallback and sanitization
+    summary = str(article_data.get('summary', '')).strip()
+    if not summary:
+        summary = headline  # Use headline as summary if missing
+    summary = sanitize_text(summary, field_name="summary", max_length=2000)
+    
+    # Get URL with fallback and cleaning
+    url = str(article_data.get('url', '')).strip()
+    if not url:
+        # Generate a placeholder URL if missing
+        now = now or timezone.now()
+        url = PLACEHOLDER_URL_TEMPLATE.format(ticker_symbol, int(now.timestamp()))
+        logger.warning(f"NEWSSAVING: ⚠️ Missing URL, generated: {url}")
+    url = safe_url(url, max_length=500)
+
+    logger.info(
+        "NEWSSAVING: 📊 DATA ticker=%s headline_len=%d url_len=%d impact=%.2f",
+        ticker_symbol, len(headline), len(url), impact
+    )
+
+    # ============================================================
+    # 2. GET OR CREATE TICKER (cached)
+    # ============================================================
+    
+    ticker = get_cached_ticker(ticker_symbol)
+
+    # ============================================================
+    # 3. PARSE AND VALIDATE PUBLISHED DATE
+    # ============================================================
+    
+    published_at = None
+    if article_data.get('published'):
+        try:
+            published_timestamp = article_data['published']
+            if isinstance(published_timestamp, (int, float)):
+                # Validate timestamp is in reasonable range
+                if not PUBLISHED_TS_MIN <= published_timestamp <= PUBLISHED_TS_MAX:
+                    logger.warning(f"NEWSSAVING: ⚠️ Timestamp out of range: {published_timestamp}, using now")
+                    published_at = now or timezone.now()
+                else:
+                    published_at = datetime.fromtimestamp(published_timestamp, tz=dt_timezone.utc)
+            else:
+                published_at = parse_datetime(str(published_timestamp))
+        except Exception as e:
+            logger.warning(f"NEWSSAVING: ⚠️ Date parse error: {e}, using now")
+    
+    if not published_at:
+        published_at = now or timezone.now()
+    
+    # Validate datetime is in reasonable range
+    if published_at.year < 1900 or published_at.year > 2100:
+        logger.warning(f"NEWSSAVING: ⚠️ Date year out of range: {published_at.year}, using now")
+        published_at = now or timezone.now()
+    
+    # Ensure timezone-aware
+    if timezone.is_naive(published_at):
+        published_at = timezone.make_aware(published_at)
+        logger.debug("NEWSSAVING: 🕐 Made datetime timezone-aware")
+
+    # ============================================================
+    # 4. GENERATE AND VALIDATE ARTICLE HASH
+    # ============================================================
+    
+    article_hash = None
+    try:
+        article_hash = get_article_hash(url)
+        # Validate hash is 32 chars (MD5 format)
+        if article_hash and len(article_hash) != 32:
+            logger.warning(f"NEWSSAVING: ⚠️ Invalid hash length: {len(article_hash)}, regenerating")
+            article_hash = None
+    except Exception as e:
+        logger.warning(f"NEWSSAVING: ⚠️ Hash generation error: {e}")
+    
+    if not article_hash:
+        # Fallback: generate hash from headline + timestamp (BLAKE2b, 32 hex chars like MD5)
+        fallback_string = f"{headline}_{ticker_symbol}_{int(published_at.timestamp())}"
+        article_hash = hashlib.blake2b(fallback_string.encode('utf-8', errors='ignore'), digest_size=16).hexdigest()
+        logger.warning(f"NEWSSAVING: ⚠️ Using fallback hash: {article_hash[:8]}")
+
+    # ============================================================
+    # 5. VALIDATE AND CALCULATE SENTIMENT (NaN/Inf safe)
+    # ============================================================
+    
+    # Validate impact value (the only NaN/Inf/range check it needs)
+    impact = safe_float(impact, field_name="impact", default=0.0, min_val=-100, max_val=100)
+    
+    # Calculate with overflow protection (scales are always non-zero)
+    try:
+        estimated_sentiment = impact / IMPACT_SCALE.get(ticker_symbol, DEFAULT_IMPACT_SCALE)
+        estimated_sentiment = safe_float(
+            estimated_sentiment, 
+            field_name="estimated_sentiment",
+            default=0.0,
+            min_val=-1.0,
+            max_val=1.0
+        )
+    except (ZeroDivisionError, OverflowError) as e:
+        logger.warning(f"NEWSSAVING: ⚠️ Sentiment calc error: {e}, using 0.0")
+        estimated_sentiment = 0.0
+
+    # ============================================================
+    # 6. FINAL VALIDATION
+    # ============================================================
+    
+    logger.info(
+        "NEWSSAVING: 💾 SAVING hash=%.8s ticker=%s sentiment=%.3f impact=%.2f",
+        article_hash, ticker_symbol, estimated_sentiment, impact
+    )
+    
+    return article_hash, {
+        'ticker': ticker,
+        'analysis_run': None,
+        'headline': headline,
+        'summary': summary,
+        'source': 'Finnhub (Real-Time)',
+        'url': url,
+        'published_at': published_at,
+        'article_type': 'company',
+        'base_sentiment': estimated_sentiment,
+        'surprise_factor': 1.0,
+        'novelty_score': 1.0,
+        'source_credibility': 0.8,
+        'recency_weight': 1.0,
+        'article_score': impact,
+        'weighted_contribution': impact,
+        'is_analyzed': True,
+        'sentiment_cached': False
+    }
+
+
+def is_duplicate_error(exc):
+    """True if an IntegrityError is a unique-constraint (duplicate article_hash) violation."""
+    error_msg = str(exc).lower()
+    return 'unique constraint' in error_msg or 'duplicate key' in error_msg
+
+
+def classify_operational_error(exc):
+    """Label an OperationalError for logs: DEADLOCK, TIMEOUT, CONNECTION, DISK_FULL or OPERATIONAL."""
+    error_msg = str(exc).lower()
+    if 'deadlock' in error_msg:
+        return "DEADLOCK"
+    if 'timeout' in error_msg or 'timed out' in error_msg:
+        return "TIMEOUT"
+    if 'connection' in error_msg:
+        return "CONNECTION"
+    if 'disk' in error_msg or 'space' in error_msg:
+        return "DISK_FULL"
+    return "OPERATIONAL"
+
+
+def should_retry_save(exc, attempt):
+    """
+    Decide whether save_article_to_db should retry after an exception.
+
+    Only transient failures are retried: deadlocks, timeouts and lost connections,
+    and non-duplicate IntegrityErrors (a cached ticker may have been removed).
+    Duplicates, bad data and unexpected errors would fail the same way again.
+
+    Args:
+        exc: Exception raised by the save attempt
+        attempt: Zero-based attempt number
+
+    Returns:
+        (retry, delay): whether to retry, and the backoff in seconds before it
+    """
+    if attempt >= SAVE_MAX_RETRIES - 1:
+        return False, 0.0
+
+    if isinstance(exc, IntegrityError):
+        retry = not is_duplicate_error(exc)
+    elif isinstance(exc, OperationalError):
+        retry = classify_operational_error(exc) in TRANSIENT_DB_ERRORS
+    else:
+        retry = False
+
+    return retry, (SAVE_RETRY_DELAY * 2 ** attempt if retry else 0.0)
+
+
 def save_article_to_db(article_data, impact):
     """
     Save article to NewsArticle database table.
@@ -284,298 +653,109 @@ def save_article_to_db(article_data, impact):
         impact: Calculated sentiment impact
     
     Returns:
-        NewsArticle instance or None only if all retries fail
+        NewsArticle instance (the existing row for a duplicate), or None if the save fails
     """
-    max_retries = 3
-    retry_delay = 0.5  # seconds
-    
-    for attempt in range(max_retries):
-        try:
-            from api.models import NewsArticle, Ticker
-            from django.utils.dateparse import parse_datetime
-            from django.utils import timezone
-            from django.db import IntegrityError, OperationalError, DatabaseError
-            import time
-
-            logger.info(f"NEWSSAVING: 📥 ENTRY attempt={attempt+1}/{max_retries} source=Finnhub")
+    from api.models import NewsArticle
 
-            # ============================================================
-            # 1. VALIDATE AND CLEAN ARTICLE DATA
-            # ============================================================
-            
-            # Get ticker symbol with fallback
-            ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper()
-            if not ticker_symbol:
-                ticker_symbol = 'QLD'
-                logger.info(f"NEWSSAVING: ⚠️ Empty symbol, using QLD")
-            
-            # Get headline with fallback and sanitization
-            headline = str(article_data.get('headline', '')).strip()
-            if not headline or not headline.replace(' ', ''):  # Check for whitespace-only
-                headline = f"[No headline] Article from {ticker_symbol}"
-                logger.warning(f"NEWSSAVING: ⚠️ Missing/empty headline, using fallback: {headline}")
-            
-            # Sanitize headline (remove null bytes, control chars)
-            headline = sanitize_text(headline, field_name="headline", max_length=500)
-            
-            if not headline:  # If sanitization resulted in empty string
-                headline = f"[Sanitized empty] Article from {ticker_symbol}"
-                logger.warning(f"NEWSSAVING: ⚠️ Headline became empty after sanitization")
-            
-            # Get summary with fallback and sanitization
-            summary = str(article_data.get('summary', '')).strip()
-            if not summary:
-                summary = headline  # Use headline as summary if missing
-            summary = sanitize_text(summary, field_name="summary", max_length=2000)
-            
-            # Get URL with fallback and cleaning
-            url = str(article_data.get('url', '')).strip()
-            if not url:
-                # Generate a placeholder URL if missing
-                url = f"https://finnhub.io/article/{ticker_symbol}/{int(time.time())}"
-                logger.warning(f"NEWSSAVING: ⚠️ Missing URL, generated: {url}")
-            url = safe_url(url, max_length=500)
-
-            logger.info(f"NEWSSAVING: 📊 DATA ticker={ticker_symbol} headline_len={len(headline)} url_len={len(url)} impact={impact:.2f}")
-
-            # ============================================================
-            # 2. GET OR CREATE TICKER
-            # ============================================================
-            
-            ticker = None
-            try:
-                ticker = Ticker.objects.get(symbol=ticker_symbol)
-                logger.debug(f"NEWSSAVING: ✓ Ticker found: {ticker_symbol}")
-            except Ticker.DoesNotExist:
-                logger.warning(f"NEWSSAVING: ⚠️ Ticker {ticker_symbol} not found, trying QLD fallback")
-                try:
-                    ticker = Ticker.objects.get(symbol='QLD')
-                    logger.info(f"NEWSSAVING: ✓ Using QLD fallback for {ticker_symbol}")
-                except Ticker.DoesNotExist:
-                    # Last resort: create QLD ticker if it doesn't exist
-                    logger.warning("NEWSSAVING: ⚠️ QLD ticker missing! Creating it now...")
-                    ticker, created = Ticker.objects.get_or_create(
-                        symbol='QLD',
-                        defaults={'company_name': 'ProShares Ultra QQQ (2x Leveraged NASDAQ-100 ETF)'}
-                    )
-                    if created:
-                        logger.info("NEWSSAVING: ✓ Created QLD ticker")
+    for attempt in range(SAVE_MAX_RETRIES):
+        try:
+            logger.info("NEWSSAVING: 📥 ENTRY attempt=%d/%d source=Finnhub", attempt + 1, SAVE_MAX_RETRIES)
 
-            # ============================================================
-            # 3. PARSE AND VALIDATE PUBLISHED DATE
-            # ============================================================
-            
-            published_at = None
-            if article_data.get('published'):
-                try:
-                    published_timestamp = article_data['published']
-                    if isinstance(published_timestamp, (int, float)):
-                        # Validate timestamp is in reasonable range
-                        if published_timestamp < 0 or published_timestamp > 4102444800:  # Year 2100
-                            logger.warning(f"NEWSSAVING: ⚠️ Timestamp out of range: {published_timestamp}, using now")
-                            published_at = timezone.now()
-                        else:
-                            published_at = datetime.fromtimestamp(published_timestamp, tz=dt_timezone.utc)
-                    else:
-                        published_at = parse_datetime(str(published_timestamp))
-                except Exception as e:
-                    logger.warning(f"NEWSSAVING: ⚠️ Date parse error: {e}, using now")
-            
-            if not published_at:
-                published_at = timezone.now()
-            
-            # Validate datetime is in reasonable range
-            if published_at.year < 1900 or published_at.year > 2100:
-                logger.warning(f"NEWSSAVING: ⚠️ Date year out of range: {published_at.year}, using now")
-                published_at = timezone.now()
-            
-            # Ensure timezone-aware
-            if timezone.is_naive(published_at):
-                published_at = timezone.make_aware(published_at)
-                logger.debug(f"NEWSSAVING: 🕐 Made datetime timezone-aware")
-
-            # ============================================================
-            # 4. GENERATE AND VALIDATE ARTICLE HASH
-            # ============================================================
-            
-            article_hash = None
-            try:
-                article_hash = get_article_hash(url)
-                # Validate hash is 32 chars (MD5 format)
-                if article_hash and len(article_hash) != 32:
-                    logger.warning(f"NEWSSAVING: ⚠️ Invalid hash length: {len(article_hash)}, regenerating")
-                    article_hash = None
-            except Exception as e:
-                logger.warning(f"NEWSSAVING: ⚠️ Hash generation error: {e}")
-            
-            if not article_hash:
-                # Fallback: generate hash from headline + timestamp
-                import hashlib
-                fallback_string = f"{headline}_{ticker_symbol}_{int(published_at.timestamp())}"
-                article_hash = hashlib.md5(fallback_string.encode('utf-8', errors='ignore')).hexdigest()
-                logger.warning(f"NEWSSAVING: ⚠️ Using fallback hash: {article_hash[:8]}")
-
-            # ============================================================
-            # 5. VALIDATE AND CALCULATE SENTIMENT (NaN/Inf safe)
-            # ============================================================
-            
-            # Validate impact value
-            impact = safe_float(impact, field_name="impact", default=0.0, min_val=-100, max_val=100)
-            
-            weight = MARKET_CAP_WEIGHTS.get(ticker_symbol, 0.01)
-            if weight == 0 or weight is None:
-                weight = 0.01  # Prevent division by zero
-                logger.debug(f"NEWSSAVING: ⚠️ Weight was 0, using 0.01")
-            
-            # Calculate with overflow protection
-            try:
-                estimated_sentiment = impact / (weight * 100 * 100)
-                estimated_sentiment = safe_float(
-                    estimated_sentiment, 
-                    field_name="estimated_sentiment",
-                    default=0.0,
-                    min_val=-1.0,
-                    max_val=1.0
-                )
-            except (ZeroDivisionError, OverflowError) as e:
-                logger.warning(f"NEWSSAVING: ⚠️ Sentiment calc error: {e}, using 0.0")
-                estimated_sentiment = 0.0
+            ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper() or 'QLD'
+            article_hash, defaults = build_article_fields(article_data, impact)
+            headline = defaults['headline']
+            summary = defaults['summary']
 
-            # ============================================================
-            # 6. SAVE TO DATABASE WITH COMPREHENSIVE LOGGING
-            # ============================================================
-            
-            logger.info(
-                f"NEWSSAVING: 💾 SAVING hash={article_hash[:8]} ticker={ticker_symbol} "
-                f"sentiment={estimated_sentiment:.3f} impact={impact:.2f}"
-            )
-            
-            # Validate all float fields one more time before save
-            safe_impact = safe_float(impact, "final_impact", 0.0, -100, 100)
-            safe_sentiment = safe_float(estimated_sentiment, "final_sentiment", 0.0, -1.0, 1.0)
-            
             article, created = NewsArticle.objects.update_or_create(
                 article_hash=article_hash,
-                defaults={
-                    'ticker': ticker,
-                    'analysis_run': None,
-                    'headline': headline,
-                    'summary': summary,
-                    'source': 'Finnhub (Real-Time)',
-                    'url': url,
-                    'published_at': published_at,
-                    'article_type': 'company',
-                    'base_sentiment': safe_sentiment,
-                    'surprise_factor': 1.0,
-                    'novelty_score': 1.0,
-                    'source_credibility': 0.8,
-                    'recency_weight': 1.0,
-                    'article_score': safe_impact,
-                    'weighted_contribution': safe_impact,
-                    'is_analyzed': True,
-                    'sentiment_cached': False
-                }
+                defaults=defaults
             )
 
             # Success!
             if created:
                 logger.info(
-                    f"NEWSSAVING: ✅ SAVED_NEW hash={article_hash[:8]} id={article.id} "
-                    f"ticker={ticker_symbol} headline={headline[:50]}..."
+                    "NEWSSAVING: ✅ SAVED_NEW hash=%.8s id=%s ticker=%s headline=%.50s...",
+                    article_hash, article.id, ticker_symbol, headline
                 )
             else:
                 logger.info(
-                    f"NEWSSAVING: ♻️ UPDATED hash={article_hash[:8]} id={article.id} ticker={ticker_symbol}"
+                    "NEWSSAVING: ♻️ UPDATED hash=%.8s id=%s ticker=%s",
+                    article_hash, article.id, ticker_symbol
                 )
 
             return article
 
         except IntegrityError as e:
-            # Constraint violation (unique, foreign key, etc.) - retry
-            error_msg = str(e).lower()
-            if 'unique constraint' in error_msg or 'duplicate key' in error_msg:
-                logger.warning(
-                    f"NEWSSAVING: 🔄 DUPLICATE hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"attempt={attempt + 1}/{max_retries}"
-                )
-            else:
+            hash_prefix = article_hash[:8] if 'article_hash' in locals() else 'unknown'
+            if is_duplicate_error(e) and 'article_hash' in locals():
+                # Another writer inserted the same article first - it's saved, don't retry
                 logger.warning(
-                    f"NEWSSAVING: ⚠️ INTEGRITY_ERROR attempt={attempt + 1}/{max_retries} error={e}"
+                    f"NEWSSAVING: 🔄 DUPLICATE hash={hash_prefix} attempt={attempt + 1}/{SAVE_MAX_RETRIES}"
                 )
+                return NewsArticle.objects.filter(article_hash=article_hash).first()
+
+            # Other constraint violation (foreign key, etc.) - retry
+            # with fresh ticker lookups in case a cached ticker was removed
+            _ticker_cache.clear()
+            logger.warning(
+                f"NEWSSAVING: ⚠️ INTEGRITY_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} error={e}"
+            )
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
+            retry, delay = should_retry_save(e, attempt)
+            if retry:
+                time.sleep(delay)
                 continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_INTEGRITY hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}"
-                )
-                return None
+            logger.error(
+                f"NEWSSAVING: ❌ FAILED_INTEGRITY hash={hash_prefix} "
+                f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}"
+            )
+            return None
 
         except OperationalError as e:
-            # Database connection, deadlock, timeout - retry
-            error_msg = str(e).lower()
-            if 'deadlock' in error_msg:
-                error_type = "DEADLOCK"
-            elif 'timeout' in error_msg or 'timed out' in error_msg:
-                error_type = "TIMEOUT"
-            elif 'connection' in error_msg:
-                error_type = "CONNECTION"
-            elif 'disk' in error_msg or 'space' in error_msg:
-                error_type = "DISK_FULL"
-            else:
-                error_type = "OPERATIONAL"
+            # Database connection, deadlock, timeout - retry; anything else fails now
+            error_type = classify_operational_error(e)
+            retry, delay = should_retry_save(e, attempt)
             
             logger.warning(
-                f"NEWSSAVING: 🔄 {error_type} attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: 🔄 {error_type} attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                f"retrying_in={retry_delay}s error={e}"
+                f"retrying_in={delay}s error={e}"
             )
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
+            if retry:
+                time.sleep(delay)
                 continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_{error_type} after {max_retries} attempts "
-                    f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}",
-                    exc_info=True
-                )
-                return None
+            logger.error(
+                f"NEWSSAVING: ❌ FAILED_{error_type} after {attempt + 1} attempts "
+                f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
+                f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}",
+                exc_info=True
+            )
+            return None
 
         except DatabaseError as e:
-            # General database errors (encoding, data type, etc.)
+            # General database errors (encoding, data type, etc.) - retrying won't help
             logger.error(
-                f"NEWSSAVING: ❌ DATABASE_ERROR attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: ❌ DATABASE_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
                 f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}",
                 exc_info=True
             )
-            
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            else:
-                return None
+            return None
 
         except MemoryError as e:
             # Out of memory (very rare, but possible with huge articles)
             logger.error(
-                f"NEWSSAVING: ❌ MEMORY_ERROR attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: ❌ MEMORY_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"headline_len={len(headline) if 'headline' in locals() else 0} "
                 f"summary_len={len(summary) if 'summary' in locals() else 0} error={e}"
             )
             return None  # Don't retry memory errors
 
         except Exception as e:
-            # Unexpected error - catch all
+            # Unexpected error - catch all (not retried: it would fail the same way)
             logger.error(
-                f"NEWSSAVING: ❌ UNEXPECTED_ERROR attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: ❌ UNEXPECTED_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"type={type(e).__name__} "
                 f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
                 f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} "
@@ -583,17 +763,7 @@ def save_article_to_db(article_data, impact):
                 f"error={e}",
                 exc_info=True
             )
-            
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_ALL_RETRIES after {max_retries} attempts "
-                    f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'}"
-                )
-                return None
+            return None
     
     # Should never reach here, but just in case
     logger.error(
@@ -606,78 +776,93 @@ def save_article_to_db(article_data, impact):
 # ARTICLE SCORING (matches run_nasdaq_sentiment.py exactly)
 # ============================================================================
 
-def score_article_with_ai(headline, summary, symbol):
+def calculate_impacts(sentiments, symbols):
     """
-    Score article using AI sentiment analysis (OpenAI or FinBERT based on config).
-    
+    Convert -1..+1 sentiments into capped news score impacts, one per symbol.
+
+    Args:
+        sentiments: Sentiment scores (-1 to +1)
+        symbols: Stock symbol for each sentiment
+
+    Returns:
+        list: Article impacts on news score (already scaled and weighted)
+    """
+    sentiments = np.asarray(sentiments, dtype=np.float64)
+
+    # Scale to -100/+100, weight by market cap and normalize like run_nasdaq_sentiment.py
+    # (simplified - just use base sentiment; no surprise, novelty, credibility, recency)
+    scales = np.fromiter(
+        (IMPACT_SCALE.get(symbol, DEFAULT_IMPACT_SCALE) for symbol in symbols),
+        dtype=np.float64, count=len(sentiments)
+    )
+
+    # Tiered impact caps based on sentiment strength (reduces noise, amplifies strong signals)
+    tiers = np.searchsorted(IMPACT_TIER_BOUNDS, np.abs(sentiments), side='right')
+    caps = IMPACT_TIER_CAPS[tiers]
+    impacts = np.where(tiers == 0, 0.0, np.clip(sentiments * scales, -caps, caps))
+
+    for symbol, sentiment, impact, tier in zip(symbols, sentiments, impacts, tiers):
+        logger.info(
+            "Scored %s article: sentiment=%+.2f, impact=%+.2f (%s)",
+            symbol, sentiment, impact, IMPACT_TIER_NAMES[tier]
+        )
+
+    return impacts.tolist()
+
+
+def score_articles_with_ai(articles):
+    """
+    Score a batch of articles with one AI sentiment call (OpenAI or FinBERT based on config).
+
     This uses the same sentiment provider as run_nasdaq_sentiment.py for consistency.
     Respects SENTIMENT_PROVIDER environment variable.
-    
+
     Args:
-        headline: Article headline
-        summary: Article summary
-        symbol: Stock symbol
-    
+        articles: List of dicts with 'headline', 'summary' and 'symbol'
+
     Returns:
-        float: Article impact on news score (already scaled and weighted)
+        list: Article impacts (floats), one per input article, or None if the
+        sentiment provider failed (callers should not save or mark the batch)
     """
+    if not articles:
+        return []
+
     try:
-        # Import the sentiment analysis wrapper from run_nasdaq_sentiment
+        # Sentiment analysis wrapper from run_nasdaq_sentiment
         # This automatically uses OpenAI or FinBERT based on SENTIMENT_PROVIDER env var
-        from api.management.commands.run_nasdaq_sentiment import analyze_sentiment_batch
-        
-        # Score the article
-        text = f"{headline}. {summary}" if summary else headline
-        sentiments = analyze_sentiment_batch([text])
-        
-        if not sentiments or len(sentiments) == 0:
-            logger.warning(f"No sentiment returned for {symbol} article")
-            return 0.0
-        
-        sentiment = sentiments[0]  # -1 to +1
-        
-        # Calculate article score (simplified - just use base sentiment)
-        # In run_nasdaq_sentiment, this would include surprise, novelty, credibility, recency
-        # For real-time, we use just sentiment for speed
-        article_score = sentiment * 100  # Scale to -100/+100
-        
-        # Get market cap weight for this symbol
-        weight = MARKET_CAP_WEIGHTS.get(symbol, 0.01)
-        
-        # Calculate weighted contribution
-        weighted_contribution = article_score * weight
-        
-        # Scale by 100 (to match run_nasdaq_sentiment.py normalization)
-        impact = weighted_contribution * 100
-
-        # Tiered impact caps based on sentiment strength (reduces noise, amplifies strong signals)
-        abs_sentiment = abs(sentiment)
-        if abs_sentiment < 0.2:
-            # Filter out weak/neutral sentiment (noise reduction)
-            impact = 0.0
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (filtered: weak)")
-        elif abs_sentiment < 0.4:
-            # Weak signal
-            impact = max(-2, min(2, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (weak)")
-        elif abs_sentiment < 0.6:
-            # Moderate signal
-            impact = max(-5, min(5, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (moderate)")
-        elif abs_sentiment < 0.8:
-            # Strong signal
-            impact = max(-15, min(15, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (strong)")
-        else:
-            # Critical news (very strong sentiment)
-            impact = max(-25, min(25, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (critical)")
-        
-        return float(impact)
-    
+        analyze_sentiment_batch = get_sentiment_analyzer()
+
+        # Score all articles in a single request
+        texts = []
+        for article in articles:
+            headline = article.get('headline') or ''
+            summary = article.get('summary') or ''
+            texts.append(f"{headline}. {summary}" if summary else headline)
+        sentiments = analyze_sentiment_batch(texts)
+
+        if not sentiments or len(sentiments) != len(articles):
+            logger.warning(
+                f"Sentiment batch returned {len(sentiments) if sentiments else 0} scores "
+                f"for {len(articles)} articles"
+            )
+            return None
+
+        return calculate_impacts(sentiments, [article['symbol'] for article in articles])
+
     except Exception as e:
-        logger.error(f"Error scoring article: {e}", exc_info=True)
-        return 0.0
+        logger.error("Error scoring articles: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return None
+
+
+def score_article_with_ai(headline, summary, symbol):
+    """
+    Score a single article (see score_articles_with_ai).
+
+    Returns:
+        float: Article impact on news score (already scaled and weighted), 0.0 on failure
+    """
+    impacts = score_articles_with_ai([{'headline': headline, 'summary': summary, 'symbol': symbol}])
+    return impacts[0] if impacts else 0.0
 
 
 # ============================================================================
@@ -695,49 +880,113 @@ def scoring_worker():
 
     while _scoring_thread_running:
         try:
-            # Get article from queue (block for up to 1 second)
-            try:
-                article_data = article_to_score_queue.get(timeout=1.0)
-            except queue.Empty:
+            # Sleep until an article arrives; stop_scoring_thread() wakes us with a sentinel
+            article_data = article_to_score_queue.get()
+            if article_data is STOP_SCORING:
+                continue  # Re-check _scoring_thread_running (stale sentinels are skipped)
+            batch = [article_data]
+
+            # Collect more articles for a short window so they share one sentiment call
+            deadline = time.monotonic() + SCORING_BATCH_WINDOW
+            while len(batch) < SCORING_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    article_data = article_to_score_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if article_data is STOP_SCORING:
+                    break  # Score what we have; the loop condition then exits
+                batch.append(article_data)
+
+            # Score the batch
+            impacts = score_articles_with_ai(batch)
+            if impacts is None:
+                # Provider failed: don't publish, save or mark these; they are retried
+                # when the symbol comes round again
+                logger.warning("SCORING: ⚠️ Sentiment failed, leaving %d articles unprocessed", len(batch))
                 continue
 
-            # Score the article
-            impact = score_article_with_ai(
-                article_data['headline'],
-                article_data['summary'],
-                article_data['symbol']
-            )
+            for article_data, impact in zip(batch, impacts):
+                # ⚡ PRIORITY 1: Put impact in scored queue IMMEDIATELY (sentiment update)
+                with scored_article_lock:
+                    if len(scored_article_queue) == SCORED_QUEUE_MAX:
+                        logger.warning("Scored article queue full (%d), dropping oldest impact", SCORED_QUEUE_MAX)
+                    scored_article_queue.append(impact)
+                logger.info("SCORING: ✅ Scored and queued impact: %s impact=%+.2f", article_data['symbol'], impact)
 
-            # ⚡ PRIORITY 1: Put impact in scored queue IMMEDIATELY (sentiment update)
-            scored_article_queue.put(impact)
-            logger.info(f"SCORING: ✅ Scored and queued impact: {article_data['symbol']} impact={impact:+.2f}")
-
-            # ⚡ PRIORITY 2: Queue for database save (async, non-blocking)
-            try:
-                save_job = {
-                    'article_data': article_data,
-                    'impact': impact,
-                    'queued_time': timezone.now(),
-                    'article_hash': get_article_hash(article_data['url'])
-                }
-                database_save_queue.put_nowait(save_job)
-                logger.info(f"SAVEQUEUE: 📝 Queued for save: {article_data['symbol']} hash={save_job['article_hash'][:8]}")
-            except queue.Full:
-                logger.error(f"SAVEQUEUE: ❌ QUEUE_FULL (500 items) - cannot queue save for {article_data['symbol']}")
-
-            # Mark as processed
-            mark_article_processed(article_data['url'])
+                # ⚡ PRIORITY 2: Queue for database save (async, non-blocking)
+                try:
+                    save_job = {
+                        'article_data': article_data,
+                        'impact': impact,
+                        'queued_time': timezone.now(),
+                        'article_hash': get_article_hash(article_data['url'])
+                    }
+                    database_save_queue.put_nowait(save_job)
+                    logger.info("SAVEQUEUE: 📝 Queued for save: %s hash=%.8s", article_data['symbol'], save_job['article_hash'])
+                except queue.Full:
+                    logger.error(f"SAVEQUEUE: ❌ QUEUE_FULL (500 items) - cannot queue save for {article_data['symbol']}")
+
+                # Mark as processed (key was computed when the article was queued)
+                mark_processed_key(article_data['processed_key'])
 
         except Exception as e:
-            logger.error(f"Error in scoring worker: {e}", exc_info=True)
+            logger.error("Error in scoring worker: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
     logger.info("Article scoring thread stopped")
 
 
+def save_articles_bulk(save_jobs, build_fields=build_article_fields):
+    """
+    Upsert several scored articles with one bulk INSERT ... ON CONFLICT DO UPDATE.
+
+    Tickers missing from the cache are loaded with one query, and an existing
+    article_hash is updated like save_article_to_db's update_or_create.
+
+    Args:
+        save_jobs: List of save job dicts (article_data, impact, ...)
+        build_fields: Collector's build_article_fields (Tiingo passes its own)
+
+    Returns:
+        int: Number of articles upserted (after de-duplicating by hash)
+    """
+    from api.models import NewsArticle, Ticker
+
+    symbols = {
+        str(save_job['article_data'].get('symbol', 'QLD')).strip().upper() or 'QLD'
+        for save_job in save_jobs
+    }
+    missing = [symbol for symbol in symbols if symbol not in _ticker_cache]
+    if missing:
+        _ticker_cache.update(Ticker.objects.in_bulk(missing, field_name='symbol'))
+
+    # One row per hash: ON CONFLICT DO UPDATE can't touch the same row twice
+    now = timezone.now()
+    articles = {}
+    for save_job in save_jobs:
+        article_hash, defaults = build_fields(save_job['article_data'], save_job['impact'], now)
+        articles[article_hash] = NewsArticle(article_hash=article_hash, **defaults)
+
+    with transaction.atomic():
+        NewsArticle.objects.bulk_create(
+            list(articles.values()),
+            batch_size=SAVE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['article_hash'],
+            update_fields=SAVE_UPDATE_FIELDS
+        )
+    return len(articles)
+
+
 def database_save_worker():
     """
     Dedicated background thread for database saves.
     Processes saves from queue with deadline enforcement and comprehensive logging.
+
+    Jobs that are already waiting are saved together with one bulk upsert; a single
+    job, or a batch whose bulk upsert fails, goes through save_article_to_db with retries.
     """
     global _save_worker_running
     
@@ -748,107 +997,145 @@ def database_save_worker():
     saves_succeeded = 0
     saves_failed = 0
     saves_deadline_exceeded = 0
-    
+    deadline_seconds = 60  # Max time a job may wait in the queue
+
+    def save_with_retries(save_job):
+        """Save one job via save_article_to_db, retrying within its deadline."""
+        nonlocal saves_succeeded, saves_failed
+
+        article_data = save_job['article_data']
+        impact = save_job['impact']
+        queued_time = save_job['queued_time']
+        article_hash = save_job['article_hash']
+        wait_time = (timezone.now() - queued_time).total_seconds()
+
+        # Attempt save with fast retries
+        remaining_time = deadline_seconds - wait_time
+        max_attempts = 3
+        retry_delay = 0.1  # Start with 100ms
+        save_succeeded = False
+        
+        for attempt in range(max_attempts):
+            try:
+                logger.info(
+                    f"SAVEQUEUE: 💾 SAVE_ATTEMPT attempt={attempt+1}/{max_attempts} "
+                    f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
+                    f"remaining_time={remaining_time:.2f}s"
+                )
+                
+                # Call the existing save function
+                article = save_article_to_db(article_data, impact)
+                
+                if article:
+                    total_time = (timezone.now() - queued_time).total_seconds()
+                    saves_succeeded += 1
+                    logger.info(
+                        f"SAVEQUEUE: ✅ SAVE_SUCCESS hash={article_hash[:8]} "
+                        f"id={article.id} ticker={article_data.get('symbol')} "
+                        f"total_time={total_time:.2f}s attempt={attempt+1} "
+                        f"success_count={saves_succeeded}"
+                    )
+                    save_succeeded = True
+                    break
+                else:
+                    logger.warning(
+                        f"SAVEQUEUE: ⚠️ SAVE_RETURNED_NONE attempt={attempt+1}/{max_attempts} "
+                        f"hash={article_hash[:8]}"
+                    )
+                    
+            except Exception as e:
+                logger.error(
+                    f"SAVEQUEUE: ❌ SAVE_EXCEPTION attempt={attempt+1}/{max_attempts} "
+                    f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
+                    f"error={type(e).__name__}: {str(e)[:100]}"
+                )
+            
+            # Check if we have time to retry
+            remaining_time = deadline_seconds - (timezone.now() - queued_time).total_seconds()
+            if remaining_time <= 0:
+                logger.error(f"SAVEQUEUE: ⏰ NO_TIME_FOR_RETRY hash={article_hash[:8]}")
+                break
+            
+            # Retry with exponential backoff (but respect deadline)
+            if attempt < max_attempts - 1:
+                sleep_time = min(retry_delay, remaining_time - 0.1)  # Leave 100ms buffer
+                if sleep_time > 0:
+                    logger.info(f"SAVEQUEUE: 🔄 RETRY_DELAY sleep={sleep_time:.2f}s attempt={attempt+1}")
+                    time.sleep(sleep_time)
+                    retry_delay = min(retry_delay * 1.5, 2.0)  # Cap at 2s
+        
+        # Final status
+        if not save_succeeded:
+            saves_failed += 1
+            total_time = (timezone.now() - queued_time).total_seconds()
+            logger.error(
+                f"SAVEQUEUE: ❌ SAVE_FAILED_ALL_ATTEMPTS hash={article_hash[:8]} "
+                f"ticker={article_data.get('symbol')} "
+                f"attempts={max_attempts} total_time={total_time:.2f}s "
+                f"failed_count={saves_failed}"
+            )
+
     while _save_worker_running:
         try:
             # Get save job from queue (block for up to 1 second)
             try:
-                save_job = database_save_queue.get(timeout=1.0)
+                save_jobs = [database_save_queue.get(timeout=1.0)]
             except queue.Empty:
                 continue
-            
-            article_data = save_job['article_data']
-            impact = save_job['impact']
-            queued_time = save_job['queued_time']
-            article_hash = save_job['article_hash']
-            
-            # Calculate time in queue
+
+            # Take whatever else is already waiting, up to one batch
+            while len(save_jobs) < SAVE_BATCH_SIZE:
+                try:
+                    save_jobs.append(database_save_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            live_jobs = []
             now = timezone.now()
-            wait_time = (now - queued_time).total_seconds()
-            
-            logger.info(
-                f"SAVEQUEUE: 🔄 Processing save job: hash={article_hash[:8]} "
-                f"ticker={article_data.get('symbol')} wait_time={wait_time:.2f}s"
-            )
-            
-            # Check deadline (60 seconds max)
-            deadline_seconds = 60
-            if wait_time > deadline_seconds:
-                saves_deadline_exceeded += 1
-                logger.error(
-                    f"SAVEQUEUE: ⏰ DEADLINE_EXCEEDED hash={article_hash[:8]} "
-                    f"wait_time={wait_time:.1f}s > deadline={deadline_seconds}s "
-                    f"ticker={article_data.get('symbol')} "
-                    f"total_exceeded={saves_deadline_exceeded}"
+            for save_job in save_jobs:
+                article_data = save_job['article_data']
+                article_hash = save_job['article_hash']
+
+                # Calculate time in queue
+                wait_time = (now - save_job['queued_time']).total_seconds()
+
+                logger.info(
+                    f"SAVEQUEUE: 🔄 Processing save job: hash={article_hash[:8]} "
+                    f"ticker={article_data.get('symbol')} wait_time={wait_time:.2f}s"
                 )
-                database_save_queue.task_done()
-                continue
-            
-            # Attempt save with fast retries
-            remaining_time = deadline_seconds - wait_time
-            max_attempts = 3
-            retry_delay = 0.1  # Start with 100ms
-            save_succeeded = False
-            
-            for attempt in range(max_attempts):
+
+                # Check deadline (60 seconds max)
+                if wait_time > deadline_seconds:
+                    saves_deadline_exceeded += 1
+                    logger.error(
+                        f"SAVEQUEUE: ⏰ DEADLINE_EXCEEDED hash={article_hash[:8]} "
+                        f"wait_time={wait_time:.1f}s > deadline={deadline_seconds}s "
+                        f"ticker={article_data.get('symbol')} "
+                        f"total_exceeded={saves_deadline_exceeded}"
+                    )
+                    continue
+
+                live_jobs.append(save_job)
+
+            bulk_saved = False
+            if len(live_jobs) > 1:
                 try:
+                    saved = save_articles_bulk(live_jobs)
+                    saves_succeeded += saved
+                    bulk_saved = True
                     logger.info(
-                        f"SAVEQUEUE: 💾 SAVE_ATTEMPT attempt={attempt+1}/{max_attempts} "
-                        f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
-                        f"remaining_time={remaining_time:.2f}s"
+                        f"SAVEQUEUE: ✅ BULK_SAVE_SUCCESS count={saved} "
+                        f"success_count={saves_succeeded}"
                     )
-                    
-                    # Call the existing save function
-                    article = save_article_to_db(article_data, impact)
-                    
-                    if article:
-                        total_time = (timezone.now() - queued_time).total_seconds()
-                        saves_succeeded += 1
-                        logger.info(
-                            f"SAVEQUEUE: ✅ SAVE_SUCCESS hash={article_hash[:8]} "
-                            f"id={article.id} ticker={article_data.get('symbol')} "
-                            f"total_time={total_time:.2f}s attempt={attempt+1} "
-                            f"success_count={saves_succeeded}"
-                        )
-                        save_succeeded = True
-                        break
-                    else:
-                        logger.warning(
-                            f"SAVEQUEUE: ⚠️ SAVE_RETURNED_NONE attempt={attempt+1}/{max_attempts} "
-                            f"hash={article_hash[:8]}"
-                        )
-                        
                 except Exception as e:
                     logger.error(
-                        f"SAVEQUEUE: ❌ SAVE_EXCEPTION attempt={attempt+1}/{max_attempts} "
-                        f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
-                        f"error={type(e).__name__}: {str(e)[:100]}"
+                        f"SAVEQUEUE: ❌ BULK_SAVE_EXCEPTION count={len(live_jobs)} "
+                        f"error={type(e).__name__}: {str(e)[:100]} - falling back to single saves"
                     )
-                
-                # Check if we have time to retry
-                remaining_time = deadline_seconds - (timezone.now() - queued_time).total_seconds()
-                if remaining_time <= 0:
-                    logger.error(f"SAVEQUEUE: ⏰ NO_TIME_FOR_RETRY hash={article_hash[:8]}")
-                    break
-                
-                # Retry with exponential backoff (but respect deadline)
-                if attempt < max_attempts - 1:
-                    sleep_time = min(retry_delay, remaining_time - 0.1)  # Leave 100ms buffer
-                    if sleep_time > 0:
-                        logger.info(f"SAVEQUEUE: 🔄 RETRY_DELAY sleep={sleep_time:.2f}s attempt={attempt+1}")
-                        time.sleep(sleep_time)
-                        retry_delay = min(retry_delay * 1.5, 2.0)  # Cap at 2s
-            
-            # Final status
-            if not save_succeeded:
-                saves_failed += 1
-                total_time = (timezone.now() - queued_time).total_seconds()
-                logger.error(
-                    f"SAVEQUEUE: ❌ SAVE_FAILED_ALL_ATTEMPTS hash={article_hash[:8]} "
-                    f"ticker={article_data.get('symbol')} "
-                    f"attempts={max_attempts} total_time={total_time:.2f}s "
-                    f"failed_count={saves_failed}"
-                )
+
+            if not bulk_saved:
+                for save_job in live_jobs:
+                    save_with_retries(save_job)
             
             # Log queue status periodically
             queue_size = database_save_queue.qsize()
@@ -858,7 +1145,8 @@ def database_save_worker():
                     f"success={saves_succeeded} failed={saves_failed} exceeded={saves_deadline_exceeded}"
                 )
             
-            database_save_queue.task_done()
+            for _ in save_jobs:
+                database_save_queue.task_done()
             
         except Exception as e:
             logger.error(
@@ -876,27 +1164,36 @@ def database_save_worker():
 
 
 def start_scoring_thread():
-    """Start the background scoring thread."""
-    global _scoring_thread, _scoring_thread_running
+    """Start the background scoring threads (SCORING_WORKERS of them)."""
+    global _scoring_threads, _scoring_thread_running
     
-    if _scoring_thread and _scoring_thread.is_alive():
-        logger.warning("Scoring thread already running")
+    if any(thread.is_alive() for thread in _scoring_threads):
+        logger.warning("Scoring threads already running")
         return
     
     _scoring_thread_running = True
-    _scoring_thread = threading.Thread(target=scoring_worker, daemon=True)
-    _scoring_thread.start()
-    logger.info("Scoring thread started")
+    _scoring_threads = [
+        threading.Thread(target=scoring_worker, name=f"finnhub-scoring-{i}", daemon=True)
+        for i in range(max(1, SCORING_WORKERS))
+    ]
+    for thread in _scoring_threads:
+        thread.start()
+    logger.info("Scoring threads started (%d workers)", len(_scoring_threads))
 
 
 def stop_scoring_thread():
-    """Stop the background scoring thread."""
+    """Stop the background scoring threads."""
     global _scoring_thread_running
     
     _scoring_thread_running = False
-    if _scoring_thread:
-        _scoring_thread.join(timeout=5.0)
-    logger.info("Scoring thread stopped")
+    for _ in _scoring_threads:
+        try:
+            article_to_score_queue.put_nowait(STOP_SCORING)
+        except queue.Full:
+            break  # Workers are busy and will see the flag after their batch
+    for thread in _scoring_threads:
+        thread.join(timeout=5.0)
+    logger.info("Scoring threads stopped")
 
 
 def start_save_worker_thread():
@@ -936,6 +1233,61 @@ def stop_save_worker_thread():
 # FINNHUB QUERY (called every second from WebSocket)
 # ============================================================================
 
+def get_query_date():
+    """
+    Return (today's UTC date, 'YYYY-MM-DD').
+
+    The integer epoch day is the change detector, so the date and string are
+    only rebuilt once per day.
+    """
+    epoch_day = int(time.time()) // 86400
+    if _query_date[0] != epoch_day:
+        today_date = date(1970, 1, 1) + timedelta(days=epoch_day)
+        _query_date[:] = [epoch_day, today_date, today_date.strftime('%Y-%m-%d')]
+    return _query_date[1], _query_date[2]
+
+
+def get_recent_call_count():
+    """Approximate API calls in the last 60s (tokens spent and not yet refilled)."""
+    return int(MAX_CALLS_PER_MINUTE - max(_api_tokens, 0.0))
+
+
+def get_rate_limit_retry_after(exc):
+    """
+    Check whether a Finnhub call failed with HTTP 429.
+
+    finnhub.FinnhubAPIException and requests.HTTPError both carry the response,
+    so this branches on the status code instead of matching the error text.
+
+    Returns:
+        tuple: (is_rate_limited, Retry-After seconds or None)
+    """
+    response = getattr(exc, 'response', None)
+    status_code = getattr(exc, 'status_code', None) or getattr(response, 'status_code', None)
+    if status_code != 429:
+        return False, None
+
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        retry_after = float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        # Missing, or an HTTP-date (Finnhub sends seconds); fall back to the refill rate
+        retry_after = None
+    return True, retry_after
+
+
+# Read-only results for the static skip reasons, shared instead of built every tick
+_SKIP_REST_PERIOD = MappingProxyType(
+    {'symbol': None, 'articles_found': 0, 'queued_for_scoring': 0, 'reason': 'rest_period'}
+)
+_SKIP_RATE_LIMIT = MappingProxyType(
+    {'symbol': None, 'articles_found': 0, 'queued_for_scoring': 0, 'reason': 'rate_limit_per_minute'}
+)
+_SKIP_NO_CLIENT = MappingProxyType(
+    {'symbol': None, 'articles_found': 0, 'queued_for_scoring': 0, 'reason': 'no_client'}
+)
+
+
 def query_finnhub_for_news():
     """
     Query Finnhub for news on the next symbol in rotation.
@@ -949,40 +1301,51 @@ def query_finnhub_for_news():
             'articles_found': int,
             'queued_for_scoring': int
         }
+        (a shared read-only mapping for static skip reasons; don't mutate it)
     """
-    global _current_index, _last_query_time, _api_calls_this_minute, _consecutive_429_errors
+    global _current_index, _current_symbol, _last_query_time, _api_tokens, _api_tokens_refilled, _api_refill_rate
+    global _consecutive_429_errors, _rate_limit_logged
     
     # Check if we're in rest period (last 10 seconds of minute)
-    current_second = timezone.now().second
+    current_second = int(time.time()) % 60
     if current_second >= WORK_SECONDS:
-        return {
-            'symbol': None,
-            'articles_found': 0,
-            'queued_for_scoring': 0,
-            'reason': 'rest_period'
-        }
-    
-    # Enhanced rate limiting
-    now = time.time()
+        return _SKIP_REST_PERIOD
     
-    # Clean up old calls (remove calls older than 60 seconds)
-    _api_calls_this_minute = [t for t in _api_calls_this_minute if now - t < 60]
+    # Enhanced rate limiting (monotonic clock, immune to wall-clock jumps)
+    now = time.monotonic()
     
-    # Check if we've hit our per-minute limit
-    if len(_api_calls_this_minute) >= MAX_CALLS_PER_MINUTE:
-        logger.warning(
-            f"Rate limit: {len(_api_calls_this_minute)} calls in last 60s "
-            f"(max={MAX_CALLS_PER_MINUTE}). Skipping this query."
+    # Refill the token bucket for the time since the last check
+    if _api_tokens_refilled is not None:
+        _api_tokens = min(
+            MAX_CALLS_PER_MINUTE,
+            _api_tokens + (now - _api_tokens_refilled) * _api_refill_rate
         )
+    _api_tokens_refilled = now
+    
+    # After 429s the bucket is drained and refills slowly - that is the backoff
+    if _api_tokens < 1 and _consecutive_429_errors > 0:
         return {
             'symbol': None,
             'articles_found': 0,
             'queued_for_scoring': 0,
-            'reason': 'rate_limit_per_minute'
+            'reason': 'backoff_after_429',
+            'refill_rate_per_minute': _api_refill_rate * 60,
+            'consecutive_errors': _consecutive_429_errors
         }
     
+    # Check if we've hit our per-minute limit
+    if _api_tokens < 1:
+        # Warn once per rate-limited stretch rather than on every skipped tick
+        if not _rate_limit_logged:
+            _rate_limit_logged = True
+            logger.warning(
+                "Rate limit: ~%d calls in last 60s (max=%d). Skipping queries until a token frees up.",
+                get_recent_call_count(), MAX_CALLS_PER_MINUTE
+            )
+        return _SKIP_RATE_LIMIT
+    
     # Enforce minimum time between calls
-    if _last_query_time and (now - _last_query_time) < MIN_SECONDS_BETWEEN_CALLS:
+    if _last_query_time is not None and (now - _last_query_time) < MIN_SECONDS_BETWEEN_CALLS:
         time_to_wait = MIN_SECONDS_BETWEEN_CALLS - (now - _last_query_time)
         return {
             'symbol': None,
@@ -992,59 +1355,57 @@ def query_finnhub_for_news():
             'wait_time': time_to_wait
         }
     
-    # If we've had consecutive 429 errors, back off exponentially
-    if _consecutive_429_errors > 0:
-        backoff_time = min(60, 2 ** _consecutive_429_errors)  # Cap at 60 seconds
-        if _last_query_time and (now - _last_query_time) < backoff_time:
-            return {
-                'symbol': None,
-                'articles_found': 0,
-                'queued_for_scoring': 0,
-                'reason': 'backoff_after_429',
-                'backoff_seconds': backoff_time,
-                'consecutive_errors': _consecutive_429_errors
-            }
-    
-    # Get Finnhub client
-    client = get_finnhub_client()
-    if not client:
+    # Back off while the scoring workers are behind
+    score_queue_depth = article_to_score_queue.qsize()
+    if score_queue_depth >= SCORE_QUEUE_SKIP_DEPTH:
         return {
             'symbol': None,
             'articles_found': 0,
             'queued_for_scoring': 0,
-            'reason': 'no_client'
+            'reason': 'queue_pressure',
+            'queue_size': score_queue_depth
         }
+    max_to_queue = 1 if score_queue_depth >= SCORE_QUEUE_THROTTLE_DEPTH else None
+    
+    # Get Finnhub client
+    client = get_finnhub_client()
+    if not client:
+        return _SKIP_NO_CLIENT
     
     # Get next symbol
-    symbol = WATCHLIST[_current_index % len(WATCHLIST)]
+    symbol = _current_symbol = WATCHLIST[_current_index]
     _current_index += 1
+    if _current_index == WATCHLIST_SIZE:
+        _current_index = 0
+    
+    # Current calendar day (cached per UTC day); the try below only covers the API call
+    # and response handling
+    today_date, today_str = get_query_date()
+    
+    # Record this API call
+    _api_tokens -= 1
+    _last_query_time = now
+    _rate_limit_logged = False
     
     try:
-        # Record this API call
-        _api_calls_this_minute.append(now)
-        _last_query_time = now
-        
         # Query Finnhub for company news (current calendar day only)
-        today = datetime.now()
-        today_date = today.date()
-        
         articles = client.company_news(
             symbol,
-            _from=today_date.strftime('%Y-%m-%d'),
-            to=today_date.strftime('%Y-%m-%d')
+            _from=today_str,
+            to=today_str
         )
         
-        # Reset consecutive errors on success
+        # Reset consecutive errors on success and additively restore the refill rate
         _consecutive_429_errors = 0
+        _api_refill_rate = min(MAX_REFILL_RATE, _api_refill_rate + REFILL_RATE_STEP)
 
         # Discovery-level logging for visibility into each API call
-        total_returned = len(articles) if isinstance(articles, list) else 0
-        logger.info(
-            f"FINNHUB QUERY: symbol={symbol}, "
-            f"from={today_date.strftime('%Y-%m-%d')} to={today_date.strftime('%Y-%m-%d')}, "
-            f"articles_returned={total_returned}, "
-            f"api_calls_last_60s={len(_api_calls_this_minute)}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "FINNHUB QUERY: symbol=%s, from=%s to=%s, articles_returned=%d, api_calls_last_60s=%d",
+                symbol, today_str, today_str, len(articles) if isinstance(articles, list) else 0,
+                get_recent_call_count()
+            )
         
         if not articles:
             return {
@@ -1053,14 +1414,23 @@ def query_finnhub_for_news():
                 'queued_for_scoring': 0
             }
         
-        # Filter articles to current calendar day only (API might return articles from other days due to timezone)
-        today_start_utc = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end_utc = timezone.now()
-        filtered_articles = []
+        # Finnhub returns the whole day's list on every call, so check the processed-article
+        # LRU first (one hash + dict lookup) and only parse dates for articles not seen yet
         filtered_count = 0
+        queued = 0
         
         for article in articles:
-            # Check published date
+            url = article.get('url', '')
+            
+            if not url:
+                continue
+
+            # Hash the URL once; the scoring worker reuses the key to mark it processed
+            processed_key = get_processed_key(url)
+            if processed_key in _processed_articles:
+                continue
+
+            # Filter articles to current calendar day only (API might return articles from other days due to timezone)
             article_datetime = article.get('datetime', 0)
             if article_datetime:
                 try:
@@ -1069,7 +1439,6 @@ def query_finnhub_for_news():
                         published_at = datetime.fromtimestamp(article_datetime, tz=dt_timezone.utc)
                     else:
                         # Try parsing as string
-                        from django.utils.dateparse import parse_datetime
                         published_at = parse_datetime(str(article_datetime))
                         if published_at and timezone.is_naive(published_at):
                             published_at = published_at.replace(tzinfo=dt_timezone.utc)
@@ -1079,44 +1448,41 @@ def query_finnhub_for_news():
                         filtered_count += 1
                         if filtered_count <= 3:
                             logger.info(
-                                f"FINNHUB FILTER: Skipping article from {published_at.date()}: "
-                                f"{article.get('headline', '')[:60]}..."
+                                "FINNHUB FILTER: Skipping article from %s: %.60s...",
+                                published_at.date(), article.get('headline', '')
                             )
+                        if published_at.date() < today_date:
+                            # Can never become today's news; skip it at the LRU check next time
+                            mark_processed_key(processed_key)
                         continue
                 except Exception as e:
-                    logger.debug(f"Error parsing article datetime {article_datetime}: {e}")
+                    logger.debug("Error parsing article datetime %s: %s", article_datetime, e)
                     # If we can't parse, allow through (better to include than exclude)
             
-            filtered_articles.append(article)
-        
-        if filtered_count > 0:
-            logger.info(f"FINNHUB FILTER: Filtered out {filtered_count} articles not from today")
-        
-        # Process all new articles (queue overflow protection handles excess)
-        queued = 0
-        for article in filtered_articles:
-            url = article.get('url', '')
-            
-            if not url or is_article_processed(url):
-                continue
-            
-            # New article! Queue for scoring
-            article_data = {
-                'headline': article.get('headline', ''),
-                'summary': article.get('summary', ''),
-                'symbol': symbol,
-                'url': url,
-                'published': article.get('datetime', 0)
-            }
+            # New article! Queue the API's own dict for scoring instead of copying it,
+            # adding the fields the scoring and save workers expect (text fields normalised
+            # to str, since the API can send null)
+            article['headline'] = str(article.get('headline') or '')
+            article['summary'] = str(article.get('summary') or '')
+            article['symbol'] = symbol
+            article['published'] = article_datetime
+            article['processed_key'] = processed_key
             
             # Try to queue, but don't block if queue is full (prevents memory exhaustion)
             try:
-                article_to_score_queue.put_nowait(article_data)
+                article_to_score_queue.put_nowait(article)
                 queued += 1
-                logger.info(f"Queued {symbol} article for scoring: {article_data['headline'][:60]}...")
+                logger.info("Queued %s article for scoring: %.60s...", symbol, article['headline'])
             except queue.Full:
-                logger.warning(f"Article queue full, skipping {symbol} article (system under load)")
+                logger.warning("Article queue full, skipping %s article (system under load)", symbol)
+                break
+            if queued == max_to_queue:
+                # Scoring queue under pressure; the rest are picked up on this symbol's next turn
+                break
         
+        if filtered_count > 0:
+            logger.info("FINNHUB FILTER: Filtered out %d articles not from today", filtered_count)
+
         return {
             'symbol': symbol,
             'articles_found': len(articles),
@@ -1125,14 +1491,18 @@ def query_finnhub_for_news():
     
     except Exception as e:
         # Check if this is a 429 rate limit error
-        error_str = str(e)
-        if '429' in error_str or 'rate limit' in error_str.lower() or 'API limit reached' in error_str:
+        is_rate_limited, retry_after = get_rate_limit_retry_after(e)
+        if is_rate_limited:
+            # Congestion signal: drain the bucket and halve the refill rate
             _consecutive_429_errors += 1
+            _api_refill_rate = max(MIN_REFILL_RATE, _api_refill_rate * 0.5)
+            # Honor Retry-After by going into token debt: the next token is ready
+            # exactly retry_after seconds from now at the new refill rate
+            _api_tokens = 1.0 - retry_after * _api_refill_rate if retry_after else 0.0
+            # Known condition: no traceback, and lazy args so a 429 storm costs little
             logger.error(
-                f"⚠️ RATE LIMIT ERROR (429) for {symbol}: {e}\n"
-                f"   Consecutive 429 errors: {_consecutive_429_errors}\n"
-                f"   API calls in last 60s: {len(_api_calls_this_minute)}\n"
-                f"   Next backoff: {min(60, 2 ** _consecutive_429_errors)} seconds"
+                "⚠️ RATE LIMIT ERROR (429) for %s: %s (consecutive=%d, refill rate now %.1f calls/minute)",
+                symbol, e, _consecutive_429_errors, _api_refill_rate * 60
             )
             return {
                 'symbol': symbol,
@@ -1140,12 +1510,13 @@ def query_finnhub_for_news():
                 'queued_for_scoring': 0,
                 'error': 'rate_limit_429',
                 'consecutive_errors': _consecutive_429_errors,
-                'calls_last_minute': len(_api_calls_this_minute)
+                'retry_after': retry_after,
+                'calls_last_minute': get_recent_call_count()
             }
         else:
             # Other error - reset consecutive 429 counter
             _consecutive_429_errors = 0
-            logger.error(f"Error querying Finnhub for {symbol}: {e}", exc_info=True)
+            logger.error("Error querying Finnhub for %s: %s", symbol, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 'symbol': symbol,
                 'articles_found': 0,
@@ -1165,15 +1536,13 @@ def get_scored_articles():
     Returns:
         list: List of article impacts (floats)
     """
-    impacts = []
-    
-    try:
-        while not scored_article_queue.empty():
-            impact = scored_article_queue.get_nowait()
-            impacts.append(impact)
-    except queue.Empty:
-        pass
-    
+    global scored_article_queue
+
+    # Swap in an empty buffer under the lock; copy the old one after releasing it
+    with scored_article_lock:
+        scored, scored_article_queue = scored_article_queue, deque(maxlen=SCORED_QUEUE_MAX)
+    impacts = list(scored)
+
     return impacts
 
 
@@ -1186,11 +1555,12 @@ def get_stats():
     return {
         'enabled': FINNHUB_AVAILABLE and bool(FINNHUB_API_KEY),
         'current_index': _current_index,
-        'current_symbol': WATCHLIST[_current_index % len(WATCHLIST)] if _current_index > 0 else None,
+        'current_symbol': _current_symbol,
         'queue_size': article_to_score_queue.qsize(),
-        'scored_queue_size': scored_article_queue.qsize(),
+        'scored_queue_size': len(scored_article_queue),
         'save_queue_size': database_save_queue.qsize(),
-        'scoring_thread_alive': _scoring_thread.is_alive() if _scoring_thread else False,
+        'scoring_thread_alive': any(thread.is_alive() for thread in _scoring_threads),
+        'scoring_threads_alive': sum(thread.is_alive() for thread in _scoring_threads),
         'save_worker_alive': _save_worker_thread.is_alive() if _save_worker_thread else False
     }
 
@@ -17,12 +17,17 @@ import threading
 import queue
 import time
 import hashlib
+import math
+import random
+from collections import OrderedDict, deque
 import json
 import os
 from datetime import datetime, timedelta, timezone as dt_timezone
+from django.db import IntegrityError, OperationalError, DatabaseError
 from django.utils import timezone
-from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
 from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
@@ -61,37 +66,53 @@ RSS_FEEDS_CONFIG_PATH = os.path.join(
 RSS_TICK_INTERVAL = 1  # Poll every second (process 1 feed per call)
 PER_FEED_MIN_INTERVAL = 60  # Don't poll same feed more than once per 60 seconds
 
+# Per-host token buckets (several feeds can share a host). Each host refills at its
+# own rate: halved with jitter on 429/503, restored additively on success
+HOST_BUCKET_CAPACITY = 3
+HOST_MAX_REFILL_RATE = 12 / 60.0  # tokens/second (at most one request per 5s per host)
+HOST_MIN_REFILL_RATE = 1 / 600.0  # one request per 10 minutes
+HOST_REFILL_RATE_STEP = HOST_MAX_REFILL_RATE / 10
+THROTTLE_STATUS_CODES = (429, 503)
+
 # HTTP configuration
 REQUEST_TIMEOUT = 3  # seconds
 USER_AGENT = 'Mozilla/5.0 (compatible; NasdaqSentimentBot/1.0)'
 
-# Market cap weights (same as other collectors for consistency)
-from api.management.commands.nasdaq_config import COMPANY_NAMES
-MARKET_CAP_WEIGHTS = {ticker: 1.0/len(COMPANY_NAMES) for ticker in COMPANY_NAMES.keys()}
-# Override with known large caps
-MARKET_CAP_WEIGHTS.update({
-    'AAPL': 0.14, 'MSFT': 0.13, 'GOOGL': 0.08, 'AMZN': 0.07,
-    'NVDA': 0.06, 'META': 0.04, 'TSLA': 0.03, 'AVGO': 0.03
-})
+# Per-ticker impact scales (shared with Finnhub for consistency)
+from api.management.commands.finnhub_realtime_v2 import IMPACT_SCALE, DEFAULT_IMPACT_SCALE
+
+# Save retry policy (shared with Finnhub)
+from api.management.commands.finnhub_realtime_v2 import (
+    SAVE_MAX_RETRIES, is_duplicate_error, should_retry_save
+)
+from api.management.commands.finnhub_realtime_v2 import PUBLISHED_TS_MIN, PUBLISHED_TS_MAX
+
+# Text cleaning and the Ticker cache (shared with Finnhub, so fixes land in one place)
+from api.management.commands.finnhub_realtime_v2 import sanitize_text, get_cached_ticker, _ticker_cache
 
 # State tracking
 _feeds = []  # List of feed URLs loaded from config
 _current_feed_index = 0  # Current position in rotation
 _feed_last_polled = {}  # Dict of feed_url -> timestamp of last poll
+_host_buckets = {}  # netloc -> [tokens, time.monotonic() of last refill, refill rate]
 _query_count = 0
 
-# Article cache (prevent re-processing)
-ARTICLE_CACHE_KEY = 'rss_articles_processed'
-ARTICLE_CACHE_DURATION = 3600  # 1 hour
+# Article cache (prevent re-processing) - in-process LRU keyed by 8-byte URL digest
+ARTICLE_CACHE_MAX_SIZE = 50_000
+_processed_articles = OrderedDict()  # digest -> time marked processed
+_processed_articles_lock = threading.Lock()
 
 # Queues for threading (same pattern as other collectors)
 article_to_score_queue = queue.Queue(maxsize=500)  # Articles needing scoring
-scored_article_queue = queue.Queue()  # Articles that have been scored
+SCORED_QUEUE_MAX = 1024  # Oldest impacts are dropped if get_scored_articles() stops draining
+scored_article_queue = deque(maxlen=SCORED_QUEUE_MAX)  # Impacts of scored articles (guarded by scored_article_lock)
+scored_article_lock = threading.Lock()
 database_save_queue = queue.Queue(maxsize=500)  # Articles to save to database
 
 # Worker threads
 _scoring_thread = None
 _scoring_thread_running = False
+STOP_SCORING = object()  # Queued by stop_scoring_thread() to wake the idle worker
 _save_worker_thread = None
 _save_worker_running = False
 
@@ -155,9 +176,12 @@ def load_rss_feeds():
                 valid_feeds.append(feed)
             elif isinstance(feed, str) and feed:
                 # Support simple string URLs too
-                valid_feeds.append({'url': feed, 'source': 'RSS'})
+                feed = {'url': feed, 'source': 'RSS'}
+                valid_feeds.append(feed)
             else:
                 logger.warning(f"RSSNEWS: ⚠️ Skipping invalid feed at index {idx}: {feed}")
+                continue
+            feed['host'] = urlparse(feed['url']).netloc
         
         _feeds = valid_feeds
         
@@ -187,93 +211,36 @@ def load_rss_feeds():
 def get_article_hash(article_url):
     """Generate hash for article URL."""
     try:
-        return hashlib.md5(article_url.encode('utf-8')).hexdigest()
+        return hashlib.md5(article_url.encode('utf-8'), usedforsecurity=False).hexdigest()
     except Exception as e:
         logger.error(f"RSSNEWS: Error hashing article URL: {e}")
         return None
 
 
+def get_processed_key(article_url):
+    """Compact in-memory dedup key for article URL (not stored in the database)."""
+    return hashlib.blake2b(article_url.encode('utf-8', 'ignore'), digest_size=8).digest()
+
+
 def is_article_processed(article_url):
     """Check if article has already been processed."""
-    try:
-        article_hash = get_article_hash(article_url)
-        if not article_hash:
-            return False
-        
-        processed = cache.get(ARTICLE_CACHE_KEY, set())
-        return article_hash in processed
-    
-    except Exception as e:
-        logger.error(f"RSSNEWS: Error checking article cache: {e}")
-        return False
+    return get_processed_key(article_url) in _processed_articles
 
 
 def mark_article_processed(article_url):
-    """Mark article as processed in cache."""
-    try:
-        article_hash = get_article_hash(article_url)
-        if not article_hash:
-            return
-        
-        processed = cache.get(ARTICLE_CACHE_KEY, set())
-        processed.add(article_hash)
-        cache.set(ARTICLE_CACHE_KEY, processed, ARTICLE_CACHE_DURATION)
-    
-    except Exception as e:
-        logger.error(f"RSSNEWS: Error marking article as processed: {e}")
+    """Mark article as processed, evicting the oldest entries past ARTICLE_CACHE_MAX_SIZE."""
+    key = get_processed_key(article_url)
+    with _processed_articles_lock:
+        _processed_articles[key] = time.time()
+        _processed_articles.move_to_end(key)
+        while len(_processed_articles) > ARTICLE_CACHE_MAX_SIZE:
+            _processed_articles.popitem(last=False)
 
 
 # ============================================================================
 # DATABASE SAVING (copied from finnhub_realtime_v2.py with RSS adaptations)
 # ============================================================================
 
-def sanitize_text(text, field_name="text", max_length=None):
-    """
-    Sanitize text for database storage - removes null bytes, control chars, normalizes whitespace.
-    
-    Args:
-        text: Text to sanitize
-        field_name: Name of field for logging
-        max_length: Maximum length to truncate to
-    
-    Returns:
-        Sanitized text string
-    """
-    if not text:
-        return ""
-    
-    original_length = len(text)
-    issues_found = []
-    
-    # Remove null bytes (PostgreSQL can't store these)
-    if '\x00' in text:
-        text = text.replace('\x00', '')
-        issues_found.append("null_bytes")
-    
-    # Remove other control characters (0x01-0x1F) except tab, newline, carriage return
-    text_clean = ''.join(char for char in text if ord(char) >= 32 or char in '\t\n\r')
-    if len(text_clean) != len(text):
-        issues_found.append("control_chars")
-        text = text_clean
-    
-    # Normalize whitespace (collapse multiple spaces)
-    text = ' '.join(text.split())
-    
-    # Truncate if needed
-    if max_length and len(text) > max_length:
-        text = text[:max_length]
-        issues_found.append(f"truncated_to_{max_length}")
-    
-    # Log if sanitization occurred
-    if issues_found:
-        logger.info(
-            f"NEWSSAVING: 🧹 Sanitized {field_name}: "
-            f"issues={','.join(issues_found)} original_len={original_length} final_len={len(text)}"
-        )
-    
-    return text.strip()
-
-
 def safe_float(value, field_name="float", default=0.0, min_val=-1e10, max_val=1e10):
     """
     Validate float is not NaN/Inf and within safe range.
@@ -288,8 +255,6 @@ def safe_float(value, field_name="float", default=0.0, min_val=-1e10, max_val=1e
     Returns:
         Safe float value
     """
-    import math
-    
     if value is None:
         return default
     
@@ -324,6 +289,10 @@ def safe_url(url, max_length=500):
     if not url:
         return ""
     
+    # Fast path: no whitespace or control chars to touch and within max_length
+    if len(url) <= max_length and ' ' not in url and url.isprintable():
+        return url
+    
     original = url
     url = str(url).strip()
     
@@ -338,7 +307,7 @@ def safe_url(url, max_length=500):
         url = url[:max_length]
     
     if url != original:
-        logger.info(f"NEWSSAVING: 🔗 Cleaned URL: original_len={len(original)} final_len={len(url)}")
+        logger.info("NEWSSAVING: 🔗 Cleaned URL: original_len=%d final_len=%d", len(original), len(url))
     
     return url
 
@@ -355,20 +324,13 @@ def save_article_to_db(article_data, impact):
         impact: Calculated sentiment impact
     
     Returns:
-        NewsArticle instance or None if all retries fail
+        NewsArticle instance (the existing row for a duplicate), or None if the save fails
     """
-    max_retries = 3
-    retry_delay = 0.5  # seconds
-    
-    for attempt in range(max_retries):
-        try:
-            from api.models import NewsArticle, Ticker
-            from django.utils.dateparse import parse_datetime
-            from django.utils import timezone
-            from django.db import IntegrityError, OperationalError, DatabaseError
-            import time
+    from api.models import NewsArticle
 
-            logger.info(f"NEWSSAVING: 📥 ENTRY attempt={attempt+1}/{max_retries} source=RSS")
+    for attempt in range(SAVE_MAX_RETRIES):
+        try:
+            logger.info("NEWSSAVING: 📥 ENTRY attempt=%d/%d source=RSS", attempt + 1, SAVE_MAX_RETRIES)
 
             # ============================================================
             # 1. VALIDATE AND CLEAN ARTICLE DATA
@@ -378,11 +340,11 @@ def save_article_to_db(article_data, impact):
             ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper()
             if not ticker_symbol:
                 ticker_symbol = 'QLD'
-                logger.info(f"NEWSSAVING: ⚠️ Empty symbol, using QLD")
+                logger.info("NEWSSAVING: ⚠️ Empty symbol, using QLD")
             
             # Get headline with fallback and sanitization
             headline = str(article_data.get('headline', '')).strip()
-            if not headline or not headline.replace(' ', ''):
+            if not headline or headline.isspace():
                 headline = f"[No headline] Article from RSS"
                 logger.warning(f"NEWSSAVING: ⚠️ Missing/empty headline, using fallback: {headline}")
             
@@ -407,30 +369,16 @@ def save_article_to_db(article_data, impact):
                 logger.warning(f"NEWSSAVING: ⚠️ Missing URL, generated: {url}")
             url = safe_url(url, max_length=500)
 
-            logger.info(f"NEWSSAVING: 📊 DATA ticker={ticker_symbol} headline_len={len(headline)} url_len={len(url)} impact={impact:.2f}")
+            logger.info(
+                "NEWSSAVING: 📊 DATA ticker=%s headline_len=%d url_len=%d impact=%.2f",
+                ticker_symbol, len(headline), len(url), impact
+            )
 
             # ============================================================
-            # 2. GET OR CREATE TICKER
+            # 2. GET OR CREATE TICKER (cached)
             # ============================================================
             
-            ticker = None
-            try:
-                ticker = Ticker.objects.get(symbol=ticker_symbol)
-                logger.debug(f"NEWSSAVING: ✓ Ticker found: {ticker_symbol}")
-            except Ticker.DoesNotExist:
-                logger.warning(f"NEWSSAVING: ⚠️ Ticker {ticker_symbol} not found, trying QLD fallback")
-                try:
-                    ticker = Ticker.objects.get(symbol='QLD')
-                    logger.info(f"NEWSSAVING: ✓ Using QLD fallback for {ticker_symbol}")
-                except Ticker.DoesNotExist:
-                    # Last resort: create QLD ticker if it doesn't exist
-                    logger.warning("NEWSSAVING: ⚠️ QLD ticker missing! Creating it now...")
-                    ticker, created = Ticker.objects.get_or_create(
-                        symbol='QLD',
-                        defaults={'company_name': 'ProShares Ultra QQQ (2x Leveraged NASDAQ-100 ETF)'}
-                    )
-                    if created:
-                        logger.info("NEWSSAVING: ✓ Created QLD ticker")
+            ticker = get_cached_ticker(ticker_symbol)
 
             # ============================================================
             # 3. PARSE AND VALIDATE PUBLISHED DATE
@@ -442,7 +390,7 @@ def save_article_to_db(article_data, impact):
                     published_timestamp = article_data['published']
                     if isinstance(published_timestamp, (int, float)):
                         # Validate timestamp is in reasonable range
-                        if published_timestamp < 0 or published_timestamp > 4102444800:  # Year 2100
+                        if not PUBLISHED_TS_MIN <= published_timestamp <= PUBLISHED_TS_MAX:
                             logger.warning(f"NEWSSAVING: ⚠️ Timestamp out of range: {published_timestamp}, using now")
                             published_at = timezone.now()
                         else:
@@ -463,7 +411,7 @@ def save_article_to_db(article_data, impact):
             # Ensure timezone-aware
             if timezone.is_naive(published_at):
                 published_at = timezone.make_aware(published_at)
-                logger.debug(f"NEWSSAVING: 🕐 Made datetime timezone-aware")
+                logger.debug("NEWSSAVING: 🕐 Made datetime timezone-aware")
 
             # ============================================================
             # 4. GENERATE AND VALIDATE ARTICLE HASH
@@ -480,27 +428,21 @@ def save_article_to_db(article_data, impact):
                 logger.warning(f"NEWSSAVING: ⚠️ Hash generation error: {e}")
             
             if not article_hash:
-                # Fallback: generate hash from headline + timestamp
-                import hashlib
+                # Fallback: generate hash from headline + timestamp (BLAKE2b, 32 hex chars like MD5)
                 fallback_string = f"{headline}_{ticker_symbol}_{int(published_at.timestamp())}"
-                article_hash = hashlib.md5(fallback_string.encode('utf-8', errors='ignore')).hexdigest()
+                article_hash = hashlib.blake2b(fallback_string.encode('utf-8', errors='ignore'), digest_size=16).hexdigest()
                 logger.warning(f"NEWSSAVING: ⚠️ Using fallback hash: {article_hash[:8]}")
 
             # ============================================================
             # 5. VALIDATE AND CALCULATE SENTIMENT (NaN/Inf safe)
             # ============================================================
             
-            # Validate impact value
+            # Validate impact value (the only NaN/Inf/range check it needs)
             impact = safe_float(impact, field_name="impact", default=0.0, min_val=-100, max_val=100)
             
-            weight = MARKET_CAP_WEIGHTS.get(ticker_symbol, 0.01)
-            if weight == 0 or weight is None:
-                weight = 0.01  # Prevent division by zero
-                logger.debug(f"NEWSSAVING: ⚠️ Weight was 0, using 0.01")
-            
-            # Calculate with overflow protection
+            # Calculate with overflow protection (scales are always non-zero)
             try:
-                estimated_sentiment = impact / (weight * 100 * 100)
+                estimated_sentiment = impact / IMPACT_SCALE.get(ticker_symbol, DEFAULT_IMPACT_SCALE)
                 estimated_sentiment = safe_float(
                     estimated_sentiment, 
                     field_name="estimated_sentiment",
@@ -517,14 +459,10 @@ def save_article_to_db(article_data, impact):
             # ============================================================
             
             logger.info(
-                f"NEWSSAVING: 💾 SAVING hash={article_hash[:8]} ticker={ticker_symbol} "
-                f"sentiment={estimated_sentiment:.3f} impact={impact:.2f}"
+                "NEWSSAVING: 💾 SAVING hash=%.8s ticker=%s sentiment=%.3f impact=%.2f",
+                article_hash, ticker_symbol, estimated_sentiment, impact
             )
             
-            # Validate all float fields one more time before save
-            safe_impact = safe_float(impact, "final_impact", 0.0, -100, 100)
-            safe_sentiment = safe_float(estimated_sentiment, "final_sentiment", 0.0, -1.0, 1.0)
-            
             # Get actual source name from article_data (e.g., "Bloomberg Markets", "Reuters")
             actual_source = article_data.get('source', 'RSS (Real-Time)')
 
@@ -539,13 +477,13 @@ def save_article_to_db(article_data, impact):
                     'url': url,
                     'published_at': published_at,
                     'article_type': 'market',  # Default RSS articles to 'market' type
-                    'base_sentiment': safe_sentiment,
+                    'base_sentiment': estimated_sentiment,
                     'surprise_factor': 1.0,
                     'novelty_score': 1.0,
                     'source_credibility': 0.7,  # Slightly lower than Finnhub (0.8)
                     'recency_weight': 1.0,
-                    'article_score': safe_impact,
-                    'weighted_contribution': safe_impact,
+                    'article_score': impact,
+                    'weighted_contribution': impact,
                     'is_analyzed': True,
                     'sentiment_cached': False
                 }
@@ -554,76 +492,69 @@ def save_article_to_db(article_data, impact):
             # Success!
             if created:
                 logger.info(
-                    f"NEWSSAVING: ✅ SAVED_NEW hash={article_hash[:8]} id={article.id} "
-                    f"ticker={ticker_symbol} headline={headline[:50]}..."
+                    "NEWSSAVING: ✅ SAVED_NEW hash=%.8s id=%s ticker=%s headline=%.50s...",
+                    article_hash, article.id, ticker_symbol, headline
                 )
             else:
                 logger.info(
-                    f"NEWSSAVING: ♻️ UPDATED hash={article_hash[:8]} id={article.id} ticker={ticker_symbol}"
+                    "NEWSSAVING: ♻️ UPDATED hash=%.8s id=%s ticker=%s",
+                    article_hash, article.id, ticker_symbol
                 )
 
             return article
 
         except IntegrityError as e:
-            # Constraint violation - retry
-            error_msg = str(e).lower()
-            if 'unique constraint' in error_msg or 'duplicate key' in error_msg:
-                logger.warning(
-                    f"NEWSSAVING: 🔄 DUPLICATE hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"attempt={attempt + 1}/{max_retries}"
-                )
-            else:
+            if is_duplicate_error(e) and 'article_hash' in locals():
+                # Another writer inserted the same article first - it's saved, don't retry
                 logger.warning(
-                    f"NEWSSAVING: ⚠️ INTEGRITY_ERROR attempt={attempt + 1}/{max_retries} error={e}"
+                    f"NEWSSAVING: 🔄 DUPLICATE hash={article_hash[:8]} "
+                    f"attempt={attempt + 1}/{SAVE_MAX_RETRIES}"
                 )
+                return NewsArticle.objects.filter(article_hash=article_hash).first()
+
+            # Other constraint violation - retry with fresh ticker lookups
+            # in case a cached ticker was removed
+            _ticker_cache.clear()
+            logger.warning(
+                f"NEWSSAVING: ⚠️ INTEGRITY_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} error={e}"
+            )
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
+            retry, delay = should_retry_save(e, attempt)
+            if retry:
+                time.sleep(delay)
                 continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_INTEGRITY hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"error={e}"
-                )
-                return None
+            logger.error(
+                f"NEWSSAVING: ❌ FAILED_INTEGRITY hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
+                f"error={e}"
+            )
+            return None
 
         except (OperationalError, DatabaseError) as e:
-            # Database connection, deadlock, timeout - retry
+            # Database connection, deadlock, timeout - retry; anything else fails now
+            retry, delay = should_retry_save(e, attempt)
             logger.warning(
-                f"NEWSSAVING: 🔄 DATABASE_ERROR attempt={attempt + 1}/{max_retries} error={e}"
+                f"NEWSSAVING: 🔄 DATABASE_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} error={e}"
             )
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
+            if retry:
+                time.sleep(delay)
                 continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_DATABASE after {max_retries} attempts error={e}"
-                )
-                return None
+            logger.error(
+                f"NEWSSAVING: ❌ FAILED_DATABASE after {attempt + 1} attempts error={e}"
+            )
+            return None
 
         except MemoryError as e:
             logger.error(f"NEWSSAVING: ❌ MEMORY_ERROR (out of memory): {e}")
             return None
 
         except Exception as e:
-            # Unexpected error - log and retry
+            # Unexpected error - log and give up (a retry would fail the same way)
             logger.error(
-                f"NEWSSAVING: ❌ UNEXPECTED_ERROR attempt={attempt + 1}/{max_retries} error={e}",
+                f"NEWSSAVING: ❌ UNEXPECTED_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} error={e}",
                 exc_info=True
             )
-            
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_ALL_RETRIES after {max_retries} attempts"
-                )
-                return None
+            return None
     
     # Should never reach here
     logger.error(f"NEWSSAVING: ❌ FAILED_UNEXPECTED_EXIT")
@@ -688,10 +619,7 @@ Just the number, nothing else.
         sentiment = max(-1.0, min(1.0, sentiment))  # Clamp to range
         
         # Calculate impact (same formula as other collectors)
-        article_score = sentiment * 100  # Scale to -100/+100
-        weight = MARKET_CAP_WEIGHTS.get(symbol, 0.01)
-        weighted_contribution = article_score * weight
-        impact = weighted_contribution * 100
+        impact = sentiment * IMPACT_SCALE.get(symbol, DEFAULT_IMPACT_SCALE)
 
         # Tiered impact caps based on sentiment strength (reduces noise, amplifies strong signals)
         abs_sentiment = abs(sentiment)
@@ -719,7 +647,7 @@ Just the number, nothing else.
         return float(impact)
     
     except Exception as e:
-        logger.error(f"RSSNEWS: Error scoring article: {e}", exc_info=True)
+        logger.error("RSSNEWS: Error scoring article: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return 0.0
 
 
@@ -738,11 +666,10 @@ def scoring_worker():
 
     while _scoring_thread_running:
         try:
-            # Get article from queue (block for up to 1 second)
-            try:
-                article_data = article_to_score_queue.get(timeout=1.0)
-            except queue.Empty:
-                continue
+            # Sleep until an article arrives; stop_scoring_thread() wakes us with a sentinel
+            article_data = article_to_score_queue.get()
+            if article_data is STOP_SCORING:
+                continue  # Re-check _scoring_thread_running (stale sentinels are skipped)
 
             # Score the article
             impact = score_article_with_ai(
@@ -752,7 +679,10 @@ def scoring_worker():
             )
 
             # Priority 1: Put impact in scored queue IMMEDIATELY (sentiment update)
-            scored_article_queue.put(impact)
+            with scored_article_lock:
+                if len(scored_article_queue) == SCORED_QUEUE_MAX:
+                    logger.warning("Scored article queue full (%d), dropping oldest impact", SCORED_QUEUE_MAX)
+                scored_article_queue.append(impact)
             logger.info(f"RSSNEWS_SCORING: ✅ Scored and queued impact: {article_data['symbol']} impact={impact:+.2f}")
 
             # Priority 2: Queue for database save (async, non-blocking)
@@ -772,7 +702,7 @@ def scoring_worker():
             mark_article_processed(article_data['url'])
 
         except Exception as e:
-            logger.error(f"RSSNEWS: Error in scoring worker: {e}", exc_info=True)
+            logger.error("RSSNEWS: Error in scoring worker: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
     logger.info("RSSNEWS: Article scoring thread stopped")
 
@@ -903,6 +833,10 @@ def stop_scoring_thread():
     try:
         logger.info("RSSNEWS: 🛑 Stopping scoring thread...")
         _scoring_thread_running = False
+        try:
+            article_to_score_queue.put_nowait(STOP_SCORING)
+        except queue.Full:
+            pass  # Worker is busy and will see the flag after this article
         
         if _scoring_thread:
             _scoring_thread.join(timeout=5.0)
@@ -958,7 +892,6 @@ def parse_rss_date(date_string):
     
     try:
         # Try ISO 8601 format
-        from django.utils.dateparse import parse_datetime
         dt = parse_datetime(date_string)
         if dt:
             if timezone.is_naive(dt):
@@ -970,6 +903,48 @@ def parse_rss_date(date_string):
     return None
 
 
+# ============================================================================
+# PER-HOST RATE LIMITING
+# ============================================================================
+
+def take_host_token(host):
+    """
+    Refill a host's token bucket and spend one token if available.
+
+    Returns:
+        bool: True if a request to this host may go ahead now
+    """
+    now = time.monotonic()
+    bucket = _host_buckets.get(host)
+    if bucket is None:
+        bucket = _host_buckets[host] = [float(HOST_BUCKET_CAPACITY), now, HOST_MAX_REFILL_RATE]
+    else:
+        bucket[0] = min(HOST_BUCKET_CAPACITY, bucket[0] + (now - bucket[1]) * bucket[2])
+        bucket[1] = now
+
+    if bucket[0] < 1:
+        return False
+    bucket[0] -= 1
+    return True
+
+
+def record_host_response(host, throttled):
+    """Adapt a host's refill rate: halve it (with jitter) when throttled, else add a step back."""
+    bucket = _host_buckets.get(host)
+    if bucket is None:
+        return
+
+    if throttled:
+        bucket[0] = 0.0
+        bucket[2] = max(HOST_MIN_REFILL_RATE, bucket[2] * 0.5 * random.uniform(0.5, 1.5))
+        logger.warning(
+            "RSSNEWS: 🐢 Host %s throttled us, refill rate now %.2f requests/minute",
+            host, bucket[2] * 60
+        )
+    else:
+        bucket[2] = min(HOST_MAX_REFILL_RATE, bucket[2] + HOST_REFILL_RATE_STEP)
+
+
 def query_rss_for_news():
     """
     Query RSS feeds for news using rotation (one feed per call).
@@ -1054,6 +1029,16 @@ def query_rss_for_news():
         # Move to next feed for next call
         _current_feed_index += 1
         
+        # Skip feeds whose host is out of tokens (rate-limited or backing off)
+        feed_host = feed_config.get('host') or urlparse(feed_url).netloc
+        if not take_host_token(feed_host):
+            return {
+                'articles_found': 0,
+                'queued_for_scoring': 0,
+                'feeds_polled': 0,
+                'reason': f'host_throttled ({feed_host})'
+            }
+        
         logger.info(
             f"RSSNEWS: 📰 Query #{_query_count}: Polling feed {feed_url[:60]}... "
             f"(source={feed_source}, window={today_start.isoformat()} to {now.isoformat()})"
@@ -1066,6 +1051,7 @@ def query_rss_for_news():
                 timeout=REQUEST_TIMEOUT,
                 headers={'User-Agent': USER_AGENT}
             )
+            record_host_response(feed_host, response.status_code in THROTTLE_STATUS_CODES)
             response.raise_for_status()
             
             # Update last polled time
@@ -1098,7 +1084,7 @@ def query_rss_for_news():
                 'error': f'request_error: {e}'
             }
         except Exception as e:
-            logger.error(f"RSSNEWS: ❌ Error fetching/parsing {feed_url[:60]}: {e}", exc_info=True)
+            logger.error("RSSNEWS: ❌ Error fetching/parsing %.60s: %s", feed_url, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 'articles_found': 0,
                 'queued_for_scoring': 0,
@@ -1160,7 +1146,7 @@ def query_rss_for_news():
                     break  # Stop processing this feed
             
             except Exception as e:
-                logger.error(f"RSSNEWS: ❌ Error processing entry: {e}", exc_info=True)
+                logger.error("RSSNEWS: ❌ Error processing entry: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                 continue
         
         logger.info(
@@ -1176,7 +1162,7 @@ def query_rss_for_news():
         }
     
     except Exception as e:
-        logger.error(f"RSSNEWS: ❌ Unexpected error in query_rss_for_news: {e}", exc_info=True)
+        logger.error("RSSNEWS: ❌ Unexpected error in query_rss_for_news: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {
             'articles_found': 0,
             'queued_for_scoring': 0,
@@ -1196,18 +1182,13 @@ def get_scored_articles():
     Returns:
         list: List of impact floats (sentiment contributions)
     """
-    impacts = []
-    
-    try:
-        while not scored_article_queue.empty():
-            try:
-                impact = scored_article_queue.get_nowait()
-                impacts.append(impact)
-            except queue.Empty:
-                break
-    except Exception as e:
-        logger.error(f"RSSNEWS: Error getting scored articles: {e}")
-    
+    global scored_article_queue
+
+    # Swap in an empty buffer under the lock; copy the old one after releasing it
+    with scored_article_lock:
+        scored, scored_article_queue = scored_article_queue, deque(maxlen=SCORED_QUEUE_MAX)
+    impacts = list(scored)
+
     return impacts
 
 
@@ -1253,6 +1234,7 @@ def initialize():
         logger.info(f"  - Feeds loaded: {len(feeds)}")
         logger.info(f"  - Poll interval: {RSS_TICK_INTERVAL} second(s)")
         logger.info(f"  - Min per-feed interval: {PER_FEED_MIN_INTERVAL} seconds")
+        logger.info(f"  - Per-host limit: {HOST_MAX_REFILL_RATE * 60:.0f} requests/minute (burst {HOST_BUCKET_CAPACITY}, halved on 429/503)")
         logger.info(f"  - Threads: scoring + save worker running")
         logger.info("=" * 60)
         
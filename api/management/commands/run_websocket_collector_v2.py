@@ -759,8 +759,8 @@ class Command(BaseCommand):
                 ).order_by('-timestamp')[:60])
 
                 # Force macro recalc every minute (when second = 0)
-                current_time = timezone.now()
-                force_macro = (current_time.second == 0)
+                current_second = int(time.time()) % 60
+                force_macro = (current_second == 0)
 
                 # Calculate sentiment components
                 sentiment_result = update_realtime_sentiment(
@@ -778,7 +778,7 @@ class Command(BaseCommand):
                     })
 
                 # Log every 10 seconds
-                if self.verbose or current_time.second % 10 == 0:
+                if self.verbose or current_second % 10 == 0:
                     self.stdout.write(self.style.SUCCESS(
                         f'💚 Sentiment: Composite={sentiment_result.get("composite", 0):+.1f} '
                         f'[News={sentiment_result.get("news", 0):+.1f}, '
@@ -18,9 +18,11 @@ import threading
 import queue
 import time
 import hashlib
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta, timezone as dt_timezone
+from django.db import IntegrityError, OperationalError, DatabaseError
 from django.utils import timezone
-from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
 
 logger = logging.getLogger(__name__)
 
@@ -76,14 +78,24 @@ SECTOR_ETFS = [
     'XLC',   # Communication Services Select Sector
 ]
 
-# Market cap weights (same as Finnhub for consistency)
-from api.management.commands.nasdaq_config import COMPANY_NAMES
-MARKET_CAP_WEIGHTS = {ticker: 1.0/len(COMPANY_NAMES) for ticker in COMPANY_NAMES.keys()}
-# Override with known large caps
-MARKET_CAP_WEIGHTS.update({
-    'AAPL': 0.14, 'MSFT': 0.13, 'GOOGL': 0.08, 'AMZN': 0.07,
-    'NVDA': 0.06, 'META': 0.04, 'TSLA': 0.03, 'AVGO': 0.03
-})
+# Scoring is shared with Finnhub (same weights, caps and batching)
+from api.management.commands.finnhub_realtime_v2 import (
+    score_articles_with_ai, SCORING_BATCH_SIZE, SCORING_BATCH_WINDOW, SAVE_BATCH_SIZE
+)
+
+# Per-ticker impact scales (shared with Finnhub for consistency)
+from api.management.commands.finnhub_realtime_v2 import IMPACT_SCALE, DEFAULT_IMPACT_SCALE
+
+# Save retry policy (shared with Finnhub)
+from api.management.commands.finnhub_realtime_v2 import (
+    SAVE_MAX_RETRIES, is_duplicate_error, classify_operational_error, should_retry_save
+)
+
+# Field cleaning and the Ticker cache (shared with Finnhub, so fixes land in one place)
+from api.management.commands.finnhub_realtime_v2 import (
+    sanitize_text, safe_float, safe_url, get_cached_ticker, _ticker_cache
+)
+from api.management.commands.finnhub_realtime_v2 import save_articles_bulk as upsert_articles_bulk
 
 # Query timing
 POLL_INTERVAL = 5  # Poll Tiingo every 5 seconds
@@ -94,23 +106,30 @@ _last_query_time = None
 _tiingo_client = None
 _query_count = 0
 
-# Article cache (prevent re-processing)
-ARTICLE_CACHE_KEY = 'tiingo_articles_processed'
-ARTICLE_CACHE_DURATION = 3600  # 1 hour
+# Article cache (prevent re-processing) - in-process LRU keyed by 8-byte URL digest
+ARTICLE_CACHE_MAX_SIZE = 50_000
+_processed_articles = OrderedDict()  # digest -> time marked processed
+_processed_articles_lock = threading.Lock()
 
 # Queues for threading (same pattern as Finnhub)
 article_to_score_queue = queue.Queue(maxsize=500)  # Increased to match database save queue capacity
-scored_article_queue = queue.Queue()
+SCORED_QUEUE_MAX = 1024  # Oldest impacts are dropped if get_scored_articles() stops draining
+scored_article_queue = deque(maxlen=SCORED_QUEUE_MAX)  # Impacts of scored articles (guarded by scored_article_lock)
+scored_article_lock = threading.Lock()
 database_save_queue = queue.Queue(maxsize=500)  # Articles to save to database (high limit)
 
 # Scoring thread
 _scoring_thread = None
 _scoring_thread_running = False
+STOP_SCORING = object()  # Queued by stop_scoring_thread() to wake the idle worker
 
 # Database save worker thread (NEW)
 _save_worker_thread = None
 _save_worker_running = False
 
+# Placeholder for articles without a URL: symbol, unix timestamp
+PLACEHOLDER_URL_TEMPLATE = "https://tiingo.com/article/{}/{}"
+
 
 # ============================================================================
 # TIINGO CLIENT
@@ -175,175 +194,217 @@ def get_tiingo_client():
 def get_article_hash(article_url):
     """Generate hash for article URL."""
     try:
-        return hashlib.md5(article_url.encode('utf-8')).hexdigest()
+        return hashlib.md5(article_url.encode('utf-8'), usedforsecurity=False).hexdigest()
     except Exception as e:
         logger.error(f"Error hashing article URL: {e}")
         return None
 
 
-def is_article_processed(article_url):
-    """Check if article has already been processed."""
-    try:
-        article_hash = get_article_hash(article_url)
-        if not article_hash:
-            return False
+def get_processed_key(article_url):
+    """Compact in-memory dedup key for article URL (not stored in the database)."""
+    return hashlib.blake2b(article_url.encode('utf-8', 'ignore'), digest_size=8).digest()
 
-        processed = cache.get(ARTICLE_CACHE_KEY, set())
-        return article_hash in processed
 
-    except Exception as e:
-        logger.error(f"Error checking article cache: {e}")
-        return False
+def is_article_processed(article_url):
+    """Check if article has already been processed."""
+    return get_processed_key(article_url) in _processed_articles
 
 
 def mark_article_processed(article_url):
-    """Mark article as processed in cache."""
-    try:
-        article_hash = get_article_hash(article_url)
-        if not article_hash:
-            return
-
-        processed = cache.get(ARTICLE_CACHE_KEY, set())
-        processed.add(article_hash)
-        cache.set(ARTICLE_CACHE_KEY, processed, ARTICLE_CACHE_DURATION)
-
-    except Exception as e:
-        logger.error(f"Error marking article as processed: {e}")
+    """Mark article as processed, evicting the oldest entries past ARTICLE_CACHE_MAX_SIZE."""
+    key = get_processed_key(article_url)
+    with _processed_articles_lock:
+        _processed_articles[key] = time.time()
+        _processed_articles.move_to_end(key)
+        while len(_processed_articles) > ARTICLE_CACHE_MAX_SIZE:
+            _processed_articles.popitem(last=False)
 
 
 # ============================================================================
 # DATABASE SAVING
 # ============================================================================
 
-def sanitize_text(text, field_name="text", max_length=None):
+def build_article_fields(article_data, impact, now=None):
     """
-    Sanitize text for database storage - removes null bytes, control chars, normalizes whitespace.
-    
+    Validate and clean a scored article into NewsArticle fields.
+
     Args:
-        text: Text to sanitize
-        field_name: Name of field for logging
-        max_length: Maximum length to truncate to
-    
+        article_data: Dict with article info (headline, summary, url, symbol, published, source)
+        impact: Calculated sentiment impact
+        now: Aware datetime for placeholder URLs and missing/invalid dates, so a
+             batch can share one clock read (defaults to timezone.now() when needed)
+
     Returns:
-        Sanitized text string
+        (article_hash, defaults) for update_or_create / NewsArticle(article_hash=..., **defaults)
     """
-    if not text:
-        return ""
+    # ============================================================
+    # 1. VALIDATE AND CLEAN ARTICLE DATA
+    # ============================================================
     
-    original_length = len(text)
-    issues_found = []
+    # Get ticker symbol with fallback
+    ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper()
+    if not ticker_symbol:
+        ticker_symbol = 'QLD'
+        logger.info("NEWSSAVING: ⚠️ Empty symbol, using QLD")
     
-    # Remove null bytes (PostgreSQL can't store these)
-    if '\x00' in text:
-        text = text.replace('\x00', '')
-        issues_found.append("null_bytes")
+    # Get headline with fallback and sanitization
+    headline = str(article_data.get('headline', '')).strip()
+    if not headline or headline.isspace():  # Check for whitespace-only
+        headline = f"[No headline] Article from {ticker_symbol}"
+        logger.warning(f"NEWSSAVING: ⚠️ Missing/empty headline, using fallback: {headline}")
     
-    # Remove other control characters (0x01-0x1F) except tab, newline, carriage return
-    text_clean = ''.join(char for char in text if ord(char) >= 32 or char in '\t\n\r')
-    if len(text_clean) != len(text):
-        issues_found.append("control_chars")
-        text = text_clean
+    # Sanitize headline (remove null bytes, control chars)
+    headline = sanitize_text(headline, field_name="headline", max_length=500)
     
-    # Normalize whitespace (collapse multiple spaces)
-    text = ' '.join(text.split())
+    if not headline:  # If sanitization resulted in empty string
+        headline = f"[Sanitized empty] Article from {ticker_symbol}"
+        logger.warning(f"NEWSSAVING: ⚠️ Headline became empty after sanitization")
     
-    # Truncate if needed
-    if max_length and len(text) > max_length:
-        text = text[:max_length]
-        issues_found.append(f"truncated_to_{max_length}")
+    # Get summary with fallback and sanitization
+    summary = str(article_data.get('summary', '')).strip()
+    if not summary:
+        summary = headline  # Use headline as summary if missing
+    summary = sanitize_text(summary, field_name="summary", max_length=2000)
     
-    # Log if sanitization occurred
-    if issues_found:
-        logger.info(
-            f"NEWSSAVING: 🧹 Sanitized {field_name}: "
-            f"issues={','.join(issues_found)} original_len={original_length} final_len={len(text)}"
-        )
-    
-    return text.strip()
-
-
-def safe_float(value, field_name="float", default=0.0, min_val=-1e10, max_val=1e10):
-    """
-    Validate float is not NaN/Inf and within safe range.
+    # Get URL with fallback and cleaning
+    url = str(article_data.get('url', '')).strip()
+    if not url:
+        # Generate a placeholder URL if missing
+        now = now or timezone.now()
+        url = PLACEHOLDER_URL_TEMPLATE.format(ticker_symbol, int(now.timestamp()))
+        logger.warning(f"NEWSSAVING: ⚠️ Missing URL, generated: {url}")
+    url = safe_url(url, max_length=500)
     
-    Args:
-        value: Float value to validate
-        field_name: Name of field for logging
-        default: Default value if invalid
-        min_val: Minimum allowed value
-        max_val: Maximum allowed value
+    # Get source name and build source field with proper truncation (max 100 chars total)
+    source_name = str(article_data.get('source', 'unknown')).strip()
+    if not source_name:
+        source_name = 'unknown'
     
-    Returns:
-        Safe float value
-    """
-    import math
+    # Sanitize source name
+    source_name = sanitize_text(source_name, field_name="source_name", max_length=None)
     
-    if value is None:
-        return default
+    # Build source field with proper truncation
+    source_prefix = "Tiingo (RT) - "  # 15 chars
+    max_source_name_length = 100 - len(source_prefix)
+    if len(source_name) > max_source_name_length:
+        source_name = source_name[:max_source_name_length]
+        logger.debug("NEWSSAVING: ✂️ Truncated source name to %d chars", max_source_name_length)
+    source = f"{source_prefix}{source_name}"
     
-    try:
-        value = float(value)
-        
-        # Check for NaN/Infinity
-        if math.isnan(value):
-            logger.warning(f"NEWSSAVING: ⚠️ {field_name} was NaN, using default={default}")
-            return default
-        
-        if math.isinf(value):
-            logger.warning(f"NEWSSAVING: ⚠️ {field_name} was Infinity, using default={default}")
-            return default
-        
-        # Clamp to safe range
-        if value < min_val or value > max_val:
-            clamped = max(min_val, min(max_val, value))
-            logger.warning(
-                f"NEWSSAVING: ⚠️ {field_name} out of range: {value}, clamped to {clamped}"
-            )
-            return clamped
-        
-        return value
-        
-    except (ValueError, TypeError) as e:
-        logger.warning(f"NEWSSAVING: ⚠️ {field_name} conversion error: {e}, using default={default}")
-        return default
+    logger.info(
+        "NEWSSAVING: 📊 DATA ticker=%s headline_len=%d url_len=%d impact=%.2f",
+        ticker_symbol, len(headline), len(url), impact
+    )
 
+    # ============================================================
+    # 2. GET OR CREATE TICKER (cached)
+    # ============================================================
+    
+    ticker = get_cached_ticker(ticker_symbol)
 
-def safe_url(url, max_length=500):
-    """
-    Clean and validate URL for database storage.
+    # ============================================================
+    # 3. PARSE AND VALIDATE PUBLISHED DATE
+    # ============================================================
     
-    Args:
-        url: URL string to clean
-        max_length: Maximum length
+    published_at = None
+    if article_data.get('published'):
+        try:
+            published_str = article_data['published']
+            published_at = parse_datetime(published_str)
+            
+            # Ensure timezone-aware
+            if published_at and timezone.is_naive(published_at):
+                published_at = published_at.replace(tzinfo=dt_timezone.utc)
+                logger.debug("NEWSSAVING: 🕐 Made datetime timezone-aware")
+                
+        except Exception as e:
+            logger.warning(f"NEWSSAVING: ⚠️ Date parse error: {e}, using now")
     
-    Returns:
-        Cleaned URL string
-    """
-    if not url:
-        return ""
+    if not published_at:
+        published_at = now or timezone.now()
+    
+    # Validate datetime is in reasonable range
+    if published_at.year < 1900 or published_at.year > 2100:
+        logger.warning(f"NEWSSAVING: ⚠️ Date year out of range: {published_at.year}, using now")
+        published_at = now or timezone.now()
     
-    original = url
+    # Ensure timezone-aware
+    if timezone.is_naive(published_at):
+        published_at = timezone.make_aware(published_at)
+        logger.debug("NEWSSAVING: 🕐 Made datetime timezone-aware")
+
+    # ============================================================
+    # 4. GENERATE AND VALIDATE ARTICLE HASH
+    # ============================================================
     
-    # Strip whitespace
-    url = url.strip()
+    article_hash = None
+    try:
+        article_hash = get_article_hash(url)
+        # Validate hash is 32 chars (MD5 format)
+        if article_hash and len(article_hash) != 32:
+            logger.warning(f"NEWSSAVING: ⚠️ Invalid hash length: {len(article_hash)}, regenerating")
+            article_hash = None
+    except Exception as e:
+        logger.warning(f"NEWSSAVING: ⚠️ Hash generation error: {e}")
     
-    # Remove control characters and newlines
-    url = ''.join(char for char in url if ord(char) >= 32)
+    if not article_hash:
+        # Fallback: generate hash from headline + timestamp (BLAKE2b, 32 hex chars like MD5)
+        fallback_string = f"{headline}_{ticker_symbol}_{int(published_at.timestamp())}"
+        article_hash = hashlib.blake2b(fallback_string.encode('utf-8', errors='ignore'), digest_size=16).hexdigest()
+        logger.warning(f"NEWSSAVING: ⚠️ Using fallback hash: {article_hash[:8]}")
+
+    # ============================================================
+    # 5. VALIDATE AND CALCULATE SENTIMENT (NaN/Inf safe)
+    # ============================================================
     
-    # Replace spaces with %20 (basic encoding)
-    url = url.replace(' ', '%20')
+    # Validate impact value (the only NaN/Inf/range check it needs)
+    impact = safe_float(impact, field_name="impact", default=0.0, min_val=-100, max_val=100)
     
-    # Remove null bytes
-    url = url.replace('\x00', '')
+    # Calculate with overflow protection (scales are always non-zero)
+    try:
+        estimated_sentiment = impact / IMPACT_SCALE.get(ticker_symbol, DEFAULT_IMPACT_SCALE)
+        estimated_sentiment = safe_float(
+            estimated_sentiment, 
+            field_name="estimated_sentiment",
+            default=0.0,
+            min_val=-1.0,
+            max_val=1.0
+        )
+    except (ZeroDivisionError, OverflowError) as e:
+        logger.warning(f"NEWSSAVING: ⚠️ Sentiment calc error: {e}, using 0.0")
+        estimated_sentiment = 0.0
     
-    # Truncate if needed
-    if len(url) > max_length:
-        url = url[:max_length]
+    # Determine article type
+    article_type = 'market' if ticker_symbol == 'MARKET' else 'company'
+
+    # ============================================================
+    # 6. FINAL VALIDATION
+    # ============================================================
     
-    if url != original:
-        logger.info(f"NEWSSAVING: 🔗 Cleaned URL: original_len={len(original)} final_len={len(url)}")
+    logger.info(
+        "NEWSSAVING: 💾 SAVING hash=%.8s ticker=%s sentiment=%.3f impact=%.2f",
+        article_hash, ticker_symbol, estimated_sentiment, impact
+    )
     
-    return url
+    return article_hash, {
+        'ticker': ticker,
+        'analysis_run': None,
+        'headline': headline,
+        'summary': summary,
+        'source': source,
+        'url': url,
+        'published_at': published_at,
+        'article_type': article_type,
+        'base_sentiment': estimated_sentiment,
+        'surprise_factor': 1.0,
+        'novelty_score': 1.0,
+        'source_credibility': 0.8,
+        'recency_weight': 1.0,
+        'article_score': impact,
+        'weighted_contribution': impact,
+        'is_analyzed': True,
+        'sentiment_cached': False
+    }
 
 
 def save_article_to_db(article_data, impact):
@@ -358,315 +419,109 @@ def save_article_to_db(article_data, impact):
         impact: Calculated sentiment impact
     
     Returns:
-        NewsArticle instance or None only if all retries fail
+        NewsArticle instance (the existing row for a duplicate), or None if the save fails
     """
-    max_retries = 3
-    retry_delay = 0.5  # seconds
-    
-    for attempt in range(max_retries):
-        try:
-            from api.models import NewsArticle, Ticker
-            from django.utils.dateparse import parse_datetime
-            from django.utils import timezone
-            from django.db import IntegrityError, OperationalError, DatabaseError
-            import time
-
-            logger.info(f"NEWSSAVING: 📥 ENTRY attempt={attempt+1}/{max_retries} source=Tiingo")
-
-            # ============================================================
-            # 1. VALIDATE AND CLEAN ARTICLE DATA
-            # ============================================================
-            
-            # Get ticker symbol with fallback
-            ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper()
-            if not ticker_symbol:
-                ticker_symbol = 'QLD'
-                logger.info(f"NEWSSAVING: ⚠️ Empty symbol, using QLD")
-            
-            # Get headline with fallback and sanitization
-            headline = str(article_data.get('headline', '')).strip()
-            if not headline or not headline.replace(' ', ''):  # Check for whitespace-only
-                headline = f"[No headline] Article from {ticker_symbol}"
-                logger.warning(f"NEWSSAVING: ⚠️ Missing/empty headline, using fallback: {headline}")
-            
-            # Sanitize headline (remove null bytes, control chars)
-            headline = sanitize_text(headline, field_name="headline", max_length=500)
-            
-            if not headline:  # If sanitization resulted in empty string
-                headline = f"[Sanitized empty] Article from {ticker_symbol}"
-                logger.warning(f"NEWSSAVING: ⚠️ Headline became empty after sanitization")
-            
-            # Get summary with fallback and sanitization
-            summary = str(article_data.get('summary', '')).strip()
-            if not summary:
-                summary = headline  # Use headline as summary if missing
-            summary = sanitize_text(summary, field_name="summary", max_length=2000)
-            
-            # Get URL with fallback and cleaning
-            url = str(article_data.get('url', '')).strip()
-            if not url:
-                # Generate a placeholder URL if missing
-                url = f"https://tiingo.com/article/{ticker_symbol}/{int(time.time())}"
-                logger.warning(f"NEWSSAVING: ⚠️ Missing URL, generated: {url}")
-            url = safe_url(url, max_length=500)
-            
-            # Get source name and build source field with proper truncation (max 100 chars total)
-            source_name = str(article_data.get('source', 'unknown')).strip()
-            if not source_name:
-                source_name = 'unknown'
-            
-            # Sanitize source name
-            source_name = sanitize_text(source_name, field_name="source_name", max_length=None)
-            
-            # Build source field with proper truncation
-            source_prefix = "Tiingo (RT) - "  # 15 chars
-            max_source_name_length = 100 - len(source_prefix)
-            if len(source_name) > max_source_name_length:
-                source_name = source_name[:max_source_name_length]
-                logger.debug(f"NEWSSAVING: ✂️ Truncated source name to {max_source_name_length} chars")
-            source = f"{source_prefix}{source_name}"
-            
-            logger.info(f"NEWSSAVING: 📊 DATA ticker={ticker_symbol} headline_len={len(headline)} url_len={len(url)} impact={impact:.2f}")
+    from api.models import NewsArticle
 
-            # ============================================================
-            # 2. GET OR CREATE TICKER
-            # ============================================================
-            
-            ticker = None
-            try:
-                ticker = Ticker.objects.get(symbol=ticker_symbol)
-                logger.debug(f"NEWSSAVING: ✓ Ticker found: {ticker_symbol}")
-            except Ticker.DoesNotExist:
-                logger.warning(f"NEWSSAVING: ⚠️ Ticker {ticker_symbol} not found, trying QLD fallback")
-                try:
-                    ticker = Ticker.objects.get(symbol='QLD')
-                    logger.info(f"NEWSSAVING: ✓ Using QLD fallback for {ticker_symbol}")
-                except Ticker.DoesNotExist:
-                    # Last resort: create QLD ticker if it doesn't exist
-                    logger.warning("NEWSSAVING: ⚠️ QLD ticker missing! Creating it now...")
-                    ticker, created = Ticker.objects.get_or_create(
-                        symbol='QLD',
-                        defaults={'company_name': 'ProShares Ultra QQQ (2x Leveraged NASDAQ-100 ETF)'}
-                    )
-                    if created:
-                        logger.info("NEWSSAVING: ✓ Created QLD ticker")
-
-            # ============================================================
-            # 3. PARSE AND VALIDATE PUBLISHED DATE
-            # ============================================================
-            
-            published_at = None
-            if article_data.get('published'):
-                try:
-                    published_str = article_data['published']
-                    published_at = parse_datetime(published_str)
-                    
-                    # Ensure timezone-aware
-                    if published_at and timezone.is_naive(published_at):
-                        published_at = published_at.replace(tzinfo=dt_timezone.utc)
-                        logger.debug(f"NEWSSAVING: 🕐 Made datetime timezone-aware")
-                        
-                except Exception as e:
-                    logger.warning(f"NEWSSAVING: ⚠️ Date parse error: {e}, using now")
-            
-            if not published_at:
-                published_at = timezone.now()
-            
-            # Validate datetime is in reasonable range
-            if published_at.year < 1900 or published_at.year > 2100:
-                logger.warning(f"NEWSSAVING: ⚠️ Date year out of range: {published_at.year}, using now")
-                published_at = timezone.now()
-            
-            # Ensure timezone-aware
-            if timezone.is_naive(published_at):
-                published_at = timezone.make_aware(published_at)
-                logger.debug(f"NEWSSAVING: 🕐 Made datetime timezone-aware")
+    for attempt in range(SAVE_MAX_RETRIES):
+        try:
+            logger.info("NEWSSAVING: 📥 ENTRY attempt=%d/%d source=Tiingo", attempt + 1, SAVE_MAX_RETRIES)
 
-            # ============================================================
-            # 4. GENERATE AND VALIDATE ARTICLE HASH
-            # ============================================================
-            
-            article_hash = None
-            try:
-                article_hash = get_article_hash(url)
-                # Validate hash is 32 chars (MD5 format)
-                if article_hash and len(article_hash) != 32:
-                    logger.warning(f"NEWSSAVING: ⚠️ Invalid hash length: {len(article_hash)}, regenerating")
-                    article_hash = None
-            except Exception as e:
-                logger.warning(f"NEWSSAVING: ⚠️ Hash generation error: {e}")
-            
-            if not article_hash:
-                # Fallback: generate hash from headline + timestamp
-                import hashlib
-                fallback_string = f"{headline}_{ticker_symbol}_{int(published_at.timestamp())}"
-                article_hash = hashlib.md5(fallback_string.encode('utf-8', errors='ignore')).hexdigest()
-                logger.warning(f"NEWSSAVING: ⚠️ Using fallback hash: {article_hash[:8]}")
-
-            # ============================================================
-            # 5. VALIDATE AND CALCULATE SENTIMENT (NaN/Inf safe)
-            # ============================================================
-            
-            # Validate impact value
-            impact = safe_float(impact, field_name="impact", default=0.0, min_val=-100, max_val=100)
-            
-            weight = MARKET_CAP_WEIGHTS.get(ticker_symbol, 0.01)
-            if weight == 0 or weight is None:
-                weight = 0.01  # Prevent division by zero
-                logger.debug(f"NEWSSAVING: ⚠️ Weight was 0, using 0.01")
-            
-            # Calculate with overflow protection
-            try:
-                estimated_sentiment = impact / (weight * 100 * 100)
-                estimated_sentiment = safe_float(
-                    estimated_sentiment, 
-                    field_name="estimated_sentiment",
-                    default=0.0,
-                    min_val=-1.0,
-                    max_val=1.0
-                )
-            except (ZeroDivisionError, OverflowError) as e:
-                logger.warning(f"NEWSSAVING: ⚠️ Sentiment calc error: {e}, using 0.0")
-                estimated_sentiment = 0.0
-            
-            # Determine article type
-            article_type = 'market' if ticker_symbol == 'MARKET' else 'company'
+            ticker_symbol = str(article_data.get('symbol', 'QLD')).strip().upper() or 'QLD'
+            article_hash, defaults = build_article_fields(article_data, impact)
+            headline = defaults['headline']
+            summary = defaults['summary']
 
-            # ============================================================
-            # 6. SAVE TO DATABASE WITH COMPREHENSIVE LOGGING
-            # ============================================================
-            
-            logger.info(
-                f"NEWSSAVING: 💾 SAVING hash={article_hash[:8]} ticker={ticker_symbol} "
-                f"sentiment={estimated_sentiment:.3f} impact={impact:.2f}"
-            )
-            
-            # Validate all float fields one more time before save
-            safe_impact = safe_float(impact, "final_impact", 0.0, -100, 100)
-            safe_sentiment = safe_float(estimated_sentiment, "final_sentiment", 0.0, -1.0, 1.0)
-            
             article, created = NewsArticle.objects.update_or_create(
                 article_hash=article_hash,
-                defaults={
-                    'ticker': ticker,
-                    'analysis_run': None,
-                    'headline': headline,
-                    'summary': summary,
-                    'source': source,
-                    'url': url,
-                    'published_at': published_at,
-                    'article_type': article_type,
-                    'base_sentiment': safe_sentiment,
-                    'surprise_factor': 1.0,
-                    'novelty_score': 1.0,
-                    'source_credibility': 0.8,
-                    'recency_weight': 1.0,
-                    'article_score': safe_impact,
-                    'weighted_contribution': safe_impact,
-                    'is_analyzed': True,
-                    'sentiment_cached': False
-                }
+                defaults=defaults
             )
 
             # Success!
             if created:
                 logger.info(
-                    f"NEWSSAVING: ✅ SAVED_NEW hash={article_hash[:8]} id={article.id} "
-                    f"ticker={ticker_symbol} headline={headline[:50]}..."
+                    "NEWSSAVING: ✅ SAVED_NEW hash=%.8s id=%s ticker=%s headline=%.50s...",
+                    article_hash, article.id, ticker_symbol, headline
                 )
             else:
                 logger.info(
-                    f"NEWSSAVING: ♻️ UPDATED hash={article_hash[:8]} id={article.id} ticker={ticker_symbol}"
+                    "NEWSSAVING: ♻️ UPDATED hash=%.8s id=%s ticker=%s",
+                    article_hash, article.id, ticker_symbol
                 )
 
             return article
 
         except IntegrityError as e:
-            # Constraint violation (unique, foreign key, etc.) - retry
-            error_msg = str(e).lower()
-            if 'unique constraint' in error_msg or 'duplicate key' in error_msg:
+            hash_prefix = article_hash[:8] if 'article_hash' in locals() else 'unknown'
+            if is_duplicate_error(e) and 'article_hash' in locals():
+                # Another writer inserted the same article first - it's saved, don't retry
                 logger.warning(
-                    f"NEWSSAVING: 🔄 DUPLICATE hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"attempt={attempt + 1}/{max_retries}"
-                )
-            else:
-                logger.warning(
-                    f"NEWSSAVING: ⚠️ INTEGRITY_ERROR attempt={attempt + 1}/{max_retries} error={e}"
+                    f"NEWSSAVING: 🔄 DUPLICATE hash={hash_prefix} attempt={attempt + 1}/{SAVE_MAX_RETRIES}"
                 )
+                return NewsArticle.objects.filter(article_hash=article_hash).first()
+
+            # Other constraint violation (foreign key, etc.) - retry
+            # with fresh ticker lookups in case a cached ticker was removed
+            _ticker_cache.clear()
+            logger.warning(
+                f"NEWSSAVING: ⚠️ INTEGRITY_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} error={e}"
+            )
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
+            retry, delay = should_retry_save(e, attempt)
+            if retry:
+                time.sleep(delay)
                 continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_INTEGRITY hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}"
-                )
-                return None
+            logger.error(
+                f"NEWSSAVING: ❌ FAILED_INTEGRITY hash={hash_prefix} "
+                f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}"
+            )
+            return None
 
         except OperationalError as e:
-            # Database connection, deadlock, timeout - retry
-            error_msg = str(e).lower()
-            if 'deadlock' in error_msg:
-                error_type = "DEADLOCK"
-            elif 'timeout' in error_msg or 'timed out' in error_msg:
-                error_type = "TIMEOUT"
-            elif 'connection' in error_msg:
-                error_type = "CONNECTION"
-            elif 'disk' in error_msg or 'space' in error_msg:
-                error_type = "DISK_FULL"
-            else:
-                error_type = "OPERATIONAL"
+            # Database connection, deadlock, timeout - retry; anything else fails now
+            error_type = classify_operational_error(e)
+            retry, delay = should_retry_save(e, attempt)
             
             logger.warning(
-                f"NEWSSAVING: 🔄 {error_type} attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: 🔄 {error_type} attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                f"retrying_in={retry_delay}s error={e}"
+                f"retrying_in={delay}s error={e}"
             )
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
+            if retry:
+                time.sleep(delay)
                 continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_{error_type} after {max_retries} attempts "
-                    f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
-                    f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}",
-                    exc_info=True
-                )
-                return None
+            logger.error(
+                f"NEWSSAVING: ❌ FAILED_{error_type} after {attempt + 1} attempts "
+                f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
+                f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}",
+                exc_info=True
+            )
+            return None
 
         except DatabaseError as e:
-            # General database errors (encoding, data type, etc.)
+            # General database errors (encoding, data type, etc.) - retrying won't help
             logger.error(
-                f"NEWSSAVING: ❌ DATABASE_ERROR attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: ❌ DATABASE_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
                 f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} error={e}",
                 exc_info=True
             )
-            
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            else:
-                return None
+            return None
 
         except MemoryError as e:
             # Out of memory (very rare, but possible with huge articles)
             logger.error(
-                f"NEWSSAVING: ❌ MEMORY_ERROR attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: ❌ MEMORY_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"headline_len={len(headline) if 'headline' in locals() else 0} "
                 f"summary_len={len(summary) if 'summary' in locals() else 0} error={e}"
             )
             return None  # Don't retry memory errors
 
         except Exception as e:
-            # Unexpected error - catch all
+            # Unexpected error - catch all (not retried: it would fail the same way)
             logger.error(
-                f"NEWSSAVING: ❌ UNEXPECTED_ERROR attempt={attempt + 1}/{max_retries} "
+                f"NEWSSAVING: ❌ UNEXPECTED_ERROR attempt={attempt + 1}/{SAVE_MAX_RETRIES} "
                 f"type={type(e).__name__} "
                 f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'} "
                 f"ticker={ticker_symbol if 'ticker_symbol' in locals() else 'unknown'} "
@@ -674,17 +529,7 @@ def save_article_to_db(article_data, impact):
                 f"error={e}",
                 exc_info=True
             )
-            
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            else:
-                logger.error(
-                    f"NEWSSAVING: ❌ FAILED_ALL_RETRIES after {max_retries} attempts "
-                    f"hash={article_hash[:8] if 'article_hash' in locals() else 'unknown'}"
-                )
-                return None
+            return None
     
     # Should never reach here, but just in case
     logger.error(
@@ -710,65 +555,10 @@ def score_article_with_ai(headline, summary, symbol):
         symbol: Primary stock symbol
 
     Returns:
-        float: Article impact on news score (already scaled and weighted)
+        float: Article impact on news score (already scaled and weighted), 0.0 on failure
     """
-    try:
-        # Import the sentiment analysis wrapper from run_nasdaq_sentiment
-        # This automatically uses OpenAI or FinBERT based on SENTIMENT_PROVIDER env var
-        from api.management.commands.run_nasdaq_sentiment import analyze_sentiment_batch
-
-        # Score the article
-        text = f"{headline}. {summary}" if summary else headline
-        sentiments = analyze_sentiment_batch([text])
-
-        if not sentiments or len(sentiments) == 0:
-            logger.warning(f"No sentiment returned for {symbol} article: {headline[:50]}")
-            return 0.0
-
-        sentiment = sentiments[0]  # -1 to +1
-
-        # Calculate article score (simplified - just use base sentiment)
-        # In run_nasdaq_sentiment, this would include surprise, novelty, credibility, recency
-        # For real-time, we use just sentiment for speed
-        article_score = sentiment * 100  # Scale to -100/+100
-
-        # Get market cap weight for this symbol
-        weight = MARKET_CAP_WEIGHTS.get(symbol, 0.01)
-
-        # Calculate weighted contribution
-        weighted_contribution = article_score * weight
-
-        # Scale by 100 (to match run_nasdaq_sentiment.py normalization)
-        impact = weighted_contribution * 100
-
-        # Tiered impact caps based on sentiment strength (reduces noise, amplifies strong signals)
-        abs_sentiment = abs(sentiment)
-        if abs_sentiment < 0.2:
-            # Filter out weak/neutral sentiment (noise reduction)
-            impact = 0.0
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (filtered: weak)")
-        elif abs_sentiment < 0.4:
-            # Weak signal
-            impact = max(-2, min(2, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (weak)")
-        elif abs_sentiment < 0.6:
-            # Moderate signal
-            impact = max(-5, min(5, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (moderate)")
-        elif abs_sentiment < 0.8:
-            # Strong signal
-            impact = max(-15, min(15, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (strong)")
-        else:
-            # Critical news (very strong sentiment)
-            impact = max(-25, min(25, impact))
-            logger.info(f"Scored {symbol} article: sentiment={sentiment:+.2f}, impact={impact:+.2f} (critical)")
-
-        return float(impact)
-
-    except Exception as e:
-        logger.error(f"Error scoring article for {symbol}: {e}", exc_info=True)
-        return 0.0
+    impacts = score_articles_with_ai([{'headline': headline, 'summary': summary, 'symbol': symbol}])
+    return impacts[0] if impacts else 0.0
 
 
 # ============================================================================
@@ -786,51 +576,84 @@ def scoring_worker():
 
     while _scoring_thread_running:
         try:
-            # Get article from queue (block for up to 1 second)
-            try:
-                article_data = article_to_score_queue.get(timeout=1.0)
-            except queue.Empty:
+            # Sleep until an article arrives; stop_scoring_thread() wakes us with a sentinel
+            article_data = article_to_score_queue.get()
+            if article_data is STOP_SCORING:
+                continue  # Re-check _scoring_thread_running (stale sentinels are skipped)
+            batch = [article_data]
+
+            # Collect more articles for a short window so they share one sentiment call
+            deadline = time.monotonic() + SCORING_BATCH_WINDOW
+            while len(batch) < SCORING_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    article_data = article_to_score_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if article_data is STOP_SCORING:
+                    break  # Score what we have; the loop condition then exits
+                batch.append(article_data)
+
+            for article_data in batch:
+                logger.info(f"   🤖 Scoring article: [{article_data['symbol']}] {article_data['headline'][:60]}...")
+
+            # Score the batch
+            impacts = score_articles_with_ai(batch)
+            if impacts is None:
+                # Provider failed: don't publish, save or mark these; they are retried on a later poll
+                logger.warning("TIINGO_SCORING: ⚠️ Sentiment failed, leaving %d articles unprocessed", len(batch))
                 continue
 
-            logger.info(f"   🤖 Scoring article: [{article_data['symbol']}] {article_data['headline'][:60]}...")
-
-            # Score the article
-            impact = score_article_with_ai(
-                article_data['headline'],
-                article_data['summary'],
-                article_data['symbol']
-            )
-
-            # ⚡ PRIORITY 1: Put impact in scored queue IMMEDIATELY (sentiment update)
-            scored_article_queue.put(impact)
-            logger.info(f"TIINGO_SCORING: ✅ Scored and queued impact: {article_data['symbol']} impact={impact:+.2f}")
+            for article_data, impact in zip(batch, impacts):
+                # ⚡ PRIORITY 1: Put impact in scored queue IMMEDIATELY (sentiment update)
+                with scored_article_lock:
+                    if len(scored_article_queue) == SCORED_QUEUE_MAX:
+                        logger.warning("Scored article queue full (%d), dropping oldest impact", SCORED_QUEUE_MAX)
+                    scored_article_queue.append(impact)
+                logger.info(f"TIINGO_SCORING: ✅ Scored and queued impact: {article_data['symbol']} impact={impact:+.2f}")
 
-            # ⚡ PRIORITY 2: Queue for database save (async, non-blocking)
-            try:
-                save_job = {
-                    'article_data': article_data,
-                    'impact': impact,
-                    'queued_time': timezone.now(),
-                    'article_hash': get_article_hash(article_data['url'])
-                }
-                database_save_queue.put_nowait(save_job)
-                logger.info(f"TIINGO_SAVEQUEUE: 📝 Queued for save: {article_data['symbol']} hash={save_job['article_hash'][:8]}")
-            except queue.Full:
-                logger.error(f"TIINGO_SAVEQUEUE: ❌ QUEUE_FULL (500 items) - cannot queue save for {article_data['symbol']}")
+                # ⚡ PRIORITY 2: Queue for database save (async, non-blocking)
+                try:
+                    save_job = {
+                        'article_data': article_data,
+                        'impact': impact,
+                        'queued_time': timezone.now(),
+                        'article_hash': get_article_hash(article_data['url'])
+                    }
+                    database_save_queue.put_nowait(save_job)
+                    logger.info(f"TIINGO_SAVEQUEUE: 📝 Queued for save: {article_data['symbol']} hash={save_job['article_hash'][:8]}")
+                except queue.Full:
+                    logger.error(f"TIINGO_SAVEQUEUE: ❌ QUEUE_FULL (500 items) - cannot queue save for {article_data['symbol']}")
 
-            # Mark as processed
-            mark_article_processed(article_data['url'])
+                # Mark as processed
+                mark_article_processed(article_data['url'])
 
         except Exception as e:
-            logger.error(f"Error in Tiingo scoring worker: {e}", exc_info=True)
+            logger.error("Error in Tiingo scoring worker: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
     logger.info("Tiingo article scoring thread stopped")
 
 
+def save_articles_bulk(save_jobs):
+    """
+    Upsert several scored articles in one transaction (Finnhub's bulk upsert with
+    Tiingo's field builder), so an existing article is updated as save_article_to_db does.
+
+    Returns:
+        int: Number of articles upserted
+    """
+    return upsert_articles_bulk(save_jobs, build_fields=build_article_fields)
+
+
 def database_save_worker():
     """
     Dedicated background thread for database saves (Tiingo).
     Processes saves from queue with deadline enforcement and comprehensive logging.
+
+    Jobs that are already waiting are saved together with one bulk upsert; a single
+    job, or a batch whose bulk upsert fails, goes through save_article_to_db with retries.
     """
     global _save_worker_running
     
@@ -841,107 +664,145 @@ def database_save_worker():
     saves_succeeded = 0
     saves_failed = 0
     saves_deadline_exceeded = 0
-    
+    deadline_seconds = 60  # Max time a job may wait in the queue
+
+    def save_with_retries(save_job):
+        """Save one job via save_article_to_db, retrying within its deadline."""
+        nonlocal saves_succeeded, saves_failed
+
+        article_data = save_job['article_data']
+        impact = save_job['impact']
+        queued_time = save_job['queued_time']
+        article_hash = save_job['article_hash']
+        wait_time = (timezone.now() - queued_time).total_seconds()
+
+        # Attempt save with fast retries
+        remaining_time = deadline_seconds - wait_time
+        max_attempts = 3
+        retry_delay = 0.1  # Start with 100ms
+        save_succeeded = False
+        
+        for attempt in range(max_attempts):
+            try:
+                logger.info(
+                    f"TIINGO_SAVEQUEUE: 💾 SAVE_ATTEMPT attempt={attempt+1}/{max_attempts} "
+                    f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
+                    f"remaining_time={remaining_time:.2f}s"
+                )
+                
+                # Call the existing save function
+                article = save_article_to_db(article_data, impact)
+                
+                if article:
+                    total_time = (timezone.now() - queued_time).total_seconds()
+                    saves_succeeded += 1
+                    logger.info(
+                        f"TIINGO_SAVEQUEUE: ✅ SAVE_SUCCESS hash={article_hash[:8]} "
+                        f"id={article.id} ticker={article_data.get('symbol')} "
+                        f"total_time={total_time:.2f}s attempt={attempt+1} "
+                        f"success_count={saves_succeeded}"
+                    )
+                    save_succeeded = True
+                    break
+                else:
+                    logger.warning(
+                        f"TIINGO_SAVEQUEUE: ⚠️ SAVE_RETURNED_NONE attempt={attempt+1}/{max_attempts} "
+                        f"hash={article_hash[:8]}"
+                    )
+                    
+            except Exception as e:
+                logger.error(
+                    f"TIINGO_SAVEQUEUE: ❌ SAVE_EXCEPTION attempt={attempt+1}/{max_attempts} "
+                    f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
+                    f"error={type(e).__name__}: {str(e)[:100]}"
+                )
+            
+            # Check if we have time to retry
+            remaining_time = deadline_seconds - (timezone.now() - queued_time).total_seconds()
+            if remaining_time <= 0:
+                logger.error(f"TIINGO_SAVEQUEUE: ⏰ NO_TIME_FOR_RETRY hash={article_hash[:8]}")
+                break
+            
+            # Retry with exponential backoff (but respect deadline)
+            if attempt < max_attempts - 1:
+                sleep_time = min(retry_delay, remaining_time - 0.1)  # Leave 100ms buffer
+                if sleep_time > 0:
+                    logger.info(f"TIINGO_SAVEQUEUE: 🔄 RETRY_DELAY sleep={sleep_time:.2f}s attempt={attempt+1}")
+                    time.sleep(sleep_time)
+                    retry_delay = min(retry_delay * 1.5, 2.0)  # Cap at 2s
+        
+        # Final status
+        if not save_succeeded:
+            saves_failed += 1
+            total_time = (timezone.now() - queued_time).total_seconds()
+            logger.error(
+                f"TIINGO_SAVEQUEUE: ❌ SAVE_FAILED_ALL_ATTEMPTS hash={article_hash[:8]} "
+                f"ticker={article_data.get('symbol')} "
+                f"attempts={max_attempts} total_time={total_time:.2f}s "
+                f"failed_count={saves_failed}"
+            )
+
     while _save_worker_running:
         try:
             # Get save job from queue (block for up to 1 second)
             try:
-                save_job = database_save_queue.get(timeout=1.0)
+                save_jobs = [database_save_queue.get(timeout=1.0)]
             except queue.Empty:
                 continue
-            
-            article_data = save_job['article_data']
-            impact = save_job['impact']
-            queued_time = save_job['queued_time']
-            article_hash = save_job['article_hash']
-            
-            # Calculate time in queue
+
+            # Take whatever else is already waiting, up to one batch
+            while len(save_jobs) < SAVE_BATCH_SIZE:
+                try:
+                    save_jobs.append(database_save_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            live_jobs = []
             now = timezone.now()
-            wait_time = (now - queued_time).total_seconds()
-            
-            logger.info(
-                f"TIINGO_SAVEQUEUE: 🔄 Processing save job: hash={article_hash[:8]} "
-                f"ticker={article_data.get('symbol')} wait_time={wait_time:.2f}s"
-            )
-            
-            # Check deadline (60 seconds max)
-            deadline_seconds = 60
-            if wait_time > deadline_seconds:
-                saves_deadline_exceeded += 1
-                logger.error(
-                    f"TIINGO_SAVEQUEUE: ⏰ DEADLINE_EXCEEDED hash={article_hash[:8]} "
-                    f"wait_time={wait_time:.1f}s > deadline={deadline_seconds}s "
-                    f"ticker={article_data.get('symbol')} "
-                    f"total_exceeded={saves_deadline_exceeded}"
+            for save_job in save_jobs:
+                article_data = save_job['article_data']
+                article_hash = save_job['article_hash']
+
+                # Calculate time in queue
+                wait_time = (now - save_job['queued_time']).total_seconds()
+
+                logger.info(
+                    f"TIINGO_SAVEQUEUE: 🔄 Processing save job: hash={article_hash[:8]} "
+                    f"ticker={article_data.get('symbol')} wait_time={wait_time:.2f}s"
                 )
-                database_save_queue.task_done()
-                continue
-            
-            # Attempt save with fast retries
-            remaining_time = deadline_seconds - wait_time
-            max_attempts = 3
-            retry_delay = 0.1  # Start with 100ms
-            save_succeeded = False
-            
-            for attempt in range(max_attempts):
+
+                # Check deadline (60 seconds max)
+                if wait_time > deadline_seconds:
+                    saves_deadline_exceeded += 1
+                    logger.error(
+                        f"TIINGO_SAVEQUEUE: ⏰ DEADLINE_EXCEEDED hash={article_hash[:8]} "
+                        f"wait_time={wait_time:.1f}s > deadline={deadline_seconds}s "
+                        f"ticker={article_data.get('symbol')} "
+                        f"total_exceeded={saves_deadline_exceeded}"
+                    )
+                    continue
+
+                live_jobs.append(save_job)
+
+            bulk_saved = False
+            if len(live_jobs) > 1:
                 try:
+                    saved = save_articles_bulk(live_jobs)
+                    saves_succeeded += saved
+                    bulk_saved = True
                     logger.info(
-                        f"TIINGO_SAVEQUEUE: 💾 SAVE_ATTEMPT attempt={attempt+1}/{max_attempts} "
-                        f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
-                        f"remaining_time={remaining_time:.2f}s"
+                        f"TIINGO_SAVEQUEUE: ✅ BULK_SAVE_SUCCESS count={saved} "
+                        f"success_count={saves_succeeded}"
                     )
-                    
-                    # Call the existing save function
-                    article = save_article_to_db(article_data, impact)
-                    
-                    if article:
-                        total_time = (timezone.now() - queued_time).total_seconds()
-                        saves_succeeded += 1
-                        logger.info(
-                            f"TIINGO_SAVEQUEUE: ✅ SAVE_SUCCESS hash={article_hash[:8]} "
-                            f"id={article.id} ticker={article_data.get('symbol')} "
-                            f"total_time={total_time:.2f}s attempt={attempt+1} "
-                            f"success_count={saves_succeeded}"
-                        )
-                        save_succeeded = True
-                        break
-                    else:
-                        logger.warning(
-                            f"TIINGO_SAVEQUEUE: ⚠️ SAVE_RETURNED_NONE attempt={attempt+1}/{max_attempts} "
-                            f"hash={article_hash[:8]}"
-                        )
-                        
                 except Exception as e:
                     logger.error(
-                        f"TIINGO_SAVEQUEUE: ❌ SAVE_EXCEPTION attempt={attempt+1}/{max_attempts} "
-                        f"hash={article_hash[:8]} ticker={article_data.get('symbol')} "
-                        f"error={type(e).__name__}: {str(e)[:100]}"
+                        f"TIINGO_SAVEQUEUE: ❌ BULK_SAVE_EXCEPTION count={len(live_jobs)} "
+                        f"error={type(e).__name__}: {str(e)[:100]} - falling back to single saves"
                     )
-                
-                # Check if we have time to retry
-                remaining_time = deadline_seconds - (timezone.now() - queued_time).total_seconds()
-                if remaining_time <= 0:
-                    logger.error(f"TIINGO_SAVEQUEUE: ⏰ NO_TIME_FOR_RETRY hash={article_hash[:8]}")
-                    break
-                
-                # Retry with exponential backoff (but respect deadline)
-                if attempt < max_attempts - 1:
-                    sleep_time = min(retry_delay, remaining_time - 0.1)  # Leave 100ms buffer
-                    if sleep_time > 0:
-                        logger.info(f"TIINGO_SAVEQUEUE: 🔄 RETRY_DELAY sleep={sleep_time:.2f}s attempt={attempt+1}")
-                        time.sleep(sleep_time)
-                        retry_delay = min(retry_delay * 1.5, 2.0)  # Cap at 2s
-            
-            # Final status
-            if not save_succeeded:
-                saves_failed += 1
-                total_time = (timezone.now() - queued_time).total_seconds()
-                logger.error(
-                    f"TIINGO_SAVEQUEUE: ❌ SAVE_FAILED_ALL_ATTEMPTS hash={article_hash[:8]} "
-                    f"ticker={article_data.get('symbol')} "
-                    f"attempts={max_attempts} total_time={total_time:.2f}s "
-                    f"failed_count={saves_failed}"
-                )
+
+            if not bulk_saved:
+                for save_job in live_jobs:
+                    save_with_retries(save_job)
             
             # Log queue status periodically
             queue_size = database_save_queue.qsize()
@@ -951,7 +812,8 @@ def database_save_worker():
                     f"success={saves_succeeded} failed={saves_failed} exceeded={saves_deadline_exceeded}"
                 )
             
-            database_save_queue.task_done()
+            for _ in save_jobs:
+                database_save_queue.task_done()
             
         except Exception as e:
             logger.error(
@@ -992,6 +854,10 @@ def stop_scoring_thread():
 
     try:
         _scoring_thread_running = False
+        try:
+            article_to_score_queue.put_nowait(STOP_SCORING)
+        except queue.Full:
+            pass  # Worker is busy and will see the flag after this batch
         if _scoring_thread:
             _scoring_thread.join(timeout=5.0)
         logger.info("Tiingo scoring thread stopped")
@@ -1179,7 +1045,7 @@ def query_tiingo_for_news():
 
         except Exception as e:
             msg = f"   ✗ Ticker query FAILED: {e}"
-            logger.error(msg, exc_info=True)
+            logger.error(msg, exc_info=logger.isEnabledFor(logging.DEBUG))
             print(f"❌ {msg}")  # Ensure appears in Railway logs
             import traceback
             print(f"   Traceback: {traceback.format_exc()}")
@@ -1278,7 +1144,7 @@ def query_tiingo_for_news():
 
     except Exception as e:
         msg = f"Error in Tiingo news query: {e}"
-        logger.error(msg, exc_info=True)
+        logger.error(msg, exc_info=logger.isEnabledFor(logging.DEBUG))
         print(f"❌ {msg}")  # Ensure appears in Railway logs
         import traceback
         print(f"   Traceback: {traceback.format_exc()}")
@@ -1343,7 +1209,6 @@ def process_news_articles(articles, query_type, start_time=None, end_time=None):
                 if start_time and end_time:
                     if published_date_str:
                         try:
-                            from django.utils.dateparse import parse_datetime
                             published_at = parse_datetime(published_date_str)
                             if published_at:
                                 # Make timezone-aware if naive
@@ -1436,7 +1301,7 @@ def process_news_articles(articles, query_type, start_time=None, end_time=None):
         return queued_count
 
     except Exception as e:
-        logger.error(f"Error in process_news_articles: {e}", exc_info=True)
+        logger.error("Error in process_news_articles: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return 0
 
 
@@ -1453,22 +1318,16 @@ def get_scored_articles():
     Returns:
         list: List of article impacts (floats)
     """
-    impacts = []
+    global scored_article_queue
 
-    try:
-        while not scored_article_queue.empty():
-            impact = scored_article_queue.get_nowait()
-            impacts.append(impact)
+    # Swap in an empty buffer under the lock; copy the old one after releasing it
+    with scored_article_lock:
+        scored, scored_article_queue = scored_article_queue, deque(maxlen=SCORED_QUEUE_MAX)
+    impacts = list(scored)
 
-        if len(impacts) > 0:
-            total_impact = sum(impacts)
-            logger.info(f"   💰 Consuming {len(impacts)} Tiingo impacts: Total={total_impact:+.2f}")
-
-    except queue.Empty:
-        pass
-
-    except Exception as e:
-        logger.error(f"Error getting scored articles: {e}")
+    if impacts:
+        total_impact = sum(impacts)
+        logger.info(f"   💰 Consuming {len(impacts)} Tiingo impacts: Total={total_impact:+.2f}")
 
     return impacts
 
@@ -1485,7 +1344,7 @@ def get_stats():
             'query_count': _query_count,
             'last_query_time': _last_query_time.isoformat() if _last_query_time else None,
             'queue_size': article_to_score_queue.qsize(),
-            'scored_queue_size': scored_article_queue.qsize(),
+            'scored_queue_size': len(scored_article_queue),
             'save_queue_size': database_save_queue.qsize(),
             'scoring_thread_alive': _scoring_thread.is_alive() if _scoring_thread else False,
             'save_worker_alive': _save_worker_thread.is_alive() if _save_worker_thread else False
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-16 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_secondsnapshot_tickcandle100'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newsarticle',
+            name='fetched_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
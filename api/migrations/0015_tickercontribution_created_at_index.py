@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-16 20:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_newsarticle_fetched_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tickercontribution',
+            index=models.Index(fields=['-created_at'], name='api_tickerc_created_e86ecd_idx'),
+        ),
+    ]
@@ -258,7 +258,7 @@ class NewsArticle(models.Model):
     source = models.CharField(max_length=100)
     url = models.URLField(max_length=500, blank=True)
     published_at = models.DateTimeField(db_index=True)
-    fetched_at = models.DateTimeField(auto_now_add=True)
+    fetched_at = models.DateTimeField(auto_now_add=True, db_index=True)
     
     # Unique identifier to prevent duplicates
     article_hash = models.CharField(max_length=32, unique=True, db_index=True)
@@ -314,6 +314,7 @@ class TickerContribution(models.Model):
         verbose_name_plural = "Ticker Contributions"
         indexes = [
             models.Index(fields=['analysis_run', 'ticker']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):